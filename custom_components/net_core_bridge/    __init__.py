@@ -1,10 +1,212 @@
+import asyncio
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.const import Platform
+from homeassistant.core import SupportsResponse
+from homeassistant.helpers.discovery import async_load_platform
+
 from .self_test import run_bridge_self_test
 from .bridge import NetCoreBridge
-import time
+from .channels import COMPRESSION, OPTION_KEYS, SHARED
+from .interceptors.entity_platform_interceptor import LIFECYCLE_RPCS
+from .outbox import POLICIES
+from .const import (
+    ATTR_CONCURRENCY,
+    ATTR_DURATION,
+    CONF_BLOCK_TIMEOUT_MS,
+    CONF_CHANNELS,
+    CONF_HOLD_MS,
+    CONF_ENTITY_CONCURRENCY,
+    CONF_INTERVAL_MS,
+    CONF_LIFECYCLE_BARRIER,
+    CONF_LOOP_GUARD,
+    CONF_LOOP_MONITOR,
+    CONF_MAX_MB,
+    CONF_MAX_SIZE,
+    CONF_MAX_WRITES,
+    CONF_OUTBOX,
+    CONF_PATH,
+    CONF_POLICY,
+    CONF_PRIORITY_LANES,
+    CONF_REPLAY_RATE,
+    CONF_SEGMENT_MB,
+    CONF_SPOOL,
+    CONF_STATE_BATCH,
+    CONF_TARGET,
+    CONF_THRESHOLD_MS,
+    CONF_TYPED_PAYLOAD,
+    CONF_WINDOW_MS,
+    DOMAIN,
+    SERVICE_DIAGNOSTICS,
+    SERVICE_SELF_TEST,
+)
+
+SELF_TEST_SCHEMA = vol.Schema(
+    {
+        # 0 = single-shot reachability test; > 0 = load self-test
+        vol.Optional(ATTR_DURATION, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=300)
+        ),
+        vol.Optional(ATTR_CONCURRENCY, default=8): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=256)
+        ),
+    }
+)
+
+
+# configuration.yaml; keys left out fall back to the bridge defaults.
+STATE_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_WINDOW_MS): cv.positive_float,
+        vol.Optional(CONF_MAX_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+# Per service under channels: (see ChannelManager)
+CHANNEL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(SHARED): cv.boolean,
+        vol.Optional("pool_size"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("compression"): vol.In(COMPRESSION),
+        vol.Optional("grpc_options"): {cv.string: vol.Any(int, cv.string)},
+        **{vol.Optional(key): vol.Coerce(int) for key in OPTION_KEYS},
+    }
+)
+
+LOOP_MONITOR_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_INTERVAL_MS): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(CONF_THRESHOLD_MS): cv.positive_float,
+    }
+)
+
+# One lane under priority_lanes: lanes: (see PriorityLanes.from_config)
+LANE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("priority"): vol.Coerce(int),
+        vol.Optional("concurrency"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("queue"): cv.positive_int,
+        vol.Optional("deadline_ms"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional("event_types"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("domains"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+PRIORITY_LANES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("lanes"): {cv.string: LANE_SCHEMA},
+        vol.Optional("max_in_flight"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+# Per observe service under outbox: (see Outbox.configure)
+OUTBOX_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MAX_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_POLICY): vol.In(POLICIES),
+        vol.Optional(CONF_BLOCK_TIMEOUT_MS): cv.positive_float,
+    }
+)
+
+SPOOL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_PATH): cv.string,
+        vol.Optional(CONF_MAX_MB): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(CONF_SEGMENT_MB): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        # messages per second on replay; 0 = unthrottled
+        vol.Optional(CONF_REPLAY_RATE): cv.positive_float,
+    }
+)
+
+# Feedback loop detection through .NET (see BridgeOrigin)
+LOOP_GUARD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MAX_WRITES): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_WINDOW_MS): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(CONF_HOLD_MS): cv.positive_float,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Maybe(
+            vol.Schema(
+                {
+                    vol.Optional(CONF_TARGET): cv.string,
+                    vol.Optional(CONF_CHANNELS): {cv.string: CHANNEL_SCHEMA},
+                    vol.Optional(CONF_STATE_BATCH): STATE_BATCH_SCHEMA,
+                    vol.Optional(CONF_PRIORITY_LANES): PRIORITY_LANES_SCHEMA,
+                    # true spools with the defaults
+                    vol.Optional(CONF_SPOOL): vol.Any(SPOOL_SCHEMA, cv.boolean),
+                    vol.Optional(CONF_LOOP_GUARD): LOOP_GUARD_SCHEMA,
+                    vol.Optional(CONF_OUTBOX): {
+                        vol.Optional("event"): OUTBOX_SCHEMA,
+                        vol.Optional("state"): OUTBOX_SCHEMA,
+                    },
+                    vol.Optional(CONF_TYPED_PAYLOAD): cv.boolean,
+                    vol.Optional(CONF_ENTITY_CONCURRENCY): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(CONF_LIFECYCLE_BARRIER): vol.All(
+                        cv.ensure_list, [vol.In(LIFECYCLE_RPCS)]
+                    ),
+                    # false disables the monitor; true keeps the defaults
+                    vol.Optional(CONF_LOOP_MONITOR): vol.Any(
+                        LOOP_MONITOR_SCHEMA, cv.boolean
+                    ),
+                }
+            )
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 async def async_setup(hass, config):
-    bridge = NetCoreBridge(hass)
+    bridge = NetCoreBridge(hass, config.get(DOMAIN, {}))
+    hass.data[DOMAIN] = bridge
+
+    async def _diagnostics(call):
+        return bridge.diagnostics()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DIAGNOSTICS,
+        _diagnostics,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _self_test(call):
+        return await run_bridge_self_test(
+            hass,
+            bridge.channels,
+            call.data[ATTR_DURATION],
+            call.data[ATTR_CONCURRENCY],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SELF_TEST,
+        _self_test,
+        schema=SELF_TEST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Bridge metrics as sensors
+    hass.async_create_task(
+        async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
 
     # Delay a bit so channel connects
     hass.async_create_task(_run_test(hass, bridge))
@@ -13,5 +215,5 @@ async def async_setup(hass, config):
 
 
 async def _run_test(hass, bridge):
-    await hass.async_add_executor_job(lambda: time.sleep(1))
-    await run_bridge_self_test(hass, bridge.channel)
+    await asyncio.sleep(1)
+    await run_bridge_self_test(hass, bridge.channels)
@@ -0,0 +1,72 @@
+_MISSING = object()
+
+
+class AttributeDelta:
+    """What to send for one write: changed keys, removed keys and versions."""
+
+    __slots__ = ("changed", "removed", "version", "base_version", "is_delta")
+
+    def __init__(self, changed, removed, version, base_version, is_delta):
+        self.changed = changed
+        self.removed = removed
+        self.version = version
+        self.base_version = base_version
+        self.is_delta = is_delta
+
+
+class AttributeDeltaTracker:
+    """Per-entity cache of the last attribute set sent to .NET.
+
+    Each write bumps the entity's version. If .NET already holds the
+    previous version, only changed / removed keys are sent; otherwise (first
+    write, after a resync request, or when most keys changed anyway) the
+    full set goes out.
+    """
+
+    def __init__(self):
+        # entity_id -> (version, attributes)
+        self._last = {}
+
+        self.full_sent = 0
+        self.delta_sent = 0
+
+    def diff(self, entity_id, attrs) -> AttributeDelta:
+        prev = self._last.get(entity_id)
+        version = prev[0] + 1 if prev else 1
+        self._last[entity_id] = (version, dict(attrs))
+
+        if prev is None:
+            return self._full(attrs, version)
+
+        old = prev[1]
+        changed = {
+            key: value
+            for key, value in attrs.items()
+            if old.get(key, _MISSING) != value
+        }
+        removed = [key for key in old if key not in attrs]
+
+        # A delta that touches most keys is not worth the bookkeeping.
+        if len(changed) + len(removed) > len(attrs) // 2 + 1:
+            return self._full(attrs, version)
+
+        self.delta_sent += 1
+        return AttributeDelta(changed, removed, version, prev[0], True)
+
+    def full(self, entity_id) -> AttributeDelta | None:
+        """Full set at the current version, e.g. when a pending delta is replaced."""
+        last = self._last.get(entity_id)
+        if last is None:
+            return None
+        return self._full(last[1], last[0])
+
+    def invalidate(self, entity_id=None):
+        """Forget one entity (or all): its next write is sent in full."""
+        if entity_id is None:
+            self._last.clear()
+        else:
+            self._last.pop(entity_id, None)
+
+    def _full(self, attrs, version):
+        self.full_sent += 1
+        return AttributeDelta(attrs, [], version, 0, False)
@@ -0,0 +1,60 @@
+import asyncio
+
+from .clients.state_interceptor_pb2 import StateWriteBatch
+
+DEFAULT_WINDOW = 0.05
+DEFAULT_MAX_SIZE = 500
+
+
+class WriteBatcher:
+    """Coalesce observe-only StateWriteRequests into StateWriteBatch messages.
+
+    A batch is emitted when the time window since its first write elapses or
+    when it holds max_size distinct entities, whichever comes first. Within
+    a batch only the latest write per entity_id is kept; on_replace(req) may
+    rewrite a write that superseded a pending one (e.g. delta → full).
+    """
+
+    def __init__(
+        self, emit, window=DEFAULT_WINDOW, max_size=DEFAULT_MAX_SIZE, on_replace=None
+    ):
+        self._emit = emit
+        self._on_replace = on_replace
+        self.window = window
+        self.max_size = max_size
+
+        self._pending = {}
+        self._timer = None
+
+        self.received = 0
+        self.batches = 0
+
+    def add(self, req):
+        """Add one write. Never awaits."""
+        self.received += 1
+
+        # Re-insert so the batch keeps the order of each entity's last write.
+        if self._pending.pop(req.entity_id, None) is not None:
+            if self._on_replace is not None:
+                req = self._on_replace(req)
+        self._pending[req.entity_id] = req
+
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.window, self.flush
+            )
+
+    def flush(self):
+        """Emit whatever is pending as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        self.batches += 1
+        self._emit(StateWriteBatch(writes=pending.values()))
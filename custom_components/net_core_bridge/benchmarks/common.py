@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import os
+import tempfile
+
+
+class BenchHass:
+    """Just enough of HomeAssistant for the bridge helpers to run standalone."""
+
+    def __init__(self):
+        self.logger = logging.getLogger("net_core_bridge.bench")
+        self.data = {}
+
+    def async_create_task(self, coro, *args, **kwargs):
+        return asyncio.get_running_loop().create_task(coro)
+
+    def async_create_background_task(self, coro, *args, **kwargs):
+        return asyncio.get_running_loop().create_task(coro)
+
+
+def uds_target():
+    """Fresh unix socket target in a temp dir, like the production transport."""
+    path = os.path.join(tempfile.mkdtemp(prefix="ncb-bench-"), "core.sock")
+    return f"unix:{path}"
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def summarize(latencies, elapsed):
+    """Latencies in seconds → dict with events/sec and ms percentiles."""
+    lat = sorted(latencies)
+    return {
+        "count": len(lat),
+        "per_sec": len(lat) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(lat, 50) * 1000,
+        "p99_ms": percentile(lat, 99) * 1000,
+        "max_ms": (lat[-1] if lat else 0.0) * 1000,
+    }
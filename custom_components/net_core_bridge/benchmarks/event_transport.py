@@ -0,0 +1,83 @@
+"""Compare unary InterceptEvent with the multiplexed InterceptEventStream.
+
+Run from the custom_components directory:
+
+    python -m net_core_bridge.benchmarks.event_transport --events 20000
+"""
+import argparse
+import asyncio
+import json
+import time
+import grpc
+
+from ..clients.event_interceptor_pb2 import EventMessage
+from ..clients.event_interceptor_pb2_grpc import EventInterceptorStub
+from ..event_stream import EventStream
+from .common import BenchHass, summarize, uds_target
+from .mock_server import MockEventInterceptor, start_mock_server
+
+
+def _event(i):
+    return EventMessage(
+        event_type="state_changed",
+        entity_id=f"sensor.bench_{i % 200}",
+        json_data='{"entity_id": "sensor.bench", "new_state": {"state": "1"}}',
+        context_id="",
+    )
+
+
+async def _drive(send, events, concurrency):
+    latencies = []
+    counter = iter(range(events))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            await send(_event(i))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start)
+
+
+async def run(events, concurrency, latency):
+    target = uds_target()
+    server = await start_mock_server(target, event=MockEventInterceptor(latency))
+    channel = grpc.aio.insecure_channel(target)
+    await channel.channel_ready()
+
+    stub = EventInterceptorStub(channel)
+    stream = EventStream(BenchHass(), stub)
+
+    # Warm up both paths so connection setup is not measured.
+    await _drive(stub.InterceptEvent, 200, concurrency)
+    await _drive(stream.intercept, 200, concurrency)
+
+    results = {
+        "events": events,
+        "concurrency": concurrency,
+        "server_latency_ms": latency * 1000,
+        "unary": await _drive(stub.InterceptEvent, events, concurrency),
+        "stream": await _drive(stream.intercept, events, concurrency),
+    }
+
+    await stream.close()
+    await channel.close()
+    await server.stop(None)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.events, args.concurrency, args.latency_ms / 1000))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import asyncio
+import random
+import grpc
+
+from ..clients.event_interceptor_pb2 import EventResponse, EventFrameResponse
+from ..clients.event_interceptor_pb2_grpc import (
+    EventInterceptorServicer,
+    add_EventInterceptorServicer_to_server,
+)
+from ..clients.state_interceptor_pb2 import (
+    StateWriteBatchResponse,
+    StateWriteResponse,
+)
+from ..clients.state_interceptor_pb2_grpc import (
+    StateInterceptorServicer,
+    add_StateInterceptorServicer_to_server,
+)
+from ..clients.entity_platform_pb2 import (
+    EntitiesAddedResponse,
+    EntityAddedResponse,
+    PlatformSetupResponse,
+)
+from ..clients.entity_platform_pb2_grpc import (
+    EntityPlatformInterceptorServicer,
+    add_EntityPlatformInterceptorServicer_to_server,
+)
+
+
+class MockEventInterceptor(EventInterceptorServicer):
+    """Python stand-in for the .NET EventInterceptor service."""
+
+    def __init__(self, latency=0.0, veto_rate=0.0):
+        self.latency = latency
+        self.veto_rate = veto_rate
+        self.received = 0
+
+    async def _decide(self, request):
+        self.received += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return EventResponse(handled=random.random() < self.veto_rate)
+
+    async def InterceptEvent(self, request, context):
+        return await self._decide(request)
+
+    async def InterceptEventStream(self, request_iterator, context):
+        # Answer frames concurrently, in completion order, like a real peer.
+        responses = asyncio.Queue()
+
+        async def answer(frame):
+            resp = await self._decide(frame.event)
+            await responses.put(EventFrameResponse(seq=frame.seq, response=resp))
+
+        async def pump():
+            tasks = set()
+            async for frame in request_iterator:
+                task = asyncio.create_task(answer(frame))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+            await responses.put(None)
+
+        pumper = asyncio.create_task(pump())
+        try:
+            while (resp := await responses.get()) is not None:
+                yield resp
+        finally:
+            pumper.cancel()
+
+
+class MockStateInterceptor(StateInterceptorServicer):
+    """Python stand-in for the .NET StateInterceptor service."""
+
+    def __init__(self, latency=0.0, veto_rate=0.0):
+        self.latency = latency
+        self.veto_rate = veto_rate
+        self.received = 0
+
+    async def InterceptStateWrite(self, request, context):
+        self.received += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return StateWriteResponse(handled=random.random() < self.veto_rate)
+
+    async def InterceptStateWriteBatch(self, request, context):
+        self.received += len(request.writes)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return StateWriteBatchResponse(ok=True)
+
+
+class MockEntityPlatformInterceptor(EntityPlatformInterceptorServicer):
+    """Python stand-in for the .NET EntityPlatformInterceptor service."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = {}
+
+    async def _ack(self, method, response):
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return response
+
+    async def PlatformSetup(self, request, context):
+        return await self._ack("PlatformSetup", PlatformSetupResponse(ok=True))
+
+    async def EntitiesAdded(self, request, context):
+        return await self._ack("EntitiesAdded", EntitiesAddedResponse(ok=True))
+
+    async def EntityAdded(self, request, context):
+        return await self._ack("EntityAdded", EntityAddedResponse(ok=True))
+
+
+async def start_mock_server(target, event=None, state=None, entity_platform=None):
+    """Start an in-process grpc.aio server on target with the given servicers."""
+    server = grpc.aio.server()
+
+    if event is not None:
+        add_EventInterceptorServicer_to_server(event, server)
+    if state is not None:
+        add_StateInterceptorServicer_to_server(state, server)
+    if entity_platform is not None:
+        add_EntityPlatformInterceptorServicer_to_server(entity_platform, server)
+
+    server.add_insecure_port(target)
+    await server.start()
+    return server
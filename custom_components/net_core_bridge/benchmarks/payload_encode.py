@@ -0,0 +1,111 @@
+"""Encode cost per message: attributes_json vs. the typed ValueMap payload.
+
+Run from the custom_components directory:
+
+    python -m net_core_bridge.benchmarks.payload_encode --iterations 20000
+"""
+import argparse
+import datetime as dt
+import json
+import time
+from enum import StrEnum
+
+from ..clients.state_interceptor_pb2 import StateWriteRequest
+from ..payload import encode_map
+
+
+class HVACMode(StrEnum):
+    HEAT = "heat"
+    COOL = "cool"
+    OFF = "off"
+
+
+def _json_safe(attrs):
+    """The JSON path cannot carry datetimes / sets; stringify like HA's encoder."""
+    return json.loads(json.dumps(attrs, default=str))
+
+
+SAMPLES = {
+    "sensor": {
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "friendly_name": "Living room temperature",
+    },
+    "climate": {
+        "hvac_modes": [HVACMode.HEAT, HVACMode.COOL, HVACMode.OFF],
+        "min_temp": 7,
+        "max_temp": 35,
+        "target_temp_step": 0.5,
+        "current_temperature": 21.3,
+        "temperature": 21.0,
+        "hvac_action": "idle",
+        "preset_modes": ["eco", "comfort", "away"],
+        "preset_mode": "comfort",
+        "friendly_name": "Thermostat",
+        "supported_features": 401,
+    },
+    "media_player": {
+        "volume_level": 0.42,
+        "is_volume_muted": False,
+        "media_content_id": "spotify:track:4uLU6hMCjMI75M1A2tKUQC",
+        "media_content_type": "music",
+        "media_duration": 212,
+        "media_position": 87,
+        "media_position_updated_at": dt.datetime.now(dt.timezone.utc),
+        "media_title": "Never Gonna Give You Up",
+        "media_artist": "Rick Astley",
+        "media_album_name": "Whenever You Need Somebody",
+        "source_list": ["Spotify", "TV", "Bluetooth", "Line in", "Radio"],
+        "group_members": {"media_player.kitchen", "media_player.living_room"},
+        "entity_picture": "/api/media_player_proxy/media_player.living_room",
+        "friendly_name": "Living room speaker",
+        "supported_features": 152511,
+    },
+}
+
+
+def _bench(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        data = fn()
+    elapsed = time.perf_counter() - start
+    return {"us_per_msg": elapsed / iterations * 1e6, "bytes": len(data)}
+
+
+def run(iterations):
+    results = {}
+
+    for name, attrs in SAMPLES.items():
+        safe = _json_safe(attrs)
+
+        def json_path():
+            return StateWriteRequest(
+                entity_id=f"{name}.bench",
+                state="on",
+                attributes_json=json.dumps(safe),
+            ).SerializeToString()
+
+        def typed_path():
+            req = StateWriteRequest(entity_id=f"{name}.bench", state="on")
+            encode_map(attrs, req.attributes)
+            return req.SerializeToString()
+
+        results[name] = {
+            "json": _bench(json_path, iterations),
+            "typed": _bench(typed_path, iterations),
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Time async_add_entities for a large platform through the EntityPlatform patch.
+
+Compares the old serial EntityAdded loop, pipelined EntityAdded and the
+negotiated batch-only mode. ha_blocked_s is how long HA's own call waits;
+delivered_s is until .NET has acknowledged everything. Run from the custom_components directory:
+
+    python -m net_core_bridge.benchmarks.platform_setup --entities 1000
+"""
+import argparse
+import asyncio
+import json
+import time
+import grpc
+
+from ..clients.entity_platform_pb2_grpc import EntityPlatformInterceptorStub
+from ..interceptors.entity_platform_interceptor import (
+    DEFAULT_ENTITY_CONCURRENCY,
+    EntityPlatformInterceptor,
+)
+from .common import BenchHass, uds_target
+from .mock_server import MockEntityPlatformInterceptor, start_mock_server
+
+
+class _Platform:
+    """Hashable and weak-referenceable, like EntityPlatform."""
+
+    domain = "sensor"
+    platform_name = "bench"
+    config_entry = None
+
+    def __init__(self):
+        self.entities = {}
+
+
+class _Entity:
+    should_poll = False
+
+    def __init__(self, platform, i):
+        self.entity_id = f"sensor.bench_{i}"
+        self.name = f"Bench {i}"
+        self.platform = platform
+        self.unique_id = f"bench-{i}"
+
+
+def make_platform(entities):
+    platform = _Platform()
+    return platform, [_Entity(platform, i) for i in range(entities)]
+
+
+async def _orig_add(platform, entities, update_before_add=False):
+    """HA's own add path is not what is being measured."""
+
+
+async def _time_add(interceptor, entities, mock):
+    platform, items = make_platform(entities)
+    mock.calls.clear()
+
+    start = time.perf_counter()
+    await interceptor._patched_add_entities(platform, items)
+    unblocked = time.perf_counter() - start
+
+    await interceptor.barrier(platform)
+    delivered = time.perf_counter() - start
+
+    return {
+        "ha_blocked_s": unblocked,
+        "delivered_s": delivered,
+        "rpcs": dict(mock.calls),
+    }
+
+
+async def run(entities, concurrency, latency):
+    target = uds_target()
+    mock = MockEntityPlatformInterceptor(latency)
+    server = await start_mock_server(target, entity_platform=mock)
+    channel = grpc.aio.insecure_channel(target)
+    await channel.channel_ready()
+
+    interceptor = EntityPlatformInterceptor(
+        BenchHass(), EntityPlatformInterceptorStub(channel)
+    )
+    interceptor._orig_add = _orig_add
+
+    # Warm up so connection setup is not measured.
+    await _time_add(interceptor, 50, mock)
+
+    results = {"entities": entities, "server_latency_ms": latency * 1000}
+
+    interceptor.entity_concurrency = 1
+    results["serial"] = await _time_add(interceptor, entities, mock)
+
+    interceptor.entity_concurrency = concurrency
+    results[f"pipelined_{concurrency}"] = await _time_add(
+        interceptor, entities, mock
+    )
+
+    interceptor.batch_only = True
+    results["batch_only"] = await _time_add(interceptor, entities, mock)
+
+    await channel.close()
+    await server.stop(None)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_ENTITY_CONCURRENCY
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run(args.entities, args.concurrency, args.latency_ms / 1000)
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
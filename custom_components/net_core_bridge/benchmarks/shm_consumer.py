@@ -0,0 +1,91 @@
+"""Python stand-in for the .NET reader of the shared-memory ring."""
+import os
+import socket
+import struct
+import tempfile
+
+from ..shm_ring import (
+    DATA_OFFSET,
+    HEAD_OFFSET,
+    KIND_WRAP,
+    RECORD_HEADER,
+    TAIL_OFFSET,
+    WAITING_OFFSET,
+    create_ring,
+)
+from ..clients.event_interceptor_pb2 import EventMessage
+
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+class ShmRingReader:
+    """Create a ring + doorbell, then drain records as the bridge writes them."""
+
+    def __init__(self, capacity, directory="/dev/shm"):
+        if not os.path.isdir(directory):
+            directory = tempfile.gettempdir()
+        name = f"ncb-bench-{os.getpid()}"
+        self.path = os.path.join(directory, name)
+        self.doorbell_path = os.path.join(tempfile.mkdtemp(prefix="ncb-"), "bell")
+
+        self._mm = create_ring(self.path, capacity)
+        self.capacity = _U64.unpack_from(self._mm, 8)[0]
+        self._tail = 0
+
+        self._bell = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._bell.bind(self.doorbell_path)
+        self._bell.settimeout(1.0)
+
+    def close(self):
+        self._bell.close()
+        self._mm.close()
+        os.unlink(self.path)
+        os.unlink(self.doorbell_path)
+
+    def drain(self):
+        """Yield (kind, payload) for every published record."""
+        mm = self._mm
+        head = _U64.unpack_from(mm, HEAD_OFFSET)[0]
+        tail = self._tail
+        while tail < head:
+            offset = tail % self.capacity
+            start = DATA_OFFSET + offset
+            length, kind, _ = RECORD_HEADER.unpack_from(mm, start)
+            if kind == KIND_WRAP:
+                tail += self.capacity - offset
+                continue
+            body = start + RECORD_HEADER.size
+            yield kind, mm[body : body + length]
+            tail += (RECORD_HEADER.size + length + 7) & ~7
+        self._tail = tail
+        _U64.pack_into(mm, TAIL_OFFSET, tail)
+
+    def wait(self):
+        """Sleep on the doorbell unless records arrived meanwhile."""
+        _U32.pack_into(self._mm, WAITING_OFFSET, 1)
+        if _U64.unpack_from(self._mm, HEAD_OFFSET)[0] != self._tail:
+            _U32.pack_into(self._mm, WAITING_OFFSET, 0)
+            return
+        try:
+            self._bell.recv(64)
+        except socket.timeout:
+            _U32.pack_into(self._mm, WAITING_OFFSET, 0)
+
+
+def consume(capacity, expected, conn):
+    """Process entry point: report the ring paths, then parse expected records."""
+    reader = ShmRingReader(capacity)
+    conn.send((reader.path, reader.doorbell_path))
+
+    received = 0
+    evt = EventMessage()
+    while received < expected:
+        for _kind, payload in reader.drain():
+            evt.ParseFromString(payload)
+            received += 1
+        if received < expected:
+            reader.wait()
+
+    conn.send(received)
+    reader.close()
@@ -0,0 +1,131 @@
+"""Observe-only throughput: shared-memory ring vs gRPC over UDS.
+
+Both peers run in a separate process, as .NET would. The gRPC path is the
+production observe path (Outbox → EventStream); the ring path is the
+ShmObserveSink the bridge switches to when .NET offers a ring. Run from
+the custom_components directory:
+
+    python -m net_core_bridge.benchmarks.shm_transport --events 100000
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+import grpc
+
+from ..clients.event_interceptor_pb2 import EventMessage
+from ..clients.event_interceptor_pb2_grpc import EventInterceptorStub
+from ..event_stream import EventStream
+from ..outbox import Outbox
+from ..shm_ring import ShmObserveSink, ShmRingWriter
+from .common import BenchHass, uds_target
+from .mock_server import MockEventInterceptor, start_mock_server
+from .shm_consumer import consume
+
+
+def _event(i):
+    return EventMessage(
+        event_type="state_changed",
+        entity_id=f"sensor.bench_{i % 200}",
+        json_data='{"entity_id": "sensor.bench", "new_state": {"state": "1"}}',
+        context_id="",
+    )
+
+
+def _serve(target, ready):
+    async def main():
+        server = await start_mock_server(target, event=MockEventInterceptor())
+        ready.set()
+        await server.wait_for_termination()
+
+    asyncio.run(main())
+
+
+async def run_grpc(ctx, events):
+    target = uds_target()
+    ready = ctx.Event()
+    peer = ctx.Process(target=_serve, args=(target, ready), daemon=True)
+    peer.start()
+    ready.wait()
+
+    channel = grpc.aio.insecure_channel(target)
+    await channel.channel_ready()
+    stream = EventStream(BenchHass(), EventInterceptorStub(channel))
+    outbox = Outbox(BenchHass(), "bench", stream.intercept, maxsize=events)
+    outbox.start()
+
+    messages = [_event(i) for i in range(events)]
+    start = time.perf_counter()
+    for evt in messages:
+        outbox.put(evt)
+    put_done = time.perf_counter()
+
+    while outbox.sent + outbox.errors < events:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    await outbox.stop()
+    await stream.close()
+    await channel.close()
+    peer.terminate()
+    return {
+        "per_sec": events / elapsed,
+        "put_us": (put_done - start) / events * 1e6,
+        "errors": outbox.errors,
+    }
+
+
+async def run_shm(ctx, events, capacity):
+    parent, child = ctx.Pipe()
+    peer = ctx.Process(target=consume, args=(capacity, events, child), daemon=True)
+    peer.start()
+    path, doorbell_path = parent.recv()
+
+    ring = ShmRingWriter(path, doorbell_path)
+    sink = ShmObserveSink(ring, fallback=None)
+
+    messages = [_event(i) for i in range(events)]
+    start = time.perf_counter()
+    for evt in messages:
+        while not sink.put(evt):
+            # Ring full: production would drop; here wait for the reader.
+            await asyncio.sleep(0)
+    put_done = time.perf_counter()
+
+    received = await asyncio.get_running_loop().run_in_executor(None, parent.recv)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "per_sec": events / elapsed,
+        "put_us": (put_done - start) / events * 1e6,
+        "received": received,
+        "ring_full": ring.full,
+        "doorbells": ring.doorbells,
+    }
+    ring.close()
+    peer.join()
+    return result
+
+
+async def run(events, capacity):
+    ctx = multiprocessing.get_context("spawn")
+    return {
+        "events": events,
+        "ring_capacity": capacity,
+        "grpc_uds": await run_grpc(ctx, events),
+        "shm_ring": await run_shm(ctx, events, capacity),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--capacity", type=int, default=4 * 1024 * 1024)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.events, args.capacity)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Load the real interceptor paths against a local mock .NET server.
+
+Drives EventBusInterceptor, the patched StateMachine.async_set and the
+patched EntityPlatform.async_add_entities at a configurable rate and
+concurrency, against in-process mock servicers with configurable latency
+and veto rates. HA's own originals are replaced by no-ops so only the
+bridge is measured. CPU per message includes the in-process mock server.
+Run from the custom_components directory:
+
+    python -m net_core_bridge.benchmarks.suite --duration 10 --output run.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import grpc
+
+from homeassistant.core import StateMachine
+
+from ..channels import ChannelManager
+from ..clients.entity_platform_pb2_grpc import EntityPlatformInterceptorStub
+from ..clients.event_interceptor_pb2_grpc import EventInterceptorStub
+from ..clients.state_interceptor_pb2_grpc import StateInterceptorStub
+from ..interceptors.entity_platform_interceptor import EntityPlatformInterceptor
+from ..interceptors.event_interceptor import EventBusInterceptor
+from ..interceptors.state_interceptor import StateMachineInterceptor
+from ..metrics import Metrics
+from ..rpc_guard import RpcGuard
+from .common import BenchHass, summarize, uds_target
+from .mock_server import (
+    MockEntityPlatformInterceptor,
+    MockEventInterceptor,
+    MockStateInterceptor,
+    start_mock_server,
+)
+from .platform_setup import make_platform
+
+SCENARIOS = ("event", "state", "platform")
+
+
+class _NullBus:
+    async def async_fire(self, *args, **kwargs):
+        return None
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+# ---------------------------------------------------------
+# LOAD GENERATOR
+# ---------------------------------------------------------
+async def _drive(op, duration, rate, concurrency):
+    """Call op(i) from concurrency workers for duration seconds.
+
+    rate > 0 paces the total to rate calls/sec; 0 runs flat out.
+    """
+    latencies = []
+    errors = 0
+    counter = iter(range(sys.maxsize))
+    interval = concurrency / rate if rate else 0.0
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    deadline = start + duration
+
+    async def worker(offset):
+        nonlocal errors
+        next_at = start + offset * (interval / concurrency)
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                return
+            if interval:
+                if next_at > now:
+                    await asyncio.sleep(next_at - now)
+                next_at += interval
+            i = next(counter)
+            t0 = time.perf_counter()
+            try:
+                await op(i)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - t0)
+
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+
+    result = summarize(latencies, elapsed)
+    result["errors"] = errors
+    result["cpu_us_per_msg"] = cpu / len(latencies) * 1e6 if latencies else 0.0
+    return result
+
+
+# ---------------------------------------------------------
+# SCENARIOS
+# ---------------------------------------------------------
+def _event_op(hass, channels, guard, metrics, cleanup):
+    interceptor = EventBusInterceptor(
+        hass, channels.stub("event", EventInterceptorStub), guard, metrics
+    )
+    interceptor.outbox.start()
+    cleanup.append(interceptor.outbox.stop)
+    cleanup.append(interceptor.stream.close)
+    bus = _NullBus()
+
+    async def op(i):
+        await interceptor._handle_event(
+            bus,
+            "state_changed",
+            {"entity_id": f"sensor.bench_{i % 500}", "new_state": {"state": str(i)}},
+            None,
+            None,
+        )
+
+    return op
+
+
+def _state_op(hass, channels, guard, metrics, cleanup):
+    interceptor = StateMachineInterceptor(
+        hass, channels.stub("state", StateInterceptorStub), guard, metrics
+    )
+    interceptor.apply()
+    cleanup.append(interceptor.outbox.stop)
+    interceptor._orig_async_set = _noop
+
+    async def op(i):
+        await StateMachine.async_set(
+            None,
+            f"sensor.bench_{i % 500}",
+            str(i),
+            {"unit_of_measurement": "W", "friendly_name": "Bench"},
+        )
+
+    return op
+
+
+def _platform_op(hass, channels, guard, metrics, cleanup, entities):
+    interceptor = EntityPlatformInterceptor(
+        hass,
+        channels.stub("entity_platform", EntityPlatformInterceptorStub),
+        guard,
+    )
+    interceptor._orig_add = _noop
+
+    async def op(i):
+        # One platform of entities per op; wait until .NET has it all.
+        platform, items = make_platform(entities)
+        await interceptor._patched_add_entities(platform, items)
+        await interceptor.barrier(platform)
+
+    return op
+
+
+async def run(args):
+    target = uds_target()
+    mocks = {
+        "event": MockEventInterceptor(args.latency_ms / 1000, args.veto_rate),
+        "state": MockStateInterceptor(args.latency_ms / 1000, args.veto_rate),
+        "entity_platform": MockEntityPlatformInterceptor(args.latency_ms / 1000),
+    }
+    server = await start_mock_server(
+        target,
+        event=mocks["event"],
+        state=mocks["state"],
+        entity_platform=mocks["entity_platform"],
+    )
+
+    hass = BenchHass()
+    channels = ChannelManager(hass, target)
+    metrics = Metrics()
+    guard = RpcGuard(hass, metrics=metrics)
+
+    cleanup = []
+    ops = {
+        "event": lambda: _event_op(hass, channels, guard, metrics, cleanup),
+        "state": lambda: _state_op(hass, channels, guard, metrics, cleanup),
+        "platform": lambda: _platform_op(
+            hass, channels, guard, metrics, cleanup, args.platform_entities
+        ),
+    }
+
+    results = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "grpc": grpc.__version__,
+        "config": vars(args),
+        "scenarios": {},
+    }
+
+    for name in args.scenarios:
+        op = ops[name]()
+        # Warm up channels and deadlines so setup is not measured.
+        await _drive(op, min(1.0, args.duration), 0, args.concurrency)
+        results["scenarios"][name] = await _drive(
+            op, args.duration, args.rate, args.concurrency
+        )
+
+    results["bridge_metrics"] = metrics.snapshot()
+    results["rpc_guard"] = guard.diagnostics()
+
+    for stop in cleanup:
+        await stop()
+    await channels.close()
+    await server.stop(None)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=0.0, help="calls/sec, 0 = max")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--veto-rate", type=float, default=0.0)
+    parser.add_argument("--platform-entities", type=int, default=100)
+    parser.add_argument(
+        "--scenarios",
+        type=lambda s: [x for x in s.split(",") if x],
+        default=list(SCENARIOS),
+    )
+    parser.add_argument("--output", help="also write the JSON report here")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,53 +1,451 @@
-import sys
-import grpc
+import asyncio
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 # Correct gRPC client imports based on your proto filenames
 from .clients.event_interceptor_pb2_grpc import EventInterceptorStub
 from .clients.state_interceptor_pb2_grpc import StateInterceptorStub
 from .clients.entity_platform_pb2_grpc import EntityPlatformInterceptorStub
+from .clients.bridge_control_pb2_grpc import BridgeControlStub
+from .clients.bridge_commands_pb2_grpc import BridgeCommandsStub
+from .clients.snapshot_pb2_grpc import BridgeSnapshotStub
 
 # Interceptors
 from .interceptors.event_interceptor import EventBusInterceptor
-from .interceptors.entity_platform_interceptor import EntityPlatformInterceptor
+from .interceptors.entity_platform_interceptor import (
+    DEFAULT_ENTITY_CONCURRENCY,
+    EntityPlatformInterceptor,
+)
 from .interceptors.state_interceptor import StateMachineInterceptor
 
+# Control plane (.NET → bridge)
+from .control import BRIDGE_CAPABILITIES, BridgeControl
+
+from .batcher import DEFAULT_MAX_SIZE, DEFAULT_WINDOW
+from .channels import ChannelManager
+from .commands import CommandChannel
+from .lanes import PriorityLanes
+from .loop_monitor import DEFAULT_INTERVAL, DEFAULT_THRESHOLD, LoopLagMonitor
+from .metrics import Metrics
+from .origin import (
+    DEFAULT_LOOP_HOLD,
+    DEFAULT_LOOP_MAX_WRITES,
+    DEFAULT_LOOP_WINDOW,
+    BridgeOrigin,
+)
+from .rpc_guard import RpcGuard
+from .rules import RuleEngine
+from .shm_ring import (
+    CHECK_INTERVAL,
+    KIND_EVENT,
+    KIND_STATE_WRITE,
+    KIND_STATE_WRITE_BATCH,
+    ShmObserveSink,
+    ShmRingWriter,
+)
+from .snapshot import SnapshotStreamer
+from .spool import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_REPLAY_RATE,
+    DEFAULT_SEGMENT_SIZE,
+    ObserveSpool,
+)
+from .const import (
+    CAP_ATTRIBUTE_DELTA,
+    CAP_ENTITY_BATCH,
+    CAP_SHM_RING,
+    CAP_TYPED_PAYLOAD,
+    CONF_CHANNELS,
+    CONF_ENTITY_CONCURRENCY,
+    CONF_HOLD_MS,
+    CONF_INTERVAL_MS,
+    CONF_LIFECYCLE_BARRIER,
+    CONF_LOOP_GUARD,
+    CONF_LOOP_MONITOR,
+    CONF_BLOCK_TIMEOUT_MS,
+    CONF_MAX_MB,
+    CONF_MAX_SIZE,
+    CONF_MAX_WRITES,
+    CONF_OUTBOX,
+    CONF_PATH,
+    CONF_POLICY,
+    CONF_PRIORITY_LANES,
+    CONF_REPLAY_RATE,
+    CONF_SEGMENT_MB,
+    CONF_SPOOL,
+    CONF_STATE_BATCH,
+    CONF_TARGET,
+    CONF_THRESHOLD_MS,
+    CONF_TYPED_PAYLOAD,
+    CONF_WINDOW_MS,
+)
+
 
 class NetCoreBridge:
     """Main orchestrator for all .NET↔HA communication."""
 
-    def __init__(self, hass: HomeAssistant):
+    def __init__(self, hass: HomeAssistant, config: dict | None = None):
         self.hass = hass
+        self.config = config or {}
 
         # gRPC clients
-        self.channel = None
+        self.channels = None
         self.event_client = None
         self.state_client = None
         self.entity_platform_client = None
+        self.control_client = None
+        self.commands_client = None
+        self.snapshot_client = None
 
         self._init_grpc()
 
+        # Negotiated with .NET over BridgeControl
+        self.capabilities = frozenset()
+        self.shm_ring = None
+        self._shm_watch = None
+        self.rules = None
+
+        # Latency histograms and counters shared by every interceptor
+        self.metrics = Metrics()
+
+        # Deadlines + circuit breaker shared by every interceptor RPC
+        self.guard = RpcGuard(hass, metrics=self.metrics)
+
         # Apply interceptors
-        EventBusInterceptor(hass, self.event_client).apply()
-        EntityPlatformInterceptor(hass, self.entity_platform_client).apply()
-        StateMachineInterceptor(hass, self.state_client).apply()
+        self.event_interceptor = EventBusInterceptor(
+            hass, self.event_client, self.guard, self.metrics
+        )
+        self.event_interceptor.apply()
+        self.entity_platform_interceptor = EntityPlatformInterceptor(
+            hass,
+            self.entity_platform_client,
+            self.guard,
+            self.config.get(CONF_ENTITY_CONCURRENCY, DEFAULT_ENTITY_CONCURRENCY),
+            self.config.get(CONF_LIFECYCLE_BARRIER, ()),
+        )
+        self.entity_platform_interceptor.apply()
+        self.state_interceptor = StateMachineInterceptor(
+            hass, self.state_client, self.guard, self.metrics
+        )
+        self.state_interceptor.apply()
+
+        self._configure_outboxes(self.config.get(CONF_OUTBOX, {}))
+
+        batch = self.config.get(CONF_STATE_BATCH)
+        if batch is not None:
+            self.state_interceptor.enable_batching(
+                batch.get(CONF_WINDOW_MS, DEFAULT_WINDOW * 1000) / 1000,
+                batch.get(CONF_MAX_SIZE, DEFAULT_MAX_SIZE),
+            )
+
+        # Priority lanes shared by event and state interception, so a
+        # light's call_service is not queued behind a sensor storm.
+        self.lanes = None
+        lanes = self.config.get(CONF_PRIORITY_LANES)
+        if lanes is not None:
+            self.lanes = PriorityLanes.from_config(lanes, self.metrics)
+            self.event_interceptor.lanes = self.lanes
+            self.state_interceptor.lanes = self.lanes
+            hass.logger.info(
+                "net_core_bridge: priority lanes: %s",
+                ", ".join(lane.name for lane in self.lanes.by_priority),
+            )
+
+        # Writes and events the bridge caused are not held for .NET again.
+        loop_guard = self.config.get(CONF_LOOP_GUARD, {})
+        self.origin = BridgeOrigin(
+            hass,
+            self.metrics,
+            loop_guard.get(CONF_MAX_WRITES, DEFAULT_LOOP_MAX_WRITES),
+            loop_guard.get(CONF_WINDOW_MS, DEFAULT_LOOP_WINDOW * 1000) / 1000,
+            loop_guard.get(CONF_HOLD_MS, DEFAULT_LOOP_HOLD * 1000) / 1000,
+        )
+        self.event_interceptor.origin = self.origin
+        self.state_interceptor.origin = self.origin
+
+        # Durable spool for observe traffic while .NET is unavailable
+        self.spool = None
+        spool = self.config.get(CONF_SPOOL)
+        if spool:
+            # Opening the segment files is blocking I/O: done in the executor.
+            hass.async_create_task(
+                self._init_spool(spool if isinstance(spool, dict) else {})
+            )
 
         hass.logger.info("net_core_bridge: All interceptors initialized.")
 
+        # Event loop stall detector, attributing stalls to bridge calls
+        self.loop_monitor = None
+        monitor = self.config.get(CONF_LOOP_MONITOR, True)
+        if monitor is not False:
+            monitor = monitor if isinstance(monitor, dict) else {}
+            self.loop_monitor = LoopLagMonitor(
+                hass,
+                self.guard,
+                self.metrics,
+                monitor.get(CONF_INTERVAL_MS, DEFAULT_INTERVAL * 1000) / 1000,
+                monitor.get(CONF_THRESHOLD_MS, DEFAULT_THRESHOLD * 1000) / 1000,
+            )
+            self.loop_monitor.start()
+
+        # Runtime configuration pushed from .NET
+        capabilities = BRIDGE_CAPABILITIES
+        if self.config.get(CONF_TYPED_PAYLOAD, False):
+            capabilities += (CAP_TYPED_PAYLOAD,)
+        self.control = BridgeControl(hass, self.control_client, capabilities)
+        self.control.on(
+            "event_subscriptions", self.event_interceptor.set_subscriptions
+        )
+        self.control.on(
+            "state_subscriptions", self.state_interceptor.set_subscriptions
+        )
+        self.control.on("capabilities", self._set_capabilities)
+        self.control.on("attribute_resync", self.state_interceptor.resync_attributes)
+        self.control.on(
+            "invalidate_decisions", self.event_interceptor.invalidate_decisions
+        )
+        self.control.on(
+            "invalidate_decisions", self.state_interceptor.invalidate_decisions
+        )
+        self.control.on("shm_ring", self._set_shm_ring)
+        self.control.on("rules", self._set_rules)
+        self.control.start()
+
+        # Reverse channel: state writes and events pushed by .NET
+        self.commands = CommandChannel(
+            hass,
+            self.commands_client,
+            self.event_interceptor,
+            self.state_interceptor,
+            self.metrics,
+            self.origin,
+        )
+        self.commands.start()
+
+        # Full state snapshot whenever the control channel (re)connects
+        self.snapshot = SnapshotStreamer(
+            hass,
+            self.snapshot_client,
+            self.channels,
+            self.state_interceptor,
+            self.entity_platform_interceptor,
+            self.metrics,
+        )
+        self.snapshot.start()
+
+        # On HA's own bus: the proxy installed by the event interceptor
+        # keeps its own (unused) listener table.
+        self.event_interceptor.original_bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop
+        )
+
+    async def _async_stop(self, _event):
+        """Stop the long-lived tasks and flush the spool before HA exits."""
+        for part in (self.commands, self.snapshot, self.control, self.loop_monitor):
+            if part is not None:
+                await part.stop()
+        self._detach_shm_ring()
+        if self.spool is not None:
+            await self.spool.stop()
+
     # ---------------------------------------------------------
-    # Transport: UDS (macOS/Linux) or TCP (Windows)
+    # Diagnostics
     # ---------------------------------------------------------
-    def _init_grpc(self):
-        if sys.platform.startswith("win"):
-            target = "localhost:50051"
-        else:
-            target = "unix:/tmp/homeassistant_core.sock"
+    def diagnostics(self) -> dict:
+        return {
+            "metrics": self.metrics.snapshot(),
+            "loop_monitor": (
+                None if self.loop_monitor is None else self.loop_monitor.diagnostics()
+            ),
+            "channels": self.channels.diagnostics(),
+            "rpc_guard": self.guard.diagnostics(),
+            "commands": self.commands.diagnostics(),
+            "origin": self.origin.diagnostics(),
+            "snapshot": self.snapshot.diagnostics(),
+            "spool": None if self.spool is None else self.spool.diagnostics(),
+            "priority_lanes": (
+                None if self.lanes is None else self.lanes.diagnostics()
+            ),
+            "event_interceptor": self.event_interceptor.diagnostics(),
+            "state_interceptor": self.state_interceptor.diagnostics(),
+            "rules": None if self.rules is None else dict(self.rules.hits),
+            "shm_ring": (
+                None if self.shm_ring is None else self.shm_ring.diagnostics()
+            ),
+            "entity_platform_interceptor": (
+                self.entity_platform_interceptor.diagnostics()
+            ),
+        }
+
+    # ---------------------------------------------------------
+    # Observe queues: bounds and overflow policy per service
+    # ---------------------------------------------------------
+    def _configure_outboxes(self, config):
+        for service, interceptor in (
+            ("event", self.event_interceptor),
+            ("state", self.state_interceptor),
+        ):
+            conf = config.get(service)
+            if not conf:
+                continue
+
+            timeout = conf.get(CONF_BLOCK_TIMEOUT_MS)
+            try:
+                interceptor.outbox.configure(
+                    conf.get(CONF_MAX_SIZE),
+                    conf.get(CONF_POLICY),
+                    None if timeout is None else timeout / 1000,
+                )
+            except ValueError as ex:
+                self.hass.logger.error("net_core_bridge: %s outbox: %s", service, ex)
+
+    # ---------------------------------------------------------
+    # Spool: observe traffic to disk while .NET is away (see spool.py)
+    # ---------------------------------------------------------
+    async def _init_spool(self, config):
+        mb = 1024 * 1024
+        spool = ObserveSpool(
+            self.hass,
+            config.get(CONF_PATH) or self.hass.config.path("net_core_bridge_spool"),
+            self.guard,
+            self.channels,
+            config.get(CONF_MAX_MB, DEFAULT_MAX_BYTES / mb) * mb,
+            int(config.get(CONF_SEGMENT_MB, DEFAULT_SEGMENT_SIZE / mb) * mb),
+            config.get(CONF_REPLAY_RATE, DEFAULT_REPLAY_RATE),
+            self.metrics,
+        )
+        try:
+            await spool.async_open()
+        except OSError as ex:
+            self.hass.logger.error(
+                "net_core_bridge: cannot open spool %s: %s", spool.directory, ex
+            )
+            return
+
+        self.spool = spool
+        self.event_interceptor.outbox.spool = spool.tap(
+            "event", self.event_interceptor._intercept, (KIND_EVENT,)
+        )
+        self.state_interceptor.outbox.spool = spool.tap(
+            "state",
+            self.state_interceptor._send_observed,
+            (KIND_STATE_WRITE, KIND_STATE_WRITE_BATCH),
+            on_engage=self.state_interceptor.spooling,
+            on_drop=self.state_interceptor._dropped,
+        )
+        spool.start()
+        if spool.pending:
+            self.hass.logger.info(
+                "net_core_bridge: %d spooled message(s) left to replay.",
+                spool.pending,
+            )
+
+    # ---------------------------------------------------------
+    # Capabilities negotiated with .NET
+    # ---------------------------------------------------------
+    def _set_capabilities(self, peer):
+        caps = set(peer.capabilities) & set(self.control.capabilities)
+        self.capabilities = frozenset(caps)
+
+        typed = CAP_TYPED_PAYLOAD in caps
+        self.event_interceptor.typed_payload = typed
+        self.state_interceptor.typed_payload = typed
+        self.state_interceptor.enable_attribute_deltas(CAP_ATTRIBUTE_DELTA in caps)
+        self.entity_platform_interceptor.batch_only = CAP_ENTITY_BATCH in caps
+        if CAP_SHM_RING not in caps:
+            self._detach_shm_ring()
+
+        self.hass.logger.info(
+            "net_core_bridge: negotiated capabilities: %s", sorted(caps) or "none"
+        )
+
+    # ---------------------------------------------------------
+    # Local rules pushed by .NET
+    # ---------------------------------------------------------
+    def _set_rules(self, ruleset):
+        # An empty RuleSet withdraws every rule.
+        self.rules = RuleEngine(ruleset, dt_util.now) if ruleset.rules else None
+        self.event_interceptor.set_rules(self.rules)
+        self.state_interceptor.set_rules(self.rules)
+
+        self.hass.logger.info(
+            "net_core_bridge: %d local rule(s) registered.", len(ruleset.rules)
+        )
+
+    # ---------------------------------------------------------
+    # Observe-only transport: shared-memory ring offered by .NET
+    # ---------------------------------------------------------
+    def _set_shm_ring(self, offer):
+        self._detach_shm_ring()
+        if not offer.path or CAP_SHM_RING not in self.capabilities:
+            return
+
+        try:
+            ring = ShmRingWriter(offer.path, offer.doorbell_path)
+        except (OSError, ValueError) as ex:
+            self.hass.logger.error(
+                "net_core_bridge: cannot attach shm ring %s: %s", offer.path, ex
+            )
+            return
+
+        self.shm_ring = ring
+        for interceptor in (self.event_interceptor, self.state_interceptor):
+            interceptor.observe = ShmObserveSink(ring, interceptor.outbox)
+        self._shm_watch = self.hass.async_create_background_task(
+            self._watch_shm_ring(ring), "net_core_bridge shm ring watch"
+        )
+
+        self.hass.logger.info(
+            "net_core_bridge: observe traffic on shm ring %s (%d bytes).",
+            offer.path,
+            ring.capacity,
+        )
+
+    def _detach_shm_ring(self):
+        for interceptor in (self.event_interceptor, self.state_interceptor):
+            interceptor.observe = interceptor.outbox
 
-        self.channel = grpc.aio.insecure_channel(target)
+        if self._shm_watch is not None:
+            if self._shm_watch is not asyncio.current_task():
+                self._shm_watch.cancel()
+            self._shm_watch = None
+        if self.shm_ring is not None:
+            self.shm_ring.close()
+            self.shm_ring = None
+
+    async def _watch_shm_ring(self, ring):
+        while ring.check():
+            await asyncio.sleep(CHECK_INTERVAL)
+
+        self.hass.logger.warning(
+            "net_core_bridge: shm ring reader %s; back to gRPC.",
+            "stopped consuming" if ring.stalled else "is gone",
+        )
+        if self.shm_ring is ring:
+            self._detach_shm_ring()
+
+    # ---------------------------------------------------------
+    # Transport: per-service channel pools (see channels.py)
+    # ---------------------------------------------------------
+    def _init_grpc(self):
+        self.channels = ChannelManager(
+            self.hass,
+            self.config.get(CONF_TARGET),
+            self.config.get(CONF_CHANNELS),
+        )
 
         # Instantiate the stubs
-        self.event_client = EventInterceptorStub(self.channel)
-        self.state_client = StateInterceptorStub(self.channel)
-        self.entity_platform_client = EntityPlatformInterceptorStub(self.channel)
+        self.event_client = self.channels.stub("event", EventInterceptorStub)
+        self.state_client = self.channels.stub("state", StateInterceptorStub)
+        self.entity_platform_client = self.channels.stub(
+            "entity_platform", EntityPlatformInterceptorStub
+        )
+        self.control_client = self.channels.stub("control", BridgeControlStub)
+        self.commands_client = self.channels.stub("commands", BridgeCommandsStub)
+        self.snapshot_client = self.channels.stub("snapshot", BridgeSnapshotStub)
 
-        self.hass.logger.info(f"net_core_bridge: gRPC target = {target}")
+        self.hass.logger.info(
+            f"net_core_bridge: gRPC target = {self.channels.target}"
+        )
@@ -0,0 +1,194 @@
+import itertools
+import sys
+import grpc
+
+# Latency-sensitive / high-volume services get dedicated channels so bulk
+# state traffic cannot head-of-line block event interception.
+DEDICATED_BY_DEFAULT = ("event", "state")
+
+SHARED = "shared"
+
+# Channel args applied to every channel unless overridden per service.
+DEFAULT_OPTIONS = {
+    # Reconnect backoff, handled by gRPC core for every subchannel.
+    "grpc.initial_reconnect_backoff_ms": 250,
+    "grpc.min_reconnect_backoff_ms": 250,
+    "grpc.max_reconnect_backoff_ms": 10000,
+    # Without this, channels with identical args reuse one connection.
+    "grpc.use_local_subchannel_pool": 1,
+}
+
+# configuration.yaml key → gRPC channel arg
+OPTION_KEYS = {
+    "keepalive_time_ms": "grpc.keepalive_time_ms",
+    "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+    "keepalive_without_calls": "grpc.keepalive_permit_without_calls",
+    "max_send_message_length": "grpc.max_send_message_length",
+    "max_receive_message_length": "grpc.max_receive_message_length",
+    "initial_reconnect_backoff_ms": "grpc.initial_reconnect_backoff_ms",
+    "max_reconnect_backoff_ms": "grpc.max_reconnect_backoff_ms",
+}
+
+COMPRESSION = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+def default_target() -> str:
+    """UDS (macOS/Linux) or TCP (Windows)."""
+    if sys.platform.startswith("win"):
+        return "localhost:50051"
+    return "unix:/tmp/homeassistant_core.sock"
+
+
+class StubPool:
+    """Round-robin over one stub per pooled channel.
+
+    Looks like a single stub: every attribute access (one per RPC) picks
+    the next channel.
+    """
+
+    def __init__(self, stubs):
+        self.stubs = stubs
+        self._next = itertools.cycle(stubs)
+
+    def __getattr__(self, name):
+        return getattr(next(self._next), name)
+
+
+class ChannelManager:
+    """Own every gRPC channel to .NET and hand out per-service stubs.
+
+    Per-service config (configuration.yaml, under channels:) may set
+    pool_size, compression, grpc_options, any key in OPTION_KEYS, and
+    shared: true to use the one common channel (configured under
+    channels: shared:) instead of a dedicated pool. A watcher per channel
+    logs connectivity transitions and notifies listeners registered with
+    on_state_change().
+    """
+
+    def __init__(self, hass, target=None, config=None):
+        self.hass = hass
+        self.target = target or default_target()
+        self.config = config or {}
+
+        self.channels = {}
+        self.names = {}
+        self._shared = None
+        self._listeners = []
+        self._watchers = []
+
+        self.state_changes = 0
+
+    # ---------------------------------------------------------
+    # CHANNELS
+    # ---------------------------------------------------------
+    def _open(self, name, conf):
+        options = dict(DEFAULT_OPTIONS)
+        for key, arg in OPTION_KEYS.items():
+            if key in conf:
+                options[arg] = int(conf[key])
+        options.update(conf.get("grpc_options", {}))
+
+        channel = grpc.aio.insecure_channel(
+            self.target,
+            options=list(options.items()),
+            compression=COMPRESSION[conf.get("compression", "none")],
+        )
+        self._watch(name, channel)
+        return channel
+
+    def _pool(self, service):
+        pool = self.channels.get(service)
+        if pool is not None:
+            return pool
+
+        conf = self.config.get(service, {})
+        if conf.get(SHARED, service not in DEDICATED_BY_DEFAULT):
+            if self._shared is None:
+                self._shared = [self._open(SHARED, self.config.get(SHARED, {}))]
+            pool = self._shared
+            names = [SHARED]
+        else:
+            size = max(1, int(conf.get("pool_size", 1)))
+            names = [f"{service}[{i}]" for i in range(size)]
+            pool = [self._open(name, conf) for name in names]
+
+        self.channels[service] = pool
+        self.names[service] = names
+        return pool
+
+    def channel(self, service):
+        """First channel of a service's pool (for one-off callers)."""
+        return self._pool(service)[0]
+
+    def stub(self, service, stub_cls):
+        pool = self._pool(service)
+        if len(pool) == 1:
+            return stub_cls(pool[0])
+        return StubPool([stub_cls(channel) for channel in pool])
+
+    async def close(self):
+        for task in self._watchers:
+            task.cancel()
+        self._watchers = []
+
+        seen = set()
+        for pool in self.channels.values():
+            for channel in pool:
+                if id(channel) not in seen:
+                    seen.add(id(channel))
+                    await channel.close()
+
+    # ---------------------------------------------------------
+    # CONNECTIVITY
+    # ---------------------------------------------------------
+    def on_state_change(self, listener):
+        """Register listener(name, state) for every channel transition.
+
+        Returns a callable that unregisters it.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _watch(self, name, channel):
+        self._watchers.append(
+            self.hass.async_create_background_task(
+                self._watch_channel(name, channel),
+                f"net_core_bridge channel {name} watcher",
+            )
+        )
+
+    async def _watch_channel(self, name, channel):
+        state = channel.get_state(try_to_connect=True)
+        while state != grpc.ChannelConnectivity.SHUTDOWN:
+            await channel.wait_for_state_change(state)
+            state = channel.get_state()
+            self.state_changes += 1
+
+            if state == grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+                self.hass.logger.warning(
+                    "net_core_bridge: channel %s lost; reconnecting.", name
+                )
+            elif state == grpc.ChannelConnectivity.READY:
+                self.hass.logger.info("net_core_bridge: channel %s ready.", name)
+
+            for listener in self._listeners:
+                try:
+                    listener(name, state)
+                except Exception as ex:
+                    self.hass.logger.error(
+                        "net_core_bridge: channel listener failed: %s", ex
+                    )
+
+    def diagnostics(self) -> dict:
+        return {
+            "target": self.target,
+            "state_changes": self.state_changes,
+            "services": {
+                service: [c.get_state().name for c in pool]
+                for service, pool in self.channels.items()
+            },
+        }
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: bridge_commands.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'bridge_commands.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import payload_pb2 as payload__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15\x62ridge_commands.proto\x12\x06hacore\x1a\rpayload.proto\">\n\x0c\x43ommandBatch\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12!\n\x08\x63ommands\x18\x02 \x03(\x0b\x32\x0f.hacore.Command\"\x91\x01\n\x07\x43ommand\x12%\n\tset_state\x18\x01 \x01(\x0b\x32\x10.hacore.SetStateH\x00\x12\'\n\nfire_event\x18\x02 \x01(\x0b\x32\x11.hacore.FireEventH\x00\x12+\n\x0cremove_state\x18\x03 \x01(\x0b\x32\x13.hacore.RemoveStateH\x00\x42\t\n\x07\x63ommand\"\x8e\x01\n\x08SetState\x12\x11\n\tentity_id\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12$\n\nattributes\x18\x03 \x01(\x0b\x32\x10.hacore.ValueMap\x12\x17\n\x0f\x61ttributes_json\x18\x04 \x01(\t\x12\r\n\x05\x66orce\x18\x05 \x01(\x08\x12\x12\n\ncontext_id\x18\x06 \x01(\t\"f\n\tFireEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x1e\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x10.hacore.ValueMap\x12\x11\n\tdata_json\x18\x03 \x01(\t\x12\x12\n\ncontext_id\x18\x04 \x01(\t\"4\n\x0bRemoveState\x12\x11\n\tentity_id\x18\x01 \x01(\t\x12\x12\n\ncontext_id\x18\x02 \x01(\t\"J\n\nCommandAck\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12\x0f\n\x07\x61pplied\x18\x02 \x01(\r\x12\x0e\n\x06\x66\x61iled\x18\x03 \x01(\r\x12\x0e\n\x06\x65rrors\x18\x04 \x03(\t2J\n\x0e\x42ridgeCommands\x12\x38\n\x08\x43ommands\x12\x12.hacore.CommandAck\x1a\x14.hacore.CommandBatch(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'bridge_commands_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_COMMANDBATCH']._serialized_start=48
+  _globals['_COMMANDBATCH']._serialized_end=110
+  _globals['_COMMAND']._serialized_start=113
+  _globals['_COMMAND']._serialized_end=258
+  _globals['_SETSTATE']._serialized_start=261
+  _globals['_SETSTATE']._serialized_end=403
+  _globals['_FIREEVENT']._serialized_start=405
+  _globals['_FIREEVENT']._serialized_end=507
+  _globals['_REMOVESTATE']._serialized_start=509
+  _globals['_REMOVESTATE']._serialized_end=561
+  _globals['_COMMANDACK']._serialized_start=563
+  _globals['_COMMANDACK']._serialized_end=637
+  _globals['_BRIDGECOMMANDS']._serialized_start=639
+  _globals['_BRIDGECOMMANDS']._serialized_end=713
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,118 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import bridge_commands_pb2 as bridge__commands__pb2
+
+GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in bridge_commands_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class BridgeCommandsStub(object):
+    """-------------------------
+    Reverse channel
+    -------------------------
+    .NET → HA state writes and events. The bridge opens the stream on
+    startup and applies each batch in order through HA's original (not
+    intercepted) StateMachine.async_set / EventBus.async_fire, so nothing
+    .NET writes is sent back to it. One CommandAck per batch.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Commands = channel.stream_stream(
+                '/hacore.BridgeCommands/Commands',
+                request_serializer=bridge__commands__pb2.CommandAck.SerializeToString,
+                response_deserializer=bridge__commands__pb2.CommandBatch.FromString,
+                _registered_method=True)
+
+
+class BridgeCommandsServicer(object):
+    """-------------------------
+    Reverse channel
+    -------------------------
+    .NET → HA state writes and events. The bridge opens the stream on
+    startup and applies each batch in order through HA's original (not
+    intercepted) StateMachine.async_set / EventBus.async_fire, so nothing
+    .NET writes is sent back to it. One CommandAck per batch.
+    """
+
+    def Commands(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_BridgeCommandsServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Commands': grpc.stream_stream_rpc_method_handler(
+                    servicer.Commands,
+                    request_deserializer=bridge__commands__pb2.CommandAck.FromString,
+                    response_serializer=bridge__commands__pb2.CommandBatch.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'hacore.BridgeCommands', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('hacore.BridgeCommands', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class BridgeCommands(object):
+    """-------------------------
+    Reverse channel
+    -------------------------
+    .NET → HA state writes and events. The bridge opens the stream on
+    startup and applies each batch in order through HA's original (not
+    intercepted) StateMachine.async_set / EventBus.async_fire, so nothing
+    .NET writes is sent back to it. One CommandAck per batch.
+    """
+
+    @staticmethod
+    def Commands(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/hacore.BridgeCommands/Commands',
+            bridge__commands__pb2.CommandAck.SerializeToString,
+            bridge__commands__pb2.CommandBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: bridge_control.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'bridge_control.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import rules_pb2 as rules__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x62ridge_control.proto\x12\x06hacore\x1a\x0brules.proto\"<\n\x0c\x43ontrolHello\x12\x16\n\x0e\x62ridge_version\x18\x01 \x01(\t\x12\x14\n\x0c\x63\x61pabilities\x18\x02 \x03(\t\"\x87\x03\n\rControlUpdate\x12=\n\x13\x65vent_subscriptions\x18\x01 \x01(\x0b\x32\x1e.hacore.EventSubscriptionTableH\x00\x12=\n\x13state_subscriptions\x18\x02 \x01(\x0b\x32\x1e.hacore.StateSubscriptionTableH\x00\x12\x30\n\x0c\x63\x61pabilities\x18\x03 \x01(\x0b\x32\x18.hacore.PeerCapabilitiesH\x00\x12\x33\n\x10\x61ttribute_resync\x18\x04 \x01(\x0b\x32\x17.hacore.AttributeResyncH\x00\x12;\n\x14invalidate_decisions\x18\x05 \x01(\x0b\x32\x1b.hacore.InvalidateDecisionsH\x00\x12(\n\x08shm_ring\x18\x06 \x01(\x0b\x32\x14.hacore.ShmRingOfferH\x00\x12 \n\x05rules\x18\x07 \x01(\x0b\x32\x0f.hacore.RuleSetH\x00\x42\x08\n\x06update\"(\n\x10PeerCapabilities\x12\x14\n\x0c\x63\x61pabilities\x18\x01 \x03(\t\"b\n\x11\x45ventSubscription\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x14\n\x0c\x65ntity_globs\x18\x02 \x03(\t\x12#\n\x04mode\x18\x03 \x01(\x0e\x32\x15.hacore.InterceptMode\"J\n\x16\x45ventSubscriptionTable\x12\x30\n\rsubscriptions\x18\x01 \x03(\x0b\x32\x19.hacore.EventSubscription\"v\n\x11StateSubscription\x12\x0e\n\x06\x64omain\x18\x01 \x01(\t\x12\x14\n\x0c\x65ntity_globs\x18\x02 \x03(\t\x12#\n\x04mode\x18\x03 \x01(\x0e\x32\x15.hacore.InterceptMode\x12\x16\n\x0eskip_unchanged\x18\x04 \x01(\x08\"J\n\x16StateSubscriptionTable\x12\x30\n\rsubscriptions\x18\x01 \x03(\x0b\x32\x19.hacore.StateSubscription\"2\n\x0f\x41ttributeResync\x12\x12\n\nentity_ids\x18\x01 \x03(\t\x12\x0b\n\x03\x61ll\x18\x02 \x01(\x08\"K\n\x13InvalidateDecisions\x12\x12\n\nentity_ids\x18\x01 \x03(\t\x12\x13\n\x0b\x65vent_types\x18\x02 \x03(\t\x12\x0b\n\x03\x61ll\x18\x03 \x01(\x08\"3\n\x0cShmRingOffer\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x15\n\rdoorbell_path\x18\x02 \x01(\t*+\n\rInterceptMode\x12\r\n\tINTERCEPT\x10\x00\x12\x0b\n\x07OBSERVE\x10\x01\x32G\n\rBridgeControl\x12\x36\n\x05Watch\x12\x14.hacore.ControlHello\x1a\x15.hacore.ControlUpdate0\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'bridge_control_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INTERCEPTMODE']._serialized_start=1097
+  _globals['_INTERCEPTMODE']._serialized_end=1140
+  _globals['_CONTROLHELLO']._serialized_start=45
+  _globals['_CONTROLHELLO']._serialized_end=105
+  _globals['_CONTROLUPDATE']._serialized_start=108
+  _globals['_CONTROLUPDATE']._serialized_end=499
+  _globals['_PEERCAPABILITIES']._serialized_start=501
+  _globals['_PEERCAPABILITIES']._serialized_end=541
+  _globals['_EVENTSUBSCRIPTION']._serialized_start=543
+  _globals['_EVENTSUBSCRIPTION']._serialized_end=641
+  _globals['_EVENTSUBSCRIPTIONTABLE']._serialized_start=643
+  _globals['_EVENTSUBSCRIPTIONTABLE']._serialized_end=717
+  _globals['_STATESUBSCRIPTION']._serialized_start=719
+  _globals['_STATESUBSCRIPTION']._serialized_end=837
+  _globals['_STATESUBSCRIPTIONTABLE']._serialized_start=839
+  _globals['_STATESUBSCRIPTIONTABLE']._serialized_end=913
+  _globals['_ATTRIBUTERESYNC']._serialized_start=915
+  _globals['_ATTRIBUTERESYNC']._serialized_end=965
+  _globals['_INVALIDATEDECISIONS']._serialized_start=967
+  _globals['_INVALIDATEDECISIONS']._serialized_end=1042
+  _globals['_SHMRINGOFFER']._serialized_start=1044
+  _globals['_SHMRINGOFFER']._serialized_end=1095
+  _globals['_BRIDGECONTROL']._serialized_start=1142
+  _globals['_BRIDGECONTROL']._serialized_end=1213
+# @@protoc_insertion_point(module_scope)
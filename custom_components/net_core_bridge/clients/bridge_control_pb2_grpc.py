@@ -0,0 +1,112 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import bridge_control_pb2 as bridge__control__pb2
+
+GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in bridge_control_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class BridgeControlStub(object):
+    """-------------------------
+    Control plane
+    -------------------------
+    The bridge is always the gRPC client, so runtime configuration coming from
+    .NET is delivered over a long-lived server stream the bridge subscribes to.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Watch = channel.unary_stream(
+                '/hacore.BridgeControl/Watch',
+                request_serializer=bridge__control__pb2.ControlHello.SerializeToString,
+                response_deserializer=bridge__control__pb2.ControlUpdate.FromString,
+                _registered_method=True)
+
+
+class BridgeControlServicer(object):
+    """-------------------------
+    Control plane
+    -------------------------
+    The bridge is always the gRPC client, so runtime configuration coming from
+    .NET is delivered over a long-lived server stream the bridge subscribes to.
+    """
+
+    def Watch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_BridgeControlServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Watch': grpc.unary_stream_rpc_method_handler(
+                    servicer.Watch,
+                    request_deserializer=bridge__control__pb2.ControlHello.FromString,
+                    response_serializer=bridge__control__pb2.ControlUpdate.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'hacore.BridgeControl', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('hacore.BridgeControl', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class BridgeControl(object):
+    """-------------------------
+    Control plane
+    -------------------------
+    The bridge is always the gRPC client, so runtime configuration coming from
+    .NET is delivered over a long-lived server stream the bridge subscribes to.
+    """
+
+    @staticmethod
+    def Watch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/hacore.BridgeControl/Watch',
+            bridge__control__pb2.ControlHello.SerializeToString,
+            bridge__control__pb2.ControlUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: decision_cache.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'decision_cache.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x64\x65\x63ision_cache.proto\x12\x06hacore\">\n\tCacheHint\x12\x0e\n\x06ttl_ms\x18\x01 \x01(\r\x12!\n\x05scope\x18\x02 \x01(\x0e\x32\x12.hacore.CacheScope*\\\n\nCacheScope\x12\x0e\n\nCACHE_NONE\x10\x00\x12\x14\n\x10\x43\x41\x43HE_EVENT_TYPE\x10\x01\x12\x10\n\x0c\x43\x41\x43HE_ENTITY\x10\x02\x12\x16\n\x12\x43\x41\x43HE_ENTITY_STATE\x10\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'decision_cache_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CACHESCOPE']._serialized_start=96
+  _globals['_CACHESCOPE']._serialized_end=188
+  _globals['_CACHEHINT']._serialized_start=32
+  _globals['_CACHEHINT']._serialized_end=94
+# @@protoc_insertion_point(module_scope)
@@ -3,7 +3,7 @@
 import grpc
 import warnings
 
-import entity_platform_pb2 as entity__platform__pb2
+from . import entity_platform_pb2 as entity__platform__pb2
 
 GRPC_GENERATED_VERSION = '1.76.0'
 GRPC_VERSION = grpc.__version__
@@ -22,19 +22,25 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from . import decision_cache_pb2 as decision__cache__pb2
+from . import payload_pb2 as payload__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17\x65vent_interceptor.proto\x12\x06hacore\"\\\n\x0c\x45ventMessage\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\tentity_id\x18\x02 \x01(\t\x12\x11\n\tjson_data\x18\x03 \x01(\t\x12\x12\n\ncontext_id\x18\x04 \x01(\t\" \n\rEventResponse\x12\x0f\n\x07handled\x18\x01 \x01(\x08\x32Q\n\x10\x45ventInterceptor\x12=\n\x0eInterceptEvent\x12\x14.hacore.EventMessage\x1a\x15.hacore.EventResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17\x65vent_interceptor.proto\x12\x06hacore\x1a\x14\x64\x65\x63ision_cache.proto\x1a\rpayload.proto\"|\n\x0c\x45ventMessage\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\tentity_id\x18\x02 \x01(\t\x12\x11\n\tjson_data\x18\x03 \x01(\t\x12\x12\n\ncontext_id\x18\x04 \x01(\t\x12\x1e\n\x04\x64\x61ta\x18\x05 \x01(\x0b\x32\x10.hacore.ValueMap\"B\n\rEventResponse\x12\x0f\n\x07handled\x18\x01 \x01(\x08\x12 \n\x05\x63\x61\x63he\x18\x02 \x01(\x0b\x32\x11.hacore.CacheHint\">\n\nEventFrame\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12#\n\x05\x65vent\x18\x02 \x01(\x0b\x32\x14.hacore.EventMessage\"J\n\x12\x45ventFrameResponse\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12\'\n\x08response\x18\x02 \x01(\x0b\x32\x15.hacore.EventResponse2\x9d\x01\n\x10\x45ventInterceptor\x12=\n\x0eInterceptEvent\x12\x14.hacore.EventMessage\x1a\x15.hacore.EventResponse\x12J\n\x14InterceptEventStream\x12\x12.hacore.EventFrame\x1a\x1a.hacore.EventFrameResponse(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'event_interceptor_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_EVENTMESSAGE']._serialized_start=35
-  _globals['_EVENTMESSAGE']._serialized_end=127
-  _globals['_EVENTRESPONSE']._serialized_start=129
-  _globals['_EVENTRESPONSE']._serialized_end=161
-  _globals['_EVENTINTERCEPTOR']._serialized_start=163
-  _globals['_EVENTINTERCEPTOR']._serialized_end=244
+  _globals['_EVENTMESSAGE']._serialized_start=72
+  _globals['_EVENTMESSAGE']._serialized_end=196
+  _globals['_EVENTRESPONSE']._serialized_start=198
+  _globals['_EVENTRESPONSE']._serialized_end=264
+  _globals['_EVENTFRAME']._serialized_start=266
+  _globals['_EVENTFRAME']._serialized_end=328
+  _globals['_EVENTFRAMERESPONSE']._serialized_start=330
+  _globals['_EVENTFRAMERESPONSE']._serialized_end=404
+  _globals['_EVENTINTERCEPTOR']._serialized_start=407
+  _globals['_EVENTINTERCEPTOR']._serialized_end=564
 # @@protoc_insertion_point(module_scope)
@@ -3,7 +3,7 @@
 import grpc
 import warnings
 
-import event_interceptor_pb2 as event__interceptor__pb2
+from . import event_interceptor_pb2 as event__interceptor__pb2
 
 GRPC_GENERATED_VERSION = '1.76.0'
 GRPC_VERSION = grpc.__version__
@@ -39,6 +39,11 @@ class EventInterceptorStub(object):
                 request_serializer=event__interceptor__pb2.EventMessage.SerializeToString,
                 response_deserializer=event__interceptor__pb2.EventResponse.FromString,
                 _registered_method=True)
+        self.InterceptEventStream = channel.stream_stream(
+                '/hacore.EventInterceptor/InterceptEventStream',
+                request_serializer=event__interceptor__pb2.EventFrame.SerializeToString,
+                response_deserializer=event__interceptor__pb2.EventFrameResponse.FromString,
+                _registered_method=True)
 
 
 class EventInterceptorServicer(object):
@@ -50,6 +55,13 @@ class EventInterceptorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def InterceptEventStream(self, request_iterator, context):
+        """Long-lived stream: many intercepts in flight, matched by seq.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_EventInterceptorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +70,11 @@ def add_EventInterceptorServicer_to_server(servicer, server):
                     request_deserializer=event__interceptor__pb2.EventMessage.FromString,
                     response_serializer=event__interceptor__pb2.EventResponse.SerializeToString,
             ),
+            'InterceptEventStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.InterceptEventStream,
+                    request_deserializer=event__interceptor__pb2.EventFrame.FromString,
+                    response_serializer=event__interceptor__pb2.EventFrameResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'hacore.EventInterceptor', rpc_method_handlers)
@@ -95,3 +112,30 @@ class EventInterceptor(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def InterceptEventStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/hacore.EventInterceptor/InterceptEventStream',
+            event__interceptor__pb2.EventFrame.SerializeToString,
+            event__interceptor__pb2.EventFrameResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
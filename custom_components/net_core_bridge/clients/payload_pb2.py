@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: payload.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'payload.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rpayload.proto\x12\x06hacore\"\xff\x01\n\x05Value\x12\x14\n\nnull_value\x18\x01 \x01(\x08H\x00\x12\x14\n\nbool_value\x18\x02 \x01(\x08H\x00\x12\x13\n\tint_value\x18\x03 \x01(\x12H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x05 \x01(\tH\x00\x12\x16\n\x0ctimestamp_us\x18\x06 \x01(\x03H\x00\x12\'\n\nlist_value\x18\x07 \x01(\x0b\x32\x11.hacore.ValueListH\x00\x12%\n\tmap_value\x18\x08 \x01(\x0b\x32\x10.hacore.ValueMapH\x00\x12\x15\n\x0b\x62ytes_value\x18\t \x01(\x0cH\x00\x42\x06\n\x04kind\"*\n\tValueList\x12\x1d\n\x06values\x18\x01 \x03(\x0b\x32\r.hacore.Value\"v\n\x08ValueMap\x12,\n\x06\x66ields\x18\x01 \x03(\x0b\x32\x1c.hacore.ValueMap.FieldsEntry\x1a<\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1c\n\x05value\x18\x02 \x01(\x0b\x32\r.hacore.Value:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'payload_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_VALUEMAP_FIELDSENTRY']._loaded_options = None
+  _globals['_VALUEMAP_FIELDSENTRY']._serialized_options = b'8\001'
+  _globals['_VALUE']._serialized_start=26
+  _globals['_VALUE']._serialized_end=281
+  _globals['_VALUELIST']._serialized_start=283
+  _globals['_VALUELIST']._serialized_end=325
+  _globals['_VALUEMAP']._serialized_start=327
+  _globals['_VALUEMAP']._serialized_end=445
+  _globals['_VALUEMAP_FIELDSENTRY']._serialized_start=385
+  _globals['_VALUEMAP_FIELDSENTRY']._serialized_end=445
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: rules.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'rules.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import payload_pb2 as payload__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0brules.proto\x12\x06hacore\x1a\rpayload.proto\"&\n\x07RuleSet\x12\x1b\n\x05rules\x18\x01 \x03(\x0b\x32\x0c.hacore.Rule\"\xcd\x01\n\x04Rule\x12\n\n\x02id\x18\x01 \x01(\t\x12\"\n\x06target\x18\x02 \x01(\x0e\x32\x12.hacore.RuleTarget\x12\x0b\n\x03key\x18\x03 \x01(\t\x12\x14\n\x0c\x65ntity_globs\x18\x04 \x03(\t\x12%\n\nconditions\x18\x05 \x03(\x0b\x32\x11.hacore.Condition\x12\'\n\x0btime_window\x18\x06 \x01(\x0b\x32\x12.hacore.TimeWindow\x12\"\n\x06\x61\x63tion\x18\x07 \x01(\x0b\x32\x12.hacore.RuleAction\"V\n\tCondition\x12\r\n\x05\x66ield\x18\x01 \x01(\t\x12\x1c\n\x02op\x18\x02 \x01(\x0e\x32\x10.hacore.Operator\x12\x1c\n\x05value\x18\x03 \x01(\x0b\x32\r.hacore.Value\"6\n\nTimeWindow\x12\x14\n\x0cstart_minute\x18\x01 \x01(\r\x12\x12\n\nend_minute\x18\x02 \x01(\r\"v\n\nRuleAction\x12&\n\x08\x64\x65\x63ision\x18\x01 \x01(\x0e\x32\x14.hacore.RuleDecision\x12\x16\n\x0eoverride_state\x18\x02 \x01(\t\x12(\n\x0eset_attributes\x18\x03 \x01(\x0b\x32\x10.hacore.ValueMap*(\n\nRuleTarget\x12\x0f\n\x0bSTATE_WRITE\x10\x00\x12\t\n\x05\x45VENT\x10\x01*[\n\x08Operator\x12\x06\n\x02\x45Q\x10\x00\x12\x06\n\x02NE\x10\x01\x12\x06\n\x02GT\x10\x02\x12\x06\n\x02GE\x10\x03\x12\x06\n\x02LT\x10\x04\x12\x06\n\x02LE\x10\x05\x12\n\n\x06\x45XISTS\x10\x06\x12\x0b\n\x07MISSING\x10\x07\x12\x06\n\x02IN\x10\x08*:\n\x0cRuleDecision\x12\t\n\x05\x41LLOW\x10\x00\x12\x08\n\x04VETO\x10\x01\x12\x0c\n\x08OVERRIDE\x10\x02\x12\x07\n\x03\x41SK\x10\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'rules_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_RULETARGET']._serialized_start=550
+  _globals['_RULETARGET']._serialized_end=590
+  _globals['_OPERATOR']._serialized_start=592
+  _globals['_OPERATOR']._serialized_end=683
+  _globals['_RULEDECISION']._serialized_start=685
+  _globals['_RULEDECISION']._serialized_end=743
+  _globals['_RULESET']._serialized_start=38
+  _globals['_RULESET']._serialized_end=76
+  _globals['_RULE']._serialized_start=79
+  _globals['_RULE']._serialized_end=284
+  _globals['_CONDITION']._serialized_start=286
+  _globals['_CONDITION']._serialized_end=372
+  _globals['_TIMEWINDOW']._serialized_start=374
+  _globals['_TIMEWINDOW']._serialized_end=428
+  _globals['_RULEACTION']._serialized_start=430
+  _globals['_RULEACTION']._serialized_end=548
+# @@protoc_insertion_point(module_scope)
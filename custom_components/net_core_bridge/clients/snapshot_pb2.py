@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: snapshot.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'snapshot.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import entity_platform_pb2 as entity__platform__pb2
+from . import state_interceptor_pb2 as state__interceptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0esnapshot.proto\x12\x06hacore\x1a\x15\x65ntity_platform.proto\x1a\x17state_interceptor.proto\"\xa0\x01\n\rSnapshotChunk\x12\x13\n\x0bsnapshot_id\x18\x01 \x01(\x04\x12\x10\n\x08sequence\x18\x02 \x01(\x04\x12)\n\x06states\x18\x03 \x03(\x0b\x32\x19.hacore.StateWriteRequest\x12/\n\tplatforms\x18\x04 \x03(\x0b\x32\x1c.hacore.EntitiesAddedRequest\x12\x0c\n\x04last\x18\x05 \x01(\x08\"\x19\n\x0bSnapshotAck\x12\n\n\x02ok\x18\x01 \x01(\x08\x32J\n\x0e\x42ridgeSnapshot\x12\x38\n\x08Snapshot\x12\x15.hacore.SnapshotChunk\x1a\x13.hacore.SnapshotAck(\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'snapshot_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SNAPSHOTCHUNK']._serialized_start=75
+  _globals['_SNAPSHOTCHUNK']._serialized_end=235
+  _globals['_SNAPSHOTACK']._serialized_start=237
+  _globals['_SNAPSHOTACK']._serialized_end=262
+  _globals['_BRIDGESNAPSHOT']._serialized_start=264
+  _globals['_BRIDGESNAPSHOT']._serialized_end=338
+# @@protoc_insertion_point(module_scope)
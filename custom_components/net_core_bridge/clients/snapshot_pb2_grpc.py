@@ -0,0 +1,115 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import snapshot_pb2 as snapshot__pb2
+
+GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in snapshot_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class BridgeSnapshotStub(object):
+    """-------------------------
+    State snapshot
+    -------------------------
+    Streamed by the bridge (gzip-compressed) whenever it connects or
+    reconnects to .NET, so .NET starts from HA's full current state instead
+    of waiting for every entity to be written again.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Snapshot = channel.stream_unary(
+                '/hacore.BridgeSnapshot/Snapshot',
+                request_serializer=snapshot__pb2.SnapshotChunk.SerializeToString,
+                response_deserializer=snapshot__pb2.SnapshotAck.FromString,
+                _registered_method=True)
+
+
+class BridgeSnapshotServicer(object):
+    """-------------------------
+    State snapshot
+    -------------------------
+    Streamed by the bridge (gzip-compressed) whenever it connects or
+    reconnects to .NET, so .NET starts from HA's full current state instead
+    of waiting for every entity to be written again.
+    """
+
+    def Snapshot(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_BridgeSnapshotServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Snapshot': grpc.stream_unary_rpc_method_handler(
+                    servicer.Snapshot,
+                    request_deserializer=snapshot__pb2.SnapshotChunk.FromString,
+                    response_serializer=snapshot__pb2.SnapshotAck.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'hacore.BridgeSnapshot', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('hacore.BridgeSnapshot', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class BridgeSnapshot(object):
+    """-------------------------
+    State snapshot
+    -------------------------
+    Streamed by the bridge (gzip-compressed) whenever it connects or
+    reconnects to .NET, so .NET starts from HA's full current state instead
+    of waiting for every entity to be written again.
+    """
+
+    @staticmethod
+    def Snapshot(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/hacore.BridgeSnapshot/Snapshot',
+            snapshot__pb2.SnapshotChunk.SerializeToString,
+            snapshot__pb2.SnapshotAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -22,19 +22,25 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from . import decision_cache_pb2 as decision__cache__pb2
+from . import payload_pb2 as payload__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17state_interceptor.proto\x12\x06hacore\"b\n\x11StateWriteRequest\x12\x11\n\tentity_id\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x17\n\x0f\x61ttributes_json\x18\x03 \x01(\t\x12\x12\n\ncontext_id\x18\x04 \x01(\t\"_\n\x12StateWriteResponse\x12\x0f\n\x07handled\x18\x01 \x01(\x08\x12\x16\n\x0eoverride_state\x18\x02 \x01(\t\x12 \n\x18override_attributes_json\x18\x03 \x01(\t2`\n\x10StateInterceptor\x12L\n\x13InterceptStateWrite\x12\x19.hacore.StateWriteRequest\x1a\x1a.hacore.StateWriteResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17state_interceptor.proto\x12\x06hacore\x1a\x14\x64\x65\x63ision_cache.proto\x1a\rpayload.proto\"\x8d\x02\n\x11StateWriteRequest\x12\x11\n\tentity_id\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x17\n\x0f\x61ttributes_json\x18\x03 \x01(\t\x12\x12\n\ncontext_id\x18\x04 \x01(\t\x12$\n\nattributes\x18\x05 \x01(\x0b\x32\x10.hacore.ValueMap\x12\x1a\n\x12\x61ttributes_version\x18\x06 \x01(\x04\x12\x1f\n\x17\x61ttributes_base_version\x18\x07 \x01(\x04\x12\x18\n\x10\x61ttributes_delta\x18\x08 \x01(\x08\x12\x1a\n\x12removed_attributes\x18\t \x03(\t\x12\x10\n\x08sequence\x18\n \x01(\x04\"\xcb\x01\n\x12StateWriteResponse\x12\x0f\n\x07handled\x18\x01 \x01(\x08\x12\x16\n\x0eoverride_state\x18\x02 \x01(\t\x12 \n\x18override_attributes_json\x18\x03 \x01(\t\x12-\n\x13override_attributes\x18\x04 \x01(\x0b\x32\x10.hacore.ValueMap\x12\x19\n\x11resync_attributes\x18\x05 \x01(\x08\x12 \n\x05\x63\x61\x63he\x18\x06 \x01(\x0b\x32\x11.hacore.CacheHint\"<\n\x0fStateWriteBatch\x12)\n\x06writes\x18\x01 \x03(\x0b\x32\x19.hacore.StateWriteRequest\"%\n\x17StateWriteBatchResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x32\xb6\x01\n\x10StateInterceptor\x12L\n\x13InterceptStateWrite\x12\x19.hacore.StateWriteRequest\x1a\x1a.hacore.StateWriteResponse\x12T\n\x18InterceptStateWriteBatch\x12\x17.hacore.StateWriteBatch\x1a\x1f.hacore.StateWriteBatchResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'state_interceptor_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_STATEWRITEREQUEST']._serialized_start=35
-  _globals['_STATEWRITEREQUEST']._serialized_end=133
-  _globals['_STATEWRITERESPONSE']._serialized_start=135
-  _globals['_STATEWRITERESPONSE']._serialized_end=230
-  _globals['_STATEINTERCEPTOR']._serialized_start=232
-  _globals['_STATEINTERCEPTOR']._serialized_end=328
+  _globals['_STATEWRITEREQUEST']._serialized_start=73
+  _globals['_STATEWRITEREQUEST']._serialized_end=342
+  _globals['_STATEWRITERESPONSE']._serialized_start=345
+  _globals['_STATEWRITERESPONSE']._serialized_end=548
+  _globals['_STATEWRITEBATCH']._serialized_start=550
+  _globals['_STATEWRITEBATCH']._serialized_end=610
+  _globals['_STATEWRITEBATCHRESPONSE']._serialized_start=612
+  _globals['_STATEWRITEBATCHRESPONSE']._serialized_end=649
+  _globals['_STATEINTERCEPTOR']._serialized_start=652
+  _globals['_STATEINTERCEPTOR']._serialized_end=834
 # @@protoc_insertion_point(module_scope)
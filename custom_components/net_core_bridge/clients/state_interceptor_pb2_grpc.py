@@ -3,7 +3,7 @@
 import grpc
 import warnings
 
-import state_interceptor_pb2 as state__interceptor__pb2
+from . import state_interceptor_pb2 as state__interceptor__pb2
 
 GRPC_GENERATED_VERSION = '1.76.0'
 GRPC_VERSION = grpc.__version__
@@ -39,6 +39,11 @@ class StateInterceptorStub(object):
                 request_serializer=state__interceptor__pb2.StateWriteRequest.SerializeToString,
                 response_deserializer=state__interceptor__pb2.StateWriteResponse.FromString,
                 _registered_method=True)
+        self.InterceptStateWriteBatch = channel.unary_unary(
+                '/hacore.StateInterceptor/InterceptStateWriteBatch',
+                request_serializer=state__interceptor__pb2.StateWriteBatch.SerializeToString,
+                response_deserializer=state__interceptor__pb2.StateWriteBatchResponse.FromString,
+                _registered_method=True)
 
 
 class StateInterceptorServicer(object):
@@ -50,6 +55,13 @@ class StateInterceptorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def InterceptStateWriteBatch(self, request, context):
+        """Observe-only writes coalesced by the bridge; latest write per entity_id.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_StateInterceptorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +70,11 @@ def add_StateInterceptorServicer_to_server(servicer, server):
                     request_deserializer=state__interceptor__pb2.StateWriteRequest.FromString,
                     response_serializer=state__interceptor__pb2.StateWriteResponse.SerializeToString,
             ),
+            'InterceptStateWriteBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.InterceptStateWriteBatch,
+                    request_deserializer=state__interceptor__pb2.StateWriteBatch.FromString,
+                    response_serializer=state__interceptor__pb2.StateWriteBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'hacore.StateInterceptor', rpc_method_handlers)
@@ -95,3 +112,30 @@ class StateInterceptor(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def InterceptStateWriteBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/hacore.StateInterceptor/InterceptStateWriteBatch',
+            state__interceptor__pb2.StateWriteBatch.SerializeToString,
+            state__interceptor__pb2.StateWriteBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import grpc
+
+from homeassistant.core import Context
+
+from .clients.bridge_commands_pb2 import CommandAck
+from .clients.bridge_commands_pb2_grpc import BridgeCommandsStub
+from .metrics import Metrics
+from .payload import decode_map
+
+# Reconnect backoff for the command stream (seconds)
+RETRY_INITIAL = 1.0
+RETRY_MAX = 30.0
+
+# Yield to the event loop every this many commands of a batch.
+APPLY_CHUNK = 100
+
+# Failures reported back per CommandAck
+MAX_ACK_ERRORS = 10
+
+
+class CommandChannel:
+    """Apply state writes and events .NET pushes over BridgeCommands.
+
+    Batches are applied in order, each command through HA's original
+    async_set / async_fire (see the interceptors' *_original helpers), so
+    .NET's own writes are never intercepted and sent back to it. Commands
+    run in a BridgeOrigin context, which keeps what they cause in HA (e.g.
+    a service call's state writes) from being held for .NET either. Every
+    batch is answered with a CommandAck.
+    """
+
+    def __init__(
+        self,
+        hass,
+        grpc_client: BridgeCommandsStub,
+        event_interceptor,
+        state_interceptor,
+        metrics: Metrics | None = None,
+        origin=None,
+    ):
+        self.hass = hass
+        self.grpc = grpc_client
+        self.events = event_interceptor
+        self.states = state_interceptor
+        self.origin = origin
+
+        self.metrics = metrics or Metrics()
+        self._counters = self.metrics.counters
+        self._batch_latency = self.metrics.histogram("command_batch")
+
+        self._task = None
+        # Set once .NET has sent on the current stream, cleared when it ends.
+        self.connected = False
+        self.batches = 0
+
+    def start(self):
+        """Start consuming in the background. Safe to call once."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._run(), "net_core_bridge command channel"
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def diagnostics(self) -> dict:
+        return {
+            "connected": self.connected,
+            "batches": self.batches,
+            "apply": self._batch_latency.as_dict(),
+        }
+
+    # ---------------------------------------------------------
+    # STREAM LOOP
+    # ---------------------------------------------------------
+    async def _run(self):
+        delay = RETRY_INITIAL
+
+        while True:
+            acks = asyncio.Queue()
+
+            async def outgoing():
+                while True:
+                    yield await acks.get()
+
+            try:
+                call = self.grpc.Commands(outgoing())
+                async for batch in call:
+                    self.connected = True
+                    delay = RETRY_INITIAL
+                    acks.put_nowait(await self._apply(batch))
+
+            except asyncio.CancelledError:
+                self.connected = False
+                raise
+
+            except grpc.aio.AioRpcError as ex:
+                self.connected = False
+                if ex.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    self.hass.logger.info(
+                        "net_core_bridge: BridgeCommands not implemented by .NET; "
+                        "reverse channel disabled."
+                    )
+                    self._task = None
+                    return
+                self.hass.logger.warning(
+                    "net_core_bridge: BridgeCommands stream lost: %s", ex.code()
+                )
+
+            except Exception as ex:
+                self.hass.logger.error(
+                    "net_core_bridge: BridgeCommands stream failed: %s", ex
+                )
+
+            # Stream failed, or .NET ended it.
+            self.connected = False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RETRY_MAX)
+
+    # ---------------------------------------------------------
+    # APPLY
+    # ---------------------------------------------------------
+    async def _apply(self, batch):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        ack = CommandAck(seq=batch.seq)
+
+        for index, command in enumerate(batch.commands):
+            if index and not index % APPLY_CHUNK:
+                # Large batches must not starve HA's own work.
+                await asyncio.sleep(0)
+            try:
+                await self._apply_one(command)
+                ack.applied += 1
+            except Exception as ex:
+                ack.failed += 1
+                if len(ack.errors) < MAX_ACK_ERRORS:
+                    ack.errors.append(f"{index}: {ex}")
+
+        self.batches += 1
+        self._counters["command.applied"] += ack.applied
+        self._counters["command.failed"] += ack.failed
+        self._batch_latency.record(loop.time() - start)
+
+        if ack.failed:
+            self.hass.logger.warning(
+                "net_core_bridge: %d of %d .NET command(s) in batch %d failed: %s",
+                ack.failed,
+                len(batch.commands),
+                batch.seq,
+                ack.errors[0],
+            )
+        return ack
+
+    async def _apply_one(self, command):
+        kind = command.WhichOneof("command")
+
+        if kind == "set_state":
+            cmd = command.set_state
+            if cmd.HasField("attributes"):
+                attributes = decode_map(cmd.attributes)
+            elif cmd.attributes_json:
+                attributes = json.loads(cmd.attributes_json)
+            else:
+                attributes = None
+            await self.states.set_original(
+                cmd.entity_id,
+                cmd.state,
+                attributes,
+                cmd.force,
+                self._context(cmd.context_id),
+            )
+
+        elif kind == "fire_event":
+            cmd = command.fire_event
+            if cmd.HasField("data"):
+                data = decode_map(cmd.data)
+            elif cmd.data_json:
+                data = json.loads(cmd.data_json)
+            else:
+                data = {}
+            await self.events.fire_original(
+                cmd.event_type, data, self._context(cmd.context_id)
+            )
+
+        elif kind == "remove_state":
+            cmd = command.remove_state
+            self.hass.states.async_remove(
+                cmd.entity_id, self._context(cmd.context_id)
+            )
+
+        else:
+            raise ValueError("empty command")
+
+    def _context(self, context_id):
+        if self.origin is not None:
+            return self.origin.context(context_id)
+        return Context(id=context_id) if context_id else None
@@ -0,0 +1,50 @@
+DOMAIN = "net_core_bridge"
+
+# Services
+SERVICE_DIAGNOSTICS = "diagnostics"
+SERVICE_SELF_TEST = "self_test"
+ATTR_DURATION = "duration"
+ATTR_CONCURRENCY = "concurrency"
+
+# configuration.yaml keys
+CONF_TARGET = "target"
+CONF_CHANNELS = "channels"
+CONF_STATE_BATCH = "state_batch"
+CONF_WINDOW_MS = "window_ms"
+CONF_MAX_SIZE = "max_size"
+CONF_ENTITY_CONCURRENCY = "entity_added_concurrency"
+# Lifecycle RPCs (e.g. PlatformSetup) that HA waits on .NET to acknowledge
+CONF_LIFECYCLE_BARRIER = "lifecycle_barrier"
+# Event loop stall detector; false disables it
+CONF_LOOP_MONITOR = "loop_monitor"
+CONF_INTERVAL_MS = "interval_ms"
+CONF_THRESHOLD_MS = "threshold_ms"
+# Per-service observe queues: maxsize, policy, block_timeout_ms
+CONF_OUTBOX = "outbox"
+CONF_POLICY = "policy"
+CONF_BLOCK_TIMEOUT_MS = "block_timeout_ms"
+# Priority classes for intercepted events / state writes (see lanes.py)
+CONF_PRIORITY_LANES = "priority_lanes"
+# On-disk spool for observe traffic while .NET is away (see spool.py)
+CONF_SPOOL = "spool"
+CONF_PATH = "path"
+CONF_MAX_MB = "max_mb"
+CONF_SEGMENT_MB = "segment_mb"
+CONF_REPLAY_RATE = "replay_rate"
+# Feedback loops through .NET (see origin.py): max_writes per window_ms,
+# then hold_ms without forwarding
+CONF_LOOP_GUARD = "loop_guard"
+CONF_MAX_WRITES = "max_writes"
+CONF_HOLD_MS = "hold_ms"
+# Offer typed ValueMap payloads to .NET (CPU for type fidelity; off by default)
+CONF_TYPED_PAYLOAD = "typed_payload"
+
+# Capabilities negotiated over BridgeControl (ControlHello / PeerCapabilities)
+CAP_TYPED_PAYLOAD = "typed_payload"
+CAP_ATTRIBUTE_DELTA = "attribute_delta"
+# .NET only needs EntitiesAdded; per-entity EntityAdded RPCs are skipped.
+CAP_ENTITY_BATCH = "entity_batch"
+# Observe-only traffic over a shared-memory ring (ShmRingOffer).
+CAP_SHM_RING = "shm_ring"
+# Local rules pushed by .NET (RuleSet), evaluated in-process.
+CAP_RULES = "rules"
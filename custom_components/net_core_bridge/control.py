@@ -0,0 +1,118 @@
+import asyncio
+import sys
+import grpc
+
+from .clients.bridge_control_pb2 import ControlHello
+from .clients.bridge_control_pb2_grpc import BridgeControlStub
+from .const import (
+    CAP_ATTRIBUTE_DELTA,
+    CAP_ENTITY_BATCH,
+    CAP_RULES,
+    CAP_SHM_RING,
+)
+
+BRIDGE_VERSION = "0.1.0"
+
+# Everything this bridge can use if .NET also advertises it.
+BRIDGE_CAPABILITIES = (
+    CAP_ATTRIBUTE_DELTA,
+    CAP_ENTITY_BATCH,
+    CAP_RULES,
+)
+
+# typed_payload is not listed: the bridge only offers it when
+# configuration.yaml opts in (see bridge.py). A typed ValueMap keeps
+# datetimes, sets and enums intact but costs about twice json.dumps per
+# message (benchmarks/payload_encode.py), so JSON stays the default.
+
+# The ring's doorbell is a unix datagram socket.
+if not sys.platform.startswith("win"):
+    BRIDGE_CAPABILITIES += (CAP_SHM_RING,)
+
+# Reconnect backoff for the control stream (seconds)
+RETRY_INITIAL = 1.0
+RETRY_MAX = 30.0
+
+
+class BridgeControl:
+    """Consume the .NET → bridge control stream and dispatch its updates."""
+
+    def __init__(
+        self, hass, grpc_client: BridgeControlStub, capabilities=BRIDGE_CAPABILITIES
+    ):
+        self.hass = hass
+        self.grpc = grpc_client
+        self.capabilities = tuple(capabilities)
+
+        self._handlers = {}
+        self._task = None
+
+    def on(self, update, handler):
+        """Register handler(message) for one ControlUpdate oneof field."""
+        self._handlers.setdefault(update, []).append(handler)
+
+    def start(self):
+        """Start watching in the background. Safe to call once."""
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # ---------------------------------------------------------
+    # WATCH LOOP
+    # ---------------------------------------------------------
+    async def _run(self):
+        delay = RETRY_INITIAL
+
+        while True:
+            try:
+                call = self.grpc.Watch(
+                    ControlHello(
+                        bridge_version=BRIDGE_VERSION,
+                        capabilities=self.capabilities,
+                    )
+                )
+                async for update in call:
+                    delay = RETRY_INITIAL
+                    self._dispatch(update)
+
+            except asyncio.CancelledError:
+                raise
+
+            except grpc.aio.AioRpcError as ex:
+                if ex.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    # Older .NET peer: keep the default intercept-everything
+                    # behaviour and stop asking.
+                    self.hass.logger.info(
+                        "net_core_bridge: BridgeControl not implemented by .NET; "
+                        "using defaults."
+                    )
+                    return
+                self.hass.logger.warning(
+                    "net_core_bridge: BridgeControl stream lost: %s", ex.code()
+                )
+
+            except Exception as ex:
+                self.hass.logger.error(
+                    "net_core_bridge: BridgeControl stream failed: %s", ex
+                )
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RETRY_MAX)
+
+    def _dispatch(self, update):
+        kind = update.WhichOneof("update")
+        if kind is None:
+            return
+
+        message = getattr(update, kind)
+        for handler in self._handlers.get(kind, ()):
+            try:
+                handler(message)
+            except Exception as ex:
+                self.hass.logger.error(
+                    "net_core_bridge: control handler for %s failed: %s", kind, ex
+                )
@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 4096
+
+
+class DecisionCache:
+    """Bounded LRU of .NET responses with a per-entry TTL.
+
+    Keys are small tuples chosen by the interceptor from the CacheHint scope,
+    e.g. (entity_id, state) or (event_type, None). Expired entries are
+    dropped lazily on lookup.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, resp = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return resp
+
+    def lookup(self, *keys):
+        """First live response for the given keys, most specific first."""
+        for key in keys:
+            resp = self.get(key)
+            if resp is not None:
+                self.hits += 1
+                return resp
+
+        self.misses += 1
+        return None
+
+    def put(self, key, ttl_ms, resp):
+        self._entries[key] = (time.monotonic() + ttl_ms / 1000, resp)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate=None):
+        """Drop every entry whose key matches predicate (all if None)."""
+        if predicate is None:
+            self._entries.clear()
+            return
+
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,117 @@
+import asyncio
+import grpc
+
+from .clients.event_interceptor_pb2 import EventFrame
+from .clients.event_interceptor_pb2_grpc import EventInterceptorStub
+
+
+class StreamUnavailable(Exception):
+    """The .NET peer does not implement InterceptEventStream."""
+
+
+class EventStream:
+    """Multiplex InterceptEvent calls over one long-lived bidi stream.
+
+    Every event is written as an EventFrame with a fresh sequence id and the
+    caller awaits the future registered for that id. A single reader task
+    resolves futures as EventFrameResponses come back, in any order, so many
+    intercepts can be in flight on one HTTP/2 stream.
+    """
+
+    def __init__(self, hass, grpc_client: EventInterceptorStub):
+        self.hass = hass
+        self.grpc = grpc_client
+
+        # Flips to False on UNIMPLEMENTED; callers then stay on unary.
+        self.supported = True
+
+        self._seq = 0
+        self._pending = {}
+        self._outgoing = None
+        self._reader = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    async def intercept(self, evt, timeout=None):
+        """Send one EventMessage and wait (up to timeout) for its EventResponse."""
+        if not self.supported:
+            raise StreamUnavailable()
+
+        if self._reader is None:
+            self._open()
+
+        self._seq += 1
+        seq = self._seq
+
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[seq] = fut
+        self._outgoing.put_nowait(EventFrame(seq=seq, event=evt))
+
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            self._pending.pop(seq, None)
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+        self._reset(ConnectionError("event stream closed"))
+
+    # ---------------------------------------------------------
+    # STREAM LIFECYCLE
+    # ---------------------------------------------------------
+    def _open(self):
+        outgoing = asyncio.Queue()
+        self._outgoing = outgoing
+
+        async def frames():
+            while True:
+                yield await outgoing.get()
+
+        call = self.grpc.InterceptEventStream(frames())
+        self._reader = asyncio.get_running_loop().create_task(self._read(call))
+
+    async def _read(self, call):
+        error = None
+        try:
+            async for frame in call:
+                fut = self._pending.get(frame.seq)
+                if fut is not None and not fut.done():
+                    fut.set_result(frame.response)
+
+            error = ConnectionError("event stream ended by .NET")
+
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+
+        except grpc.aio.AioRpcError as ex:
+            if ex.code() == grpc.StatusCode.UNIMPLEMENTED:
+                self.supported = False
+                self.hass.logger.info(
+                    "net_core_bridge: InterceptEventStream not implemented by "
+                    ".NET; using unary InterceptEvent."
+                )
+                error = StreamUnavailable()
+            else:
+                error = ex
+
+        except Exception as ex:
+            error = ex
+
+        # Next intercept reopens the stream.
+        self._reset(error)
+
+    def _reset(self, error):
+        self._reader = None
+        self._outgoing = None
+
+        pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
@@ -16,7 +16,7 @@ DOTNET_PROTO_DIR = Path("HomeAssistantCore/HomeAssistant.Core/Protos")
 PYTHON_OUT = Path("./clients")
 
 # Regex to fix imports: "import xxx_pb2 as..." -> "from . import xxx_pb2"
-IMPORT_FIX = re.compile(r"^import (.*_pb2) as (.*)$")
+IMPORT_FIX = re.compile(r"^import (.*_pb2) as (.*)$", re.MULTILINE)
 
 
 # -------------------------------------------------------------
@@ -1,3 +1,6 @@
+import asyncio
+import weakref
+
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.core import callback
 
@@ -11,14 +14,47 @@ from ..clients.entity_platform_pb2 import (
     PlatformResetRequest,
 )
 from ..clients.entity_platform_pb2_grpc import EntityPlatformInterceptorStub
+from ..outbox import Outbox
+from ..rpc_guard import CircuitOpenError, RpcGuard
+
+# Max per-entity EntityAdded RPCs in flight for one async_add_entities call
+DEFAULT_ENTITY_CONCURRENCY = 16
+
+# Lifecycle notifications that can be made barriers (lifecycle_barrier:)
+LIFECYCLE_RPCS = ("PlatformSetup", "PlatformReset", "EntitiesAdded", "EntityRemoved")
 
 
 class EntityPlatformInterceptor:
     """Intercept EntityPlatform lifecycle events and forward to .NET."""
 
-    def __init__(self, hass, grpc_client: EntityPlatformInterceptorStub):
+    def __init__(
+        self,
+        hass,
+        grpc_client: EntityPlatformInterceptorStub,
+        guard: RpcGuard | None = None,
+        entity_concurrency: int = DEFAULT_ENTITY_CONCURRENCY,
+        barriers=(),
+    ):
         self.hass = hass
         self.grpc = grpc_client
+        self.guard = guard or RpcGuard(hass)
+
+        # Set when .NET negotiates entity_batch: EntitiesAdded only.
+        self.batch_only = False
+        self.entity_concurrency = max(1, entity_concurrency)
+
+        # Notifications go out per platform, in order, without holding up
+        # HA. RPC names in barriers wait for .NET before HA continues.
+        self._outboxes = weakref.WeakKeyDictionary()
+        self.barriers = frozenset(barriers)
+
+        # Prebuilt PlatformInfo / EntityInfo, keyed by object identity.
+        # Platform entries go on reset, entity entries on removal.
+        self._platform_infos = weakref.WeakKeyDictionary()
+        self._entity_infos = weakref.WeakKeyDictionary()
+
+        self.entity_added_sent = 0
+        self.entity_added_skipped = 0
 
         self._orig_add = None
         self._orig_setup = None
@@ -40,6 +76,21 @@ class EntityPlatformInterceptor:
 
         self.hass.logger.info("net_core_bridge: EntityPlatform patched.")
 
+    def diagnostics(self) -> dict:
+        return {
+            "batch_only": self.batch_only,
+            "entity_concurrency": self.entity_concurrency,
+            "entity_added_sent": self.entity_added_sent,
+            "entity_added_skipped": self.entity_added_skipped,
+            "barriers": sorted(self.barriers),
+            "cached_platform_infos": len(self._platform_infos),
+            "cached_entity_infos": len(self._entity_infos),
+            "outboxes": {
+                outbox.name: outbox.diagnostics()
+                for outbox in self._outboxes.values()
+            },
+        }
+
     # ---------------------------------------------------------
     # Helper: Build protobuf structures
     # ---------------------------------------------------------
@@ -53,28 +104,144 @@ class EntityPlatformInterceptor:
             else "",
         )
 
-    def _build_entity_info(self, entity) -> EntityInfo:
+    def _build_entity_info(self, entity, name) -> EntityInfo:
         return EntityInfo(
             entity_id=entity.entity_id or "",
-            name=(entity.name or ""),
+            name=name,
             domain=entity.platform.domain if entity.platform else "",
             platform=entity.platform.platform_name if entity.platform else "",
             unique_id=entity.unique_id or "",
             should_poll=entity.should_poll,
         )
 
+    def _platform_info(self, platform) -> PlatformInfo:
+        info = self._platform_infos.get(platform)
+        if info is None:
+            info = self._build_platform_info(platform)
+            self._platform_infos[platform] = info
+        return info
+
+    def _entity_info(self, entity) -> EntityInfo:
+        # name and entity_id can change (translations, registry renames):
+        # a cached entry only stands while both still match.
+        name = entity.name or ""
+        info = self._entity_infos.get(entity)
+        if info is None or info.name != name or info.entity_id != entity.entity_id:
+            info = self._build_entity_info(entity, name)
+            # New entities get their entity_id and platform during the add;
+            # cache only once both are known so placeholders never stick.
+            if info.entity_id and entity.platform is not None:
+                self._entity_infos[entity] = info
+        return info
+
+    def platforms_seen(self):
+        """EntitiesAddedRequest per live platform set up so far, for snapshots."""
+        return [
+            EntitiesAddedRequest(
+                platform=info,
+                entities=[
+                    self._entity_info(entity)
+                    for entity in list(platform.entities.values())
+                ],
+            )
+            for platform, info in list(self._platform_infos.items())
+        ]
+
+    # ---------------------------------------------------------
+    # Helper: Guarded RPC
+    # ---------------------------------------------------------
+
+    async def _call(self, method, req, what=""):
+        """Send one notification; failures are logged, never raised."""
+        try:
+            return await self.guard.call(method, getattr(self.grpc, method), req)
+        except CircuitOpenError:
+            return None
+        except Exception as ex:
+            self.hass.logger.error(
+                f"net_core_bridge: {method} RPC failed{what}: {ex}"
+            )
+            return None
+
+    # ---------------------------------------------------------
+    # Helper: Ordered per-platform outbox
+    # ---------------------------------------------------------
+
+    def _enqueue(self, platform, job, wait=False):
+        """Queue job() behind earlier notifications for the same platform.
+
+        Returns a future that resolves once job() has run, or None unless
+        wait is set.
+        """
+        outbox = self._outboxes.get(platform)
+        if outbox is None:
+            outbox = Outbox(
+                self.hass,
+                f"{platform.domain}.{platform.platform_name} lifecycle",
+                self._run_job,
+            )
+            self._outboxes[platform] = outbox
+            outbox.start()
+            # Dropped without a reset: stop the worker along with it.
+            weakref.finalize(platform, self._discard_outbox, outbox).atexit = False
+
+        fut = asyncio.get_running_loop().create_future() if wait else None
+        if not outbox.put((job, fut)) and fut is not None:
+            fut.set_result(None)
+        return fut
+
+    async def _run_job(self, message):
+        job, fut = message
+        try:
+            await job()
+        finally:
+            if fut is not None and not fut.done():
+                fut.set_result(None)
+
+    async def _notify(self, platform, method, job):
+        """Queue a notification; block only if method is a configured barrier."""
+        fut = self._enqueue(platform, job, wait=method in self.barriers)
+        if fut is not None:
+            await fut
+
+    async def _retire_outbox(self, platform):
+        """Stop platform's outbox once it has nothing left to send.
+
+        Runs as its own task: an outbox must not stop itself from inside
+        its worker.
+        """
+        outbox = self._outboxes.get(platform)
+        # Set up again meanwhile: the outbox is still in use.
+        if outbox is not None and outbox.idle:
+            del self._outboxes[platform]
+            await outbox.stop()
+
+    def _discard_outbox(self, outbox):
+        # weakref.finalize may run outside the event loop thread.
+        try:
+            self.hass.loop.call_soon_threadsafe(
+                lambda: self.hass.async_create_task(outbox.stop())
+            )
+        except RuntimeError:
+            # Loop already closed: the worker went with it.
+            pass
+
+    async def barrier(self, platform):
+        """Wait until everything queued so far for platform has reached .NET."""
+        if platform in self._outboxes:
+            await self._enqueue(platform, _noop, wait=True)
+
     # ---------------------------------------------------------
     # PLATFORM SETUP
     # ---------------------------------------------------------
 
     async def _patched_setup(self, platform, *args, **kwargs):
-        """Fire PlatformSetup → .NET"""
-        req = PlatformSetupRequest(platform=self._build_platform_info(platform))
+        """Queue PlatformSetup → .NET, run HA's setup alongside."""
+        req = PlatformSetupRequest(platform=self._platform_info(platform))
 
-        try:
-            await self.grpc.PlatformSetup(req)
-        except Exception as ex:
-            self.hass.logger.error(f"net_core_bridge: PlatformSetup RPC failed: {ex}")
+        await self._notify(
+            platform, "PlatformSetup", lambda: self._call("PlatformSetup", req)
+        )
 
         return await self._orig_setup(platform, *args, **kwargs)
 
@@ -83,13 +250,20 @@ class EntityPlatformInterceptor:
     # ---------------------------------------------------------
 
     async def _patched_reset(self, platform):
-        """Fire PlatformReset → .NET"""
-        req = PlatformResetRequest(platform=self._build_platform_info(platform))
+        """Queue PlatformReset → .NET, run HA's reset alongside."""
+        req = PlatformResetRequest(platform=self._platform_info(platform))
 
-        try:
-            await self.grpc.PlatformReset(req)
-        except Exception as ex:
-            self.hass.logger.error(f"net_core_bridge: PlatformReset RPC failed: {ex}")
+        # The platform may be set up again with a different config entry.
+        self._platform_infos.pop(platform, None)
+        for entity in list(platform.entities.values()):
+            self._entity_infos.pop(entity, None)
+
+        async def send():
+            await self._call("PlatformReset", req)
+            # Last notification for this platform: retire its outbox.
+            self.hass.async_create_task(self._retire_outbox(platform))
+
+        await self._notify(platform, "PlatformReset", send)
 
         return await self._orig_reset(platform)
 
@@ -98,50 +272,64 @@ class EntityPlatformInterceptor:
     # ---------------------------------------------------------
 
     async def _patched_add_entities(self, platform, entities, update_before_add=False):
-        """Fire EntityAdded / EntitiesAdded → .NET"""
+        """Queue EntitiesAdded (+ pipelined EntityAdded) → .NET"""
 
-        # Batch RPC
-        batch_req = EntitiesAddedRequest(
-            platform=self._build_platform_info(platform),
-            entities=[self._build_entity_info(e) for e in entities],
-        )
+        # HA accepts any iterable; we walk it more than once.
+        entities = list(entities)
+        platform_info = self._platform_info(platform)
+        infos = [self._entity_info(e) for e in entities]
 
-        try:
-            await self.grpc.EntitiesAdded(batch_req)
-        except Exception as ex:
-            self.hass.logger.error(f"net_core_bridge: EntitiesAdded RPC failed: {ex}")
+        async def send():
+            # Batch RPC
+            batch_req = EntitiesAddedRequest(platform=platform_info, entities=infos)
 
-        # Per-entity RPC
-        for e in entities:
-            single_req = EntityAddedRequest(
-                platform=self._build_platform_info(platform),
-                entity=self._build_entity_info(e),
-            )
-            try:
-                await self.grpc.EntityAdded(single_req)
-            except Exception as ex:
-                self.hass.logger.error(
-                    f"net_core_bridge: EntityAdded RPC failed for {e.entity_id}: {ex}"
-                )
+            await self._call("EntitiesAdded", batch_req)
+
+            # Per-entity RPC, only for peers that still rely on it
+            if self.batch_only:
+                self.entity_added_skipped += len(infos)
+            else:
+                await self._send_entity_added(platform_info, infos)
+
+        await self._notify(platform, "EntitiesAdded", send)
 
         return await self._orig_add(platform, entities, update_before_add)
 
+    async def _send_entity_added(self, platform_info, infos):
+        """Pipeline EntityAdded RPCs with at most entity_concurrency in flight."""
+        sem = asyncio.Semaphore(self.entity_concurrency)
+
+        async def send(info):
+            async with sem:
+                req = EntityAddedRequest(platform=platform_info, entity=info)
+                await self._call("EntityAdded", req, f" for {info.entity_id}")
+
+        await asyncio.gather(*(send(info) for info in infos))
+        self.entity_added_sent += len(infos)
+
     # ---------------------------------------------------------
     # REMOVE ENTITY
     # ---------------------------------------------------------
 
     async def _patched_remove_entity(self, platform, entity_id: str):
-        """Fire EntityRemoved → .NET."""
+        """Queue EntityRemoved → .NET, run HA's removal alongside."""
         req = EntityRemovedRequest(
-            platform=self._build_platform_info(platform),
+            platform=self._platform_info(platform),
             entity_id=entity_id,
         )
 
-        try:
-            await self.grpc.EntityRemoved(req)
-        except Exception as ex:
-            self.hass.logger.error(
-                f"net_core_bridge: EntityRemoved RPC failed for {entity_id}: {ex}"
-            )
+        entity = platform.entities.get(entity_id)
+        if entity is not None:
+            self._entity_infos.pop(entity, None)
+
+        await self._notify(
+            platform,
+            "EntityRemoved",
+            lambda: self._call("EntityRemoved", req, f" for {entity_id}"),
+        )
 
         return await self._orig_remove_entity(platform, entity_id)
+
+
+async def _noop():
+    pass
@@ -1,20 +1,84 @@
 import json
-from homeassistant.core import EventBus
+import time
 
+from homeassistant.core import EventBus, EventOrigin
+
+from ..clients.bridge_control_pb2 import INTERCEPT, OBSERVE
+from ..clients.decision_cache_pb2 import CACHE_ENTITY, CACHE_EVENT_TYPE
 from ..clients.event_interceptor_pb2 import EventMessage
 from ..clients.event_interceptor_pb2_grpc import EventInterceptorStub
+from ..decision_cache import DecisionCache
+from ..event_stream import EventStream, StreamUnavailable
+from ..lanes import LaneUnavailable
+from ..metrics import Metrics
+from ..origin import DIRECT
+from ..outbox import Outbox
+from ..payload import encode_map
+from ..rpc_guard import CircuitOpenError, RpcGuard
+from ..subscriptions import SubscriptionIndex
 
 
 class EventBusInterceptor:
     """Intercept Home Assistant event bus and forward events to .NET."""
 
-    def __init__(self, hass, grpc_client: EventInterceptorStub):
+    def __init__(
+        self,
+        hass,
+        grpc_client: EventInterceptorStub,
+        guard: RpcGuard | None = None,
+        metrics: Metrics | None = None,
+    ):
         self.hass = hass
         self.grpc = grpc_client
+        self.guard = guard or RpcGuard(hass)
+
+        # Latency the bridge adds to async_fire, plus outcome counters.
+        self.metrics = metrics or Metrics()
+        self._counters = self.metrics.counters
+        self._fire_latency = self.metrics.histogram("async_fire")
+
+        # None until .NET registers a subscription table: intercept everything.
+        self.subscriptions = None
+
+        # Negotiated with .NET: send event_data as a ValueMap, not JSON.
+        self.typed_payload = False
+
+        # HA's own bus, kept by apply() for events that must not be intercepted.
+        self.original_bus = None
+
+        # Multiplexed bidi transport; falls back to unary if .NET lacks it.
+        self.stream = EventStream(hass, grpc_client)
+
+        # Observe-mode events are queued here instead of awaited inline.
+        # Under the coalesce policy, a queued event for the same
+        # (event_type, entity_id) is replaced by the newer one.
+        self.outbox = Outbox(
+            hass,
+            "EventBusInterceptor",
+            self._intercept,
+            key=_coalesce_key,
+            metrics=self.metrics,
+            label="event",
+        )
+        # Where observe-mode messages go: the outbox, or a ShmObserveSink
+        # set by the bridge when .NET offers a shared-memory ring.
+        self.observe = self.outbox
+
+        # .NET decisions marked cacheable (CacheHint), applied locally.
+        self.decisions = DecisionCache()
+
+        # Local rules pushed by .NET (RuleSet), checked before the cache.
+        self.rules = None
+
+        # Optional PriorityLanes: per-class queue, budget and deadline.
+        self.lanes = None
+
+        # Optional BridgeOrigin: recognises events the bridge caused.
+        self.origin = None
 
     def apply(self):
         """Monkey patch hass.bus.async_fire to route through .NET first."""
-        original_bus = self.hass.bus
+        original_bus = self.original_bus = self.hass.bus
         interceptor = self
 
         class ProxyEventBus(EventBus):
@@ -31,8 +95,122 @@ class EventBusInterceptor:
 
         # Replace the event bus
         self.hass.bus = ProxyEventBus(self.hass)
+        self.outbox.start()
         self.hass.logger.info("net_core_bridge: EventBus patched.")
 
+    async def fire_original(self, event_type, event_data, context=None):
+        """Fire an event .NET sent us on HA's own bus, without intercepting it."""
+        bus = self.original_bus or self.hass.bus
+        return await bus.async_fire(event_type, event_data, EventOrigin.remote, context)
+
+    def diagnostics(self) -> dict:
+        return {
+            "subscriptions": (
+                None if self.subscriptions is None else len(self.subscriptions)
+            ),
+            "typed_payload": self.typed_payload,
+            "stream": {
+                "supported": self.stream.supported,
+                "in_flight": self.stream.in_flight,
+            },
+            "outbox": self.outbox.diagnostics(),
+            "observe_transport": "grpc" if self.observe is self.outbox else "shm",
+            "rules": None if self.rules is None else len(self.rules),
+            "decision_cache": {
+                "size": len(self.decisions),
+                "hits": self.decisions.hits,
+                "misses": self.decisions.misses,
+            },
+        }
+
+    # ---------------------------------------------------------
+    # SUBSCRIPTIONS (pushed from .NET over BridgeControl)
+    # ---------------------------------------------------------
+    def set_subscriptions(self, table):
+        """Replace the subscription index from an EventSubscriptionTable."""
+        self.subscriptions = SubscriptionIndex(
+            (sub.event_type, sub.entity_globs, sub.mode)
+            for sub in table.subscriptions
+        )
+        self.hass.logger.info(
+            "net_core_bridge: %d event subscription(s) registered.",
+            len(self.subscriptions),
+        )
+
+    def _mode_for(self, event_type, entity_id):
+        """INTERCEPT / OBSERVE for this event, or None if nobody subscribed."""
+        if self.subscriptions is None:
+            return INTERCEPT
+
+        return self.subscriptions.lookup(event_type, entity_id)
+
+    # ---------------------------------------------------------
+    # TRANSPORT
+    # ---------------------------------------------------------
+    async def _intercept(self, evt):
+        """Send one EventMessage over the stream, or unary as a fallback."""
+        if self.stream.supported:
+            try:
+                return await self.guard.call(
+                    "InterceptEventStream", self.stream.intercept, evt
+                )
+            except StreamUnavailable:
+                pass
+
+        return await self.guard.call("InterceptEvent", self.grpc.InterceptEvent, evt)
+
+    # ---------------------------------------------------------
+    # LOCAL DECISIONS: rules pushed by .NET, then the decision cache
+    # ---------------------------------------------------------
+    def set_rules(self, rules):
+        """Evaluate a RuleEngine's EVENT rules locally (None: ask .NET)."""
+        self.rules = rules
+
+    def _local_decision(self, event_type, entity_id, event_data):
+        if self.rules is not None:
+            resp = self.rules.evaluate_event(event_type, entity_id, event_data)
+            if resp is not None:
+                self._counters["event.ruled"] += 1
+                return resp
+
+        if self.decisions:
+            resp = self.decisions.lookup((event_type, entity_id), (event_type, None))
+            if resp is not None:
+                self._counters["event.cached"] += 1
+                return resp
+
+        return None
+
+    def _cache_decision(self, event_type, entity_id, resp):
+        hint = resp.cache
+        if not hint.ttl_ms:
+            return
+
+        if hint.scope == CACHE_EVENT_TYPE:
+            self.decisions.put((event_type, None), hint.ttl_ms, resp)
+        elif hint.scope == CACHE_ENTITY and entity_id:
+            self.decisions.put((event_type, entity_id), hint.ttl_ms, resp)
+
+    def invalidate_decisions(self, msg):
+        """InvalidateDecisions from .NET."""
+        if msg.all:
+            self.decisions.invalidate()
+        elif msg.event_types or msg.entity_ids:
+            event_types = set(msg.event_types)
+            entity_ids = set(msg.entity_ids)
+            self.decisions.invalidate(
+                lambda key: key[0] in event_types or key[1] in entity_ids
+            )
+
+    # ---------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------
+    def _record(self, start, event_type):
+        """Time the bridge held this event before HA (or the veto) saw it."""
+        elapsed = time.perf_counter() - start
+        self._fire_latency.record(elapsed)
+        self.metrics.histogram("async_fire", event_type).record(elapsed)
+
     # ---------------------------------------------------------
     # CORE EVENT HANDLER
     # ---------------------------------------------------------
@@ -41,21 +219,101 @@ class EventBusInterceptor:
     ):
         """Forward event to .NET before letting Home Assistant process it."""
 
+        entity_id = event_data.get("entity_id", "")
+        if not isinstance(entity_id, str):
+            entity_id = ""
+
+        # Nobody on the .NET side cares → skip gRPC entirely.
+        mode = self._mode_for(event_type, entity_id)
+        if mode is None:
+            self._counters["event.skipped"] += 1
+            return await original_bus.async_fire(
+                event_type,
+                event_data,
+                origin,
+                context,
+            )
+
+        # Caused by the bridge itself (see origin.py): a looping key skips
+        # .NET, a DIRECT event is only observed, never held.
+        if self.origin is not None:
+            via = self.origin.classify(context)
+            if via is not None:
+                if not self.origin.admit((event_type, entity_id)):
+                    return await original_bus.async_fire(
+                        event_type,
+                        event_data,
+                        origin,
+                        context,
+                    )
+                if via == DIRECT and mode != OBSERVE:
+                    self._counters["event.bypassed"] += 1
+                    mode = OBSERVE
+
+        start = time.perf_counter()
+
+        # A local rule or cached .NET decision for this event → no round trip.
+        if mode != OBSERVE:
+            resp = self._local_decision(event_type, entity_id, event_data)
+            if resp is not None:
+                self._record(start, event_type)
+                if resp.handled:
+                    self._counters["event.vetoed"] += 1
+                    return None
+                return await original_bus.async_fire(
+                    event_type,
+                    event_data,
+                    origin,
+                    context,
+                )
+
         evt = EventMessage(
             event_type=event_type,
-            entity_id=event_data.get("entity_id", ""),
-            json_data=json.dumps(event_data),
+            entity_id=entity_id,
             context_id=str(context.id if context else ""),
         )
+        if self.typed_payload:
+            encode_map(event_data, evt.data)
+        else:
+            evt.json_data = json.dumps(event_data)
+
+        # Observe only: hand off to the outbox, .NET cannot veto.
+        if mode == OBSERVE:
+            await self.observe.put_wait(evt)
+            self._counters["event.observed"] += 1
+            self._record(start, event_type)
+            return await original_bus.async_fire(
+                event_type,
+                event_data,
+                origin,
+                context,
+            )
 
         resp = None
         try:
-            resp = await self.grpc.InterceptEvent(evt)
+            if self.lanes is None:
+                resp = await self._intercept(evt)
+            else:
+                resp = await self.lanes.run(
+                    self.lanes.for_event(event_type, entity_id),
+                    lambda: self._intercept(evt),
+                )
+        except CircuitOpenError:
+            pass
+        except LaneUnavailable:
+            self._counters["event.shed"] += 1
         except Exception as ex:
+            self._counters["event.errors"] += 1
             self.hass.logger.error("EventBusInterceptor: gRPC error: %s", ex)
 
+        if resp and resp.HasField("cache"):
+            self._cache_decision(event_type, entity_id, resp)
+
+        self._record(start, event_type)
+
         # If .NET wants to suppress the event, stop here.
         if resp and resp.handled:
+            self._counters["event.vetoed"] += 1
             return None
 
         # Otherwise continue with the real event bus
@@ -65,3 +323,7 @@ class EventBusInterceptor:
             origin,
             context,
         )
+
+
+def _coalesce_key(evt):
+    return (evt.event_type, evt.entity_id) if evt.entity_id else None
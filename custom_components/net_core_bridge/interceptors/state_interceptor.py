@@ -1,18 +1,118 @@
 import json
+from time import perf_counter
+from typing import NamedTuple
+
+import grpc
 from homeassistant.core import StateMachine
 
-from ..clients.state_interceptor_pb2 import StateWriteRequest
+from ..attribute_delta import AttributeDeltaTracker
+from ..batcher import WriteBatcher
+from ..decision_cache import DecisionCache
+from ..lanes import LaneUnavailable
+from ..clients.bridge_control_pb2 import INTERCEPT, OBSERVE
+from ..clients.decision_cache_pb2 import CACHE_ENTITY, CACHE_ENTITY_STATE
+from ..clients.state_interceptor_pb2 import StateWriteBatch, StateWriteRequest
 from ..clients.state_interceptor_pb2_grpc import StateInterceptorStub
+from ..metrics import Metrics
+from ..origin import DIRECT
+from ..outbox import Outbox
+from ..payload import decode_map, encode_map
+from ..rpc_guard import CircuitOpenError, RpcGuard
+from ..subscriptions import SubscriptionIndex
+from ..unchanged import UnchangedFilter
+
+
+class StateRoute(NamedTuple):
+    """What a StateSubscription asks the bridge to do with a write."""
+
+    mode: int
+    skip_unchanged: bool = False
+
+
+# Until .NET registers a table: intercept every write, as before.
+DEFAULT_ROUTE = StateRoute(INTERCEPT)
 
 
 class StateMachineInterceptor:
     """Intercept Home Assistant state writes and forward them to .NET."""
 
-    def __init__(self, hass, grpc_client: StateInterceptorStub):
+    def __init__(
+        self,
+        hass,
+        grpc_client: StateInterceptorStub,
+        guard: RpcGuard | None = None,
+        metrics: Metrics | None = None,
+    ):
         self.hass = hass
         self.grpc = grpc_client
+        self.guard = guard or RpcGuard(hass)
         self._orig_async_set = None
 
+        # Latency the bridge adds to async_set, plus outcome counters.
+        self.metrics = metrics or Metrics()
+        self._counters = self.metrics.counters
+
+        # None until .NET registers a subscription table: intercept everything.
+        self.subscriptions = None
+
+        # Observe-mode writes are queued here instead of awaited inline.
+        # Under the coalesce policy, a queued write for the same entity_id
+        # is replaced by the newer one.
+        self.outbox = Outbox(
+            hass,
+            "StateMachineInterceptor",
+            self._send_observed,
+            key=_coalesce_key,
+            on_replace=self._on_coalesce,
+            on_evict=self._dropped,
+            metrics=self.metrics,
+            label="state",
+        )
+        # Where observe-mode messages go: the outbox, or a ShmObserveSink
+        # set by the bridge when .NET offers a shared-memory ring.
+        self.observe = self.outbox
+
+        # Negotiated with .NET: send attributes as a ValueMap, not JSON.
+        self.typed_payload = False
+
+        # Negotiated with .NET: send only changed attributes per entity.
+        self.deltas = None
+
+        # Optional: coalesce observe-mode writes into batches first.
+        self.batcher = None
+
+        # Per-entity opt-in (skip_unchanged): elide no-op writes.
+        self.unchanged = UnchangedFilter()
+
+        # .NET decisions marked cacheable (CacheHint), applied locally.
+        self.decisions = DecisionCache()
+
+        # Local rules pushed by .NET (RuleSet), checked before the cache.
+        self.rules = None
+
+        # Last StateWriteRequest.sequence handed out; snapshots carry it.
+        self.sequence = 0
+
+        # self.sequence as seen by each write not yet applied -> count
+        self._held = {}
+
+        # Optional PriorityLanes: per-class queue, budget and deadline.
+        self.lanes = None
+
+        # Optional BridgeOrigin: recognises writes the bridge caused.
+        self.origin = None
+
+    def enable_batching(self, window, max_size):
+        """Batch observe-only writes over window seconds / max_size entities."""
+        self.batcher = WriteBatcher(
+            self._enqueue, window, max_size, on_replace=self._on_coalesce
+        )
+        self.hass.logger.info(
+            "net_core_bridge: state write batching enabled (window=%.0fms, max_size=%d).",
+            window * 1000,
+            max_size,
+        )
+
     def apply(self):
         """Patch StateMachine.async_set once."""
         if self._orig_async_set is not None:
@@ -20,6 +120,8 @@ class StateMachineInterceptor:
 
         self._orig_async_set = StateMachine.async_set
         interceptor = self
+        counters = self._counters
+        latency = self.metrics.histogram("async_set")
 
         async def patched_async_set(
             sm_self,
@@ -29,46 +131,442 @@ class StateMachineInterceptor:
             force=False,
             context=None,
         ):
+            # Nobody on the .NET side cares → skip gRPC entirely.
+            route = interceptor._route_for(entity_id)
+            if route is None:
+                counters["state.skipped"] += 1
+                return await interceptor._orig_async_set(
+                    sm_self, entity_id, new_state, attributes, force, context
+                )
+
+            # Caused by the bridge itself (see origin.py): a looping entity
+            # skips .NET, a DIRECT write is only observed, never held.
+            via = None
+            if interceptor.origin is not None:
+                via = interceptor.origin.classify(context)
+                if via is not None and not interceptor.origin.admit(entity_id):
+                    return await interceptor._orig_async_set(
+                        sm_self, entity_id, new_state, attributes, force, context
+                    )
+
+            start = perf_counter()
             attrs = attributes or {}
 
-            # Build protobuf request
-            req = StateWriteRequest(
-                entity_id=entity_id,
-                state=str(new_state),
-                attributes_json=json.dumps(attrs),
-                context_id=str(context.id if context else ""),
-            )
+            # Same state and attributes as last sent → nothing new for .NET.
+            skip_unchanged = route.skip_unchanged and not force
+            if skip_unchanged and interceptor.unchanged.is_unchanged(
+                entity_id, new_state, attrs
+            ):
+                counters["state.elided"] += 1
+                latency.record(perf_counter() - start)
+                return await interceptor._orig_async_set(
+                    sm_self, entity_id, new_state, attributes, force, context
+                )
 
-            resp = None
+            # Until it is applied, this write holds back the marker of a
+            # snapshot taken meanwhile (see begin_snapshot).
+            held = interceptor._hold_sequence()
             try:
-                resp = await interceptor.grpc.InterceptStateWrite(req)
-            except Exception as ex:
-                interceptor.hass.logger.error(
-                    "StateMachineInterceptor: gRPC error: %s", ex
+                # Observe only: hand off to the outbox, .NET cannot veto.
+                if route.mode == OBSERVE or via == DIRECT:
+                    if route.mode != OBSERVE:
+                        counters["state.bypassed"] += 1
+                    req = interceptor._build_request(
+                        entity_id, new_state, attrs, context
+                    )
+                    if skip_unchanged:
+                        interceptor.unchanged.remember(entity_id, new_state, attrs)
+                    if interceptor.batcher is not None:
+                        interceptor.batcher.add(req)
+                    else:
+                        await interceptor._enqueue_wait(req)
+                    counters["state.observed"] += 1
+                    latency.record(perf_counter() - start)
+                    return await interceptor._orig_async_set(
+                        sm_self, entity_id, new_state, attributes, force, context
+                    )
+
+                resp, merged = await interceptor._decide(
+                    entity_id, new_state, attrs, context
                 )
 
-            # If .NET vetoes the change → do NOT update HA state
-            if resp and resp.handled:
-                return None
-
-            # If .NET wants to override the state value
-            if resp and resp.override_state:
-                new_state = resp.override_state
-
-            # If .NET wants to override attributes
-            if resp and resp.override_attributes_json:
-                try:
-                    attributes = json.loads(resp.override_attributes_json)
-                except Exception:
-                    interceptor.hass.logger.error(
-                        "StateMachineInterceptor: Invalid override_attributes_json"
-                    )
+                # Only a write .NET saw and HA applies unmodified may be
+                # elided next time; otherwise a repeated write must reach
+                # .NET again.
+                overridden = resp is not None and (
+                    resp.override_state
+                    or merged is not None
+                    or resp.override_attributes_json
+                    or resp.HasField("override_attributes")
+                )
+                if skip_unchanged:
+                    if resp is None or resp.handled or overridden:
+                        interceptor.unchanged.forget(entity_id)
+                    else:
+                        interceptor.unchanged.remember(entity_id, new_state, attrs)
 
-            # Continue normal HA state write
-            return await interceptor._orig_async_set(
-                sm_self, entity_id, new_state, attributes, force, context
-            )
+                # If .NET vetoes the change → do NOT update HA state
+                if resp and resp.handled:
+                    counters["state.vetoed"] += 1
+                    latency.record(perf_counter() - start)
+                    return None
+
+                if overridden:
+                    counters["state.overridden"] += 1
+
+                # If .NET wants to override the state value
+                if resp and resp.override_state:
+                    new_state = resp.override_state
+
+                # If a local rule or .NET wants to override attributes
+                if merged is not None:
+                    attributes = merged
+                elif resp and resp.HasField("override_attributes"):
+                    attributes = decode_map(resp.override_attributes)
+                elif resp and resp.override_attributes_json:
+                    try:
+                        attributes = json.loads(resp.override_attributes_json)
+                    except Exception:
+                        interceptor.hass.logger.error(
+                            "StateMachineInterceptor: Invalid override_attributes_json"
+                        )
+
+                latency.record(perf_counter() - start)
+
+                # Continue normal HA state write
+                return await interceptor._orig_async_set(
+                    sm_self, entity_id, new_state, attributes, force, context
+                )
+            finally:
+                interceptor._release_sequence(held)
 
         # Monkey patch StateMachine.async_set
         StateMachine.async_set = patched_async_set
+        self.outbox.start()
         self.hass.logger.info("net_core_bridge: StateMachine.async_set patched.")
+
+    async def set_original(
+        self, entity_id, new_state, attributes=None, force=False, context=None
+    ):
+        """Apply a write .NET sent us through HA's own async_set, unintercepted."""
+        async_set = self._orig_async_set or StateMachine.async_set
+        return await async_set(
+            self.hass.states, entity_id, new_state, attributes, force, context
+        )
+
+    def diagnostics(self) -> dict:
+        return {
+            "subscriptions": (
+                None if self.subscriptions is None else len(self.subscriptions)
+            ),
+            "typed_payload": self.typed_payload,
+            "outbox": self.outbox.diagnostics(),
+            "observe_transport": "grpc" if self.observe is self.outbox else "shm",
+            "batcher": None
+            if self.batcher is None
+            else {"received": self.batcher.received, "batches": self.batcher.batches},
+            "attribute_deltas": None
+            if self.deltas is None
+            else {"full": self.deltas.full_sent, "delta": self.deltas.delta_sent},
+            "skip_unchanged": {
+                "checked": self.unchanged.checked,
+                "elided": self.unchanged.elided,
+            },
+            "rules": None if self.rules is None else len(self.rules),
+            "decision_cache": {
+                "size": len(self.decisions),
+                "hits": self.decisions.hits,
+                "misses": self.decisions.misses,
+            },
+        }
+
+    # ---------------------------------------------------------
+    # SUBSCRIPTIONS (pushed from .NET over BridgeControl)
+    # ---------------------------------------------------------
+    def set_subscriptions(self, table):
+        """Replace the subscription index from a StateSubscriptionTable."""
+        self.subscriptions = SubscriptionIndex(
+            (sub.domain, sub.entity_globs, StateRoute(sub.mode, sub.skip_unchanged))
+            for sub in table.subscriptions
+        )
+        self.hass.logger.info(
+            "net_core_bridge: %d state subscription(s) registered.",
+            len(self.subscriptions),
+        )
+
+    def _route_for(self, entity_id):
+        """StateRoute for this entity, or None if nobody subscribed."""
+        if self.subscriptions is None:
+            return DEFAULT_ROUTE
+
+        return self.subscriptions.lookup(entity_id.partition(".")[0], entity_id)
+
+    # ---------------------------------------------------------
+    # INTERCEPT PATH
+    # ---------------------------------------------------------
+    async def _decide(self, entity_id, new_state, attrs, context):
+        """.NET's StateWriteResponse for a write: ruled, cached or asked.
+
+        Returns (response, attributes); attributes is set only by a local
+        rule overriding them (see RuleEngine.evaluate_state).
+        """
+        if self.rules is not None:
+            ruled = self.rules.evaluate_state(entity_id, new_state, attrs)
+            if ruled is not None:
+                self._counters["state.ruled"] += 1
+                return ruled
+
+        state = str(new_state)
+
+        if self.decisions:
+            resp = self.decisions.lookup((entity_id, state), (entity_id, None))
+            if resp is not None:
+                self._counters["state.cached"] += 1
+                return resp, None
+
+        req = self._build_request(entity_id, new_state, attrs, context)
+        try:
+            if self.lanes is None:
+                resp = await self._intercept(req)
+            else:
+                resp = await self.lanes.run(
+                    self.lanes.for_entity(entity_id), lambda: self._intercept(req)
+                )
+        except CircuitOpenError:
+            return None, None
+        except LaneUnavailable:
+            self._counters["state.shed"] += 1
+            return None, None
+        except Exception as ex:
+            self._counters["state.errors"] += 1
+            self.hass.logger.error("StateMachineInterceptor: gRPC error: %s", ex)
+            return None, None
+
+        # .NET lost this entity's attribute version → full set next time
+        if resp.resync_attributes and self.deltas is not None:
+            self.deltas.invalidate(entity_id)
+
+        if resp.HasField("cache"):
+            self._cache_decision(entity_id, state, resp)
+
+        return resp, None
+
+    async def _intercept(self, req):
+        return await self.guard.call(
+            "InterceptStateWrite", self.grpc.InterceptStateWrite, req
+        )
+
+    # ---------------------------------------------------------
+    # LOCAL RULES
+    # ---------------------------------------------------------
+    def set_rules(self, rules):
+        """Evaluate a RuleEngine's STATE_WRITE rules locally (None: ask .NET)."""
+        self.rules = rules
+
+    # ---------------------------------------------------------
+    # DECISION CACHE
+    # ---------------------------------------------------------
+    def _cache_decision(self, entity_id, state, resp):
+        hint = resp.cache
+        if not hint.ttl_ms:
+            return
+
+        if hint.scope == CACHE_ENTITY_STATE:
+            self.decisions.put((entity_id, state), hint.ttl_ms, resp)
+        elif hint.scope == CACHE_ENTITY:
+            self.decisions.put((entity_id, None), hint.ttl_ms, resp)
+
+    def invalidate_decisions(self, msg):
+        """InvalidateDecisions from .NET."""
+        if msg.all:
+            self.decisions.invalidate()
+        elif msg.entity_ids:
+            entity_ids = set(msg.entity_ids)
+            self.decisions.invalidate(lambda key: key[0] in entity_ids)
+
+    # ---------------------------------------------------------
+    # REQUEST BUILDING
+    # ---------------------------------------------------------
+    def _build_request(self, entity_id, new_state, attrs, context):
+        self.sequence += 1
+        req = StateWriteRequest(
+            entity_id=entity_id,
+            state=str(new_state),
+            context_id=str(context.id if context else ""),
+            sequence=self.sequence,
+        )
+
+        if self.deltas is None:
+            self._encode_attributes(req, attrs)
+        else:
+            self._fill_delta(req, self.deltas.diff(entity_id, attrs))
+
+        return req
+
+    def _encode_attributes(self, req, attrs):
+        if self.typed_payload:
+            encode_map(attrs, req.attributes)
+        else:
+            req.attributes_json = json.dumps(attrs)
+
+    def _fill_delta(self, req, delta):
+        self._encode_attributes(req, delta.changed)
+        req.attributes_version = delta.version
+        if delta.is_delta:
+            req.attributes_delta = True
+            req.attributes_base_version = delta.base_version
+            req.removed_attributes.extend(delta.removed)
+
+    # ---------------------------------------------------------
+    # ATTRIBUTE DELTAS
+    # ---------------------------------------------------------
+    def enable_attribute_deltas(self, enabled):
+        if enabled and self.deltas is None:
+            self.deltas = AttributeDeltaTracker()
+        elif not enabled:
+            self.deltas = None
+
+    def _on_coalesce(self, req):
+        """A write replaced a pending one (batch or outbox): its delta base is gone."""
+        if not req.attributes_delta:
+            return req
+
+        full = self.deltas.full(req.entity_id) if self.deltas else None
+        if full is None:
+            return req
+
+        req.ClearField("attributes")
+        req.ClearField("attributes_json")
+        req.ClearField("attributes_delta")
+        req.ClearField("attributes_base_version")
+        req.ClearField("removed_attributes")
+        self._fill_delta(req, full)
+        return req
+
+    def resync_attributes(self, msg):
+        """AttributeResync from .NET: re-send full attribute sets now."""
+        if self.deltas is None:
+            return
+
+        if msg.all:
+            self.deltas.invalidate()
+            states = self.hass.states.async_all()
+        else:
+            states = []
+            for entity_id in msg.entity_ids:
+                self.deltas.invalidate(entity_id)
+                state = self.hass.states.get(entity_id)
+                if state is not None:
+                    states.append(state)
+
+        for state in states:
+            if self._route_for(state.entity_id) is None:
+                continue
+            self._enqueue(
+                self._build_request(
+                    state.entity_id, state.state, state.attributes, state.context
+                )
+            )
+
+    # ---------------------------------------------------------
+    # SNAPSHOTS (see snapshot.py)
+    # ---------------------------------------------------------
+    def begin_snapshot(self):
+        """Sequence marker for a snapshot taken now.
+
+        Every write with a higher sequence must be applied on top of the
+        snapshot. A write being decided or queued already has its sequence
+        but is not in HA's states yet, so the marker stops below the oldest
+        of them; a write replayed over a snapshot that includes it is
+        harmless.
+
+        .NET starts over from the snapshot's full attribute sets, so the
+        delta chains are restarted too.
+        """
+        if self.deltas is not None:
+            self.deltas.invalidate()
+        return min(self._held, default=self.sequence)
+
+    def _hold_sequence(self):
+        held = self.sequence
+        self._held[held] = self._held.get(held, 0) + 1
+        return held
+
+    def _release_sequence(self, held):
+        if self._held[held] > 1:
+            self._held[held] -= 1
+        else:
+            del self._held[held]
+
+    def snapshot_request(self, state):
+        """Full StateWriteRequest for one State, without a sequence."""
+        req = StateWriteRequest(
+            entity_id=state.entity_id,
+            state=state.state,
+            context_id=str(state.context.id if state.context else ""),
+        )
+        self._encode_attributes(req, state.attributes)
+        return req
+
+    # ---------------------------------------------------------
+    # OBSERVE PATH (outbox worker)
+    # ---------------------------------------------------------
+    def _enqueue(self, message):
+        """Queue a write or batch; a dropped delta breaks that entity's chain."""
+        if not self.observe.put(message):
+            self._dropped(message)
+
+    async def _enqueue_wait(self, message):
+        """_enqueue(), waiting for room under the outbox's block policy."""
+        if not await self.observe.put_wait(message):
+            self._dropped(message)
+
+    def _dropped(self, message):
+        """.NET never got these writes: neither elide nor diff against them."""
+        writes = message.writes if isinstance(message, StateWriteBatch) else [message]
+        for req in writes:
+            self.unchanged.forget(req.entity_id)
+            if self.deltas is not None:
+                self.deltas.invalidate(req.entity_id)
+
+    def spooling(self):
+        """The spool engaged (see spool.py).
+
+        Each entity's next write is sent in full, so compaction can drop
+        everything spooled before it.
+        """
+        if self.deltas is not None:
+            self.deltas.invalidate()
+
+    async def _send_observed(self, message):
+        """Send a queued StateWriteRequest or StateWriteBatch."""
+        if not isinstance(message, StateWriteBatch):
+            return await self.guard.call(
+                "InterceptStateWrite", self.grpc.InterceptStateWrite, message
+            )
+
+        try:
+            return await self.guard.call(
+                "InterceptStateWriteBatch", self.grpc.InterceptStateWriteBatch, message
+            )
+        except grpc.aio.AioRpcError as ex:
+            if ex.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+
+        # Older .NET peer: stop batching and replay this batch one by one.
+        self.hass.logger.info(
+            "net_core_bridge: InterceptStateWriteBatch not implemented by .NET; "
+            "disabling state write batching."
+        )
+        if self.batcher is not None:
+            self.batcher.flush()
+            self.batcher = None
+
+        for req in message.writes:
+            await self.guard.call(
+                "InterceptStateWrite", self.grpc.InterceptStateWrite, req
+            )
+
+
+def _coalesce_key(message):
+    return message.entity_id if isinstance(message, StateWriteRequest) else None
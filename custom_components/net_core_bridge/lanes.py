@@ -0,0 +1,214 @@
+import asyncio
+import time
+from collections import deque
+
+from .metrics import Metrics
+
+DEFAULT_LANE = "default"
+
+# Per-lane defaults (configuration.yaml keys)
+DEFAULT_PRIORITY = 100
+DEFAULT_CONCURRENCY = 16
+DEFAULT_QUEUE = 256
+DEFAULT_DEADLINE = 5.0
+
+
+class LaneUnavailable(Exception):
+    """The call was shed by its lane: skip .NET and take the HA original path."""
+
+
+class LaneFull(LaneUnavailable):
+    """The lane's queue is full."""
+
+
+class LaneTimeout(LaneUnavailable):
+    """The lane's deadline passed while queued or in flight."""
+
+
+class Lane:
+    """One priority class: its own queue, concurrency budget and deadline."""
+
+    def __init__(
+        self,
+        name,
+        priority=DEFAULT_PRIORITY,
+        concurrency=DEFAULT_CONCURRENCY,
+        queue=DEFAULT_QUEUE,
+        deadline=DEFAULT_DEADLINE,
+    ):
+        self.name = name
+        self.priority = priority
+        self.concurrency = concurrency
+        self.queue = queue
+        self.deadline = deadline
+
+        self.waiting = deque()
+        self.active = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "priority": self.priority,
+            "concurrency": self.concurrency,
+            "deadline_ms": self.deadline * 1000,
+            "active": self.active,
+            "waiting": len(self.waiting),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+
+class PriorityLanes:
+    """Schedule intercepted calls by priority class.
+
+    Calls are classified by event_type or entity domain. A lane runs at
+    most concurrency calls at once and queues up to queue more; beyond
+    that LaneFull is raised, and past the lane deadline (which covers
+    queueing and the RPC) LaneTimeout. Whenever a slot frees up, waiting
+    calls of the highest-priority lane (lowest number) start first.
+    max_in_flight caps all lanes together (None = sum of lane budgets).
+    """
+
+    def __init__(
+        self,
+        lanes,
+        event_types=None,
+        domains=None,
+        max_in_flight=None,
+        metrics: Metrics | None = None,
+    ):
+        self.lanes = {lane.name: lane for lane in lanes}
+        if DEFAULT_LANE not in self.lanes:
+            self.lanes[DEFAULT_LANE] = Lane(DEFAULT_LANE)
+        self.default = self.lanes[DEFAULT_LANE]
+
+        self.by_priority = sorted(self.lanes.values(), key=lambda l: l.priority)
+        self._event_types = {k: self.lanes[v] for k, v in (event_types or {}).items()}
+        self._domains = {k: self.lanes[v] for k, v in (domains or {}).items()}
+
+        self.max_in_flight = max_in_flight or sum(
+            lane.concurrency for lane in self.lanes.values()
+        )
+        self.active = 0
+
+        self.metrics = metrics or Metrics()
+
+    @classmethod
+    def from_config(cls, config, metrics=None):
+        """Build from configuration.yaml's priority_lanes: mapping."""
+        lanes = []
+        event_types = {}
+        domains = {}
+        for name, conf in config.get("lanes", {}).items():
+            lanes.append(
+                Lane(
+                    name,
+                    conf.get("priority", DEFAULT_PRIORITY),
+                    conf.get("concurrency", DEFAULT_CONCURRENCY),
+                    conf.get("queue", DEFAULT_QUEUE),
+                    conf.get("deadline_ms", DEFAULT_DEADLINE * 1000) / 1000,
+                )
+            )
+            event_types.update(dict.fromkeys(conf.get("event_types", ()), name))
+            domains.update(dict.fromkeys(conf.get("domains", ()), name))
+
+        return cls(lanes, event_types, domains, config.get("max_in_flight"), metrics)
+
+    # ---------------------------------------------------------
+    # CLASSIFICATION
+    # ---------------------------------------------------------
+    def for_event(self, event_type, entity_id) -> Lane:
+        lane = self._event_types.get(event_type)
+        if lane is None and entity_id:
+            lane = self._domains.get(entity_id.partition(".")[0])
+        return lane or self.default
+
+    def for_entity(self, entity_id) -> Lane:
+        return self._domains.get(entity_id.partition(".")[0], self.default)
+
+    # ---------------------------------------------------------
+    # SCHEDULING
+    # ---------------------------------------------------------
+    def _can_start(self, lane) -> bool:
+        return lane.active < lane.concurrency and self.active < self.max_in_flight
+
+    async def run(self, lane, call):
+        """Await call() inside lane's budget, deadline and queue."""
+        start = time.monotonic()
+
+        if lane.waiting or not self._can_start(lane):
+            if len(lane.waiting) >= lane.queue:
+                lane.rejected += 1
+                raise LaneFull(lane.name)
+
+            fut = asyncio.get_running_loop().create_future()
+            lane.waiting.append(fut)
+            try:
+                await asyncio.wait_for(fut, lane.deadline)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as err:
+                if fut.done() and not fut.cancelled():
+                    # A slot was granted just as we gave up; hand it on.
+                    self._release(lane)
+                else:
+                    _discard(lane.waiting, fut)
+                if isinstance(err, asyncio.TimeoutError):
+                    lane.timeouts += 1
+                    raise LaneTimeout(lane.name) from None
+                raise
+            # _dispatch already counted us as active.
+        else:
+            lane.active += 1
+            self.active += 1
+
+        waited = time.monotonic() - start
+        self.metrics.histogram("lane_wait", lane.name).record(waited)
+
+        try:
+            async with asyncio.timeout(max(0.0, lane.deadline - waited)) as budget:
+                return await call()
+        except TimeoutError:
+            # Only the lane's own deadline is a LaneTimeout; a timeout
+            # raised by the call itself is the caller's to handle.
+            if not budget.expired():
+                raise
+            lane.timeouts += 1
+            raise LaneTimeout(lane.name) from None
+        finally:
+            lane.completed += 1
+            self._release(lane)
+
+    def _release(self, lane):
+        lane.active -= 1
+        self.active -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """Hand free slots to waiting calls, highest priority first."""
+        for lane in self.by_priority:
+            while lane.waiting and self._can_start(lane):
+                fut = lane.waiting.popleft()
+                if fut.done():
+                    continue
+                lane.active += 1
+                self.active += 1
+                fut.set_result(True)
+            if self.active >= self.max_in_flight:
+                return
+
+    def diagnostics(self) -> dict:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "active": self.active,
+            "lanes": {name: lane.as_dict() for name, lane in self.lanes.items()},
+        }
+
+
+def _discard(waiting, fut):
+    try:
+        waiting.remove(fut)
+    except ValueError:
+        pass
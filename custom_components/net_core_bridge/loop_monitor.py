@@ -0,0 +1,165 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+from .metrics import Metrics
+
+DEFAULT_INTERVAL = 0.05
+DEFAULT_THRESHOLD = 0.1
+
+# Recent stalls kept for diagnostics
+MAX_STALLS = 20
+
+# Innermost frames kept per stall sample
+STACK_DEPTH = 8
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class LoopLagMonitor:
+    """Measure event loop scheduling delay and attribute stalls.
+
+    A heartbeat task sleeps interval seconds and records how late it woke
+    up in the "loop_lag" histogram. A watchdog thread notices a heartbeat
+    that is more than threshold overdue while the loop is still blocked,
+    and samples the loop thread's stack plus the bridge RPCs in flight.
+    When the loop recovers the stall is logged and kept in stalls.
+    """
+
+    def __init__(
+        self,
+        hass,
+        guard,
+        metrics: Metrics | None = None,
+        interval=DEFAULT_INTERVAL,
+        threshold=DEFAULT_THRESHOLD,
+    ):
+        self.hass = hass
+        self.guard = guard
+        self.metrics = metrics or Metrics()
+        self.interval = interval
+        self.threshold = threshold
+
+        self.stalls = deque(maxlen=MAX_STALLS)
+
+        self._lag = self.metrics.histogram("loop_lag")
+        self._beat = 0.0
+        self._sample = None
+        self._loop_thread = None
+        self._task = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = self.hass.async_create_background_task(
+            self._heartbeat(), "net_core_bridge loop monitor"
+        )
+        threading.Thread(
+            target=self._watchdog, name="net_core_bridge-loop-watchdog", daemon=True
+        ).start()
+
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # ---------------------------------------------------------
+    # LOOP SIDE
+    # ---------------------------------------------------------
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            self._beat = expected
+            await asyncio.sleep(self.interval)
+
+            lag = max(0.0, time.monotonic() - expected)
+            self._lag.record(lag)
+            if lag >= self.threshold:
+                self._report(lag)
+            else:
+                self._sample = None
+
+    def _report(self, lag):
+        sample, self._sample = self._sample, None
+        stall = {
+            "at": time.time(),
+            "lag_ms": lag * 1000,
+            "blocked_in_bridge": False,
+            "bridge_on_stack": False,
+            "stack": [],
+            "in_flight": [],
+        }
+        if sample is not None:
+            stall.update(sample)
+
+        self.stalls.append(stall)
+        self.metrics.counters["loop.stalls"] += 1
+        if stall["blocked_in_bridge"]:
+            self.metrics.counters["loop.stalls_in_bridge"] += 1
+
+        where = stall["stack"][0] if stall["stack"] else "unknown"
+        self.hass.logger.warning(
+            "net_core_bridge: event loop stalled %.0fms (in bridge: %s, "
+            "at %s, %d bridge RPCs in flight).",
+            stall["lag_ms"],
+            stall["blocked_in_bridge"],
+            where,
+            len(stall["in_flight"]),
+        )
+
+    # ---------------------------------------------------------
+    # WATCHDOG THREAD
+    # ---------------------------------------------------------
+    def _watchdog(self):
+        check = self.interval / 2
+        while not self._stop.wait(check):
+            overdue = time.monotonic() - self._beat
+            if overdue >= self.threshold and self._sample is None:
+                try:
+                    self._sample = self._capture()
+                except Exception:
+                    # Sampling is best-effort; never kill the watchdog.
+                    pass
+
+    def _capture(self):
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = []
+        blocked_in_bridge = None
+        bridge_on_stack = False
+        while frame is not None:
+            ours = frame.f_code.co_filename.startswith(_PACKAGE_DIR)
+            if blocked_in_bridge is None:
+                blocked_in_bridge = ours
+            bridge_on_stack = bridge_on_stack or ours
+            if len(stack) < STACK_DEPTH:
+                stack.append(
+                    f"{os.path.basename(frame.f_code.co_filename)}:"
+                    f"{frame.f_lineno} {frame.f_code.co_name}"
+                )
+            frame = frame.f_back
+
+        return {
+            # Innermost Python frame is ours: bridge code (or a C call it
+            # made, e.g. json.dumps) was blocking. Otherwise the bridge may
+            # only be an outer caller, e.g. around HA's original async_set.
+            "blocked_in_bridge": bool(blocked_in_bridge),
+            "bridge_on_stack": bridge_on_stack,
+            "stack": stack,
+            "in_flight": self.guard.in_flight_calls(),
+        }
+
+    def diagnostics(self) -> dict:
+        return {
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+            "lag": self._lag.as_dict(),
+            "stalls": list(self.stalls),
+        }
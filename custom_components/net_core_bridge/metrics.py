@@ -0,0 +1,104 @@
+from collections import Counter
+
+# Log-linear buckets: values below 2**SUB_BITS µs are exact, above that
+# every power of two is split into 2**SUB_BITS buckets (~6% resolution).
+SUB_BITS = 4
+SUB_COUNT = 1 << SUB_BITS
+SUB_MASK = SUB_COUNT - 1
+BUCKETS = 28 * SUB_COUNT  # covers > 60 s
+
+# Distinct labels kept per histogram family; the rest share OTHER.
+MAX_LABELS = 256
+OTHER = "(other)"
+
+
+class Histogram:
+    """HDR-style latency histogram with microsecond resolution."""
+
+    __slots__ = ("counts", "count", "max_us")
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.max_us = 0
+
+    def record(self, seconds):
+        us = int(seconds * 1e6)
+        if us < SUB_COUNT:
+            i = us
+        else:
+            exp = us.bit_length() - SUB_BITS - 1
+            i = ((exp + 1) << SUB_BITS) | ((us >> exp) & SUB_MASK)
+            if i >= BUCKETS:
+                i = BUCKETS - 1
+        self.counts[i] += 1
+        self.count += 1
+        if us > self.max_us:
+            self.max_us = us
+
+    def percentile(self, pct) -> float:
+        """Upper bound (µs) of the bucket holding the pct-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(pct / 100 * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return float(min(_upper(i), self.max_us))
+        return float(self.max_us)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(50) / 1000,
+            "p95_ms": self.percentile(95) / 1000,
+            "p99_ms": self.percentile(99) / 1000,
+            "max_ms": self.max_us / 1000,
+        }
+
+
+def _upper(i):
+    if i < SUB_COUNT:
+        return i
+    exp = (i >> SUB_BITS) - 1
+    return (((i & SUB_MASK) | SUB_COUNT) << exp) + (1 << exp) - 1
+
+
+class Metrics:
+    """Histograms and counters shared by every interceptor.
+
+    Histograms are keyed by (name, label), e.g. ("async_fire", event_type)
+    or ("rpc", "InterceptEvent"); label None is the family total. Callers
+    on the hot path fetch the Histogram once and call record() directly.
+    Gauges are callables read only when a snapshot is taken, e.g. queue
+    depths.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = Counter()
+        self.gauges = {}
+        self._labels = Counter()
+
+    def histogram(self, name, label=None) -> Histogram:
+        key = (name, label)
+        hist = self.histograms.get(key)
+        if hist is None:
+            if label is not None and label != OTHER:
+                if self._labels[name] >= MAX_LABELS:
+                    return self.histogram(name, OTHER)
+                self._labels[name] += 1
+            hist = self.histograms[key] = Histogram()
+        return hist
+
+    def snapshot(self) -> dict:
+        families = {}
+        for (name, label), hist in self.histograms.items():
+            family = families.setdefault(name, {})
+            family["total" if label is None else label] = hist.as_dict()
+        return {
+            "histograms": families,
+            "counters": dict(self.counters),
+            "gauges": {name: read() for name, read in self.gauges.items()},
+        }
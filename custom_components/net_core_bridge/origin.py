@@ -0,0 +1,136 @@
+import time
+
+from homeassistant.core import Context
+
+from .metrics import Metrics
+
+# What classify() makes of a context
+DIRECT = "direct"  # applied by the bridge for .NET, or in the same context
+ECHO = "echo"  # caused by such a write (e.g. an automation it triggered)
+
+# Bridge context ids remembered to recognise echoes
+RECENT_CONTEXTS = 4096
+
+# Loop-guard keys tracked before idle ones are pruned
+MAX_KEYS = 4096
+
+# More than max_writes bridge-related writes / events for one key within
+# window seconds is taken as a feedback loop; the key is then kept away
+# from .NET until it has been quiet for hold seconds.
+DEFAULT_LOOP_MAX_WRITES = 20
+DEFAULT_LOOP_WINDOW = 1.0
+DEFAULT_LOOP_HOLD = 5.0
+
+
+class BridgeOrigin:
+    """Recognise traffic the bridge itself caused, in O(1).
+
+    The bridge owns a root Context. Whatever the CommandChannel applies
+    for .NET runs in a child of it (context()), and HA carries that
+    context along: a service call .NET fires writes its entities' states
+    with it. Such DIRECT writes and events are never held for a .NET
+    decision, so .NET's own calls cannot re-enter interception.
+
+    An ECHO is one step further: a context whose parent is a bridge
+    context, such as an automation triggered by .NET's write. Echoes are
+    intercepted as usual, but DIRECT and ECHO traffic is counted per key
+    (entity_id, or event type) to detect loops through .NET.
+    """
+
+    def __init__(
+        self,
+        hass,
+        metrics: Metrics | None = None,
+        max_writes=DEFAULT_LOOP_MAX_WRITES,
+        window=DEFAULT_LOOP_WINDOW,
+        hold=DEFAULT_LOOP_HOLD,
+    ):
+        self.hass = hass
+        self.root = Context()
+        self.id = self.root.id
+
+        self.max_writes = max_writes
+        self.window = window
+        self.hold = hold
+
+        self.metrics = metrics or Metrics()
+        self._counters = self.metrics.counters
+
+        # Bridge context ids, oldest first (dicts keep insertion order).
+        self._recent = {}
+
+        # key -> [window start, hits, held until]
+        self._keys = {}
+        self._prune_at = MAX_KEYS
+
+        self.loops = 0
+
+    def context(self, context_id=None) -> Context:
+        """A bridge-owned Context, with .NET's id if it sent one."""
+        context = Context(parent_id=self.id, id=context_id or None)
+        self._recent[context.id] = None
+        if len(self._recent) > RECENT_CONTEXTS:
+            del self._recent[next(iter(self._recent))]
+        return context
+
+    def classify(self, context):
+        """DIRECT, ECHO, or None for traffic the bridge had no part in."""
+        parent = context.parent_id if context is not None else None
+        if parent is None:
+            return None
+        if parent == self.id:
+            return DIRECT
+        if parent in self._recent:
+            return ECHO
+        return None
+
+    def admit(self, key) -> bool:
+        """Count bridge-related traffic for key; False while it is looping."""
+        now = time.monotonic()
+        entry = self._keys.get(key)
+        if entry is None or now - entry[0] >= self.window:
+            if entry is None and len(self._keys) >= self._prune_at:
+                self._prune(now)
+            entry = self._keys[key] = [now, 0, entry[2] if entry else 0.0]
+        entry[1] += 1
+
+        if entry[1] > self.max_writes:
+            if entry[2] <= now:
+                self.loops += 1
+                self._counters["origin.loops"] += 1
+                self.hass.logger.warning(
+                    "net_core_bridge: feedback loop through .NET on %s "
+                    "(%d writes in %.1fs); not forwarding it for %.1fs.",
+                    key,
+                    entry[1],
+                    now - entry[0],
+                    self.hold,
+                )
+            # Count afresh: a loop still going during the hold extends it.
+            entry[:] = [now, 0, now + self.hold]
+
+        if entry[2] > now:
+            self._counters["origin.suppressed"] += 1
+            return False
+        return True
+
+    def _prune(self, now):
+        """Forget keys whose window has passed and that are not held."""
+        self._keys = {
+            key: entry
+            for key, entry in self._keys.items()
+            if now - entry[0] < self.window or entry[2] > now
+        }
+        # Still all live: drop the oldest rather than grow without bound.
+        while len(self._keys) >= MAX_KEYS:
+            del self._keys[next(iter(self._keys))]
+        # Amortised: the next prune waits for as many new keys again.
+        self._prune_at = max(MAX_KEYS // 2, len(self._keys)) + MAX_KEYS // 2
+
+    def diagnostics(self) -> dict:
+        now = time.monotonic()
+        return {
+            "context_id": self.id,
+            "loops": self.loops,
+            "looping": sorted(str(k) for k, e in self._keys.items() if e[2] > now),
+        }
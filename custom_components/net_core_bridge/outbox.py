@@ -0,0 +1,258 @@
+import asyncio
+import time
+from collections import deque
+
+import grpc
+
+from .metrics import Metrics
+from .rpc_guard import CircuitOpenError
+
+DEFAULT_MAXSIZE = 1000
+DEFAULT_BLOCK_TIMEOUT = 1.0
+
+# Overflow policies (configuration.yaml, outbox: <service>: policy:)
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+
+POLICIES = (DROP_NEWEST, DROP_OLDEST, COALESCE, BLOCK)
+
+
+class Outbox:
+    """Bounded fire-and-forget queue for messages HA does not wait on.
+
+    HA's hot path only calls put(), which never awaits. A single background
+    worker drains the queue in order and performs the RPC. When .NET falls
+    behind and the queue holds maxsize messages, policy decides:
+
+    drop_newest  the new message is dropped (default)
+    drop_oldest  the oldest queued message is evicted for the new one
+    coalesce     a message whose key(message) is already queued replaces
+                 it in place (on_replace may rewrite it); else drop_newest
+    block        put_wait() waits up to block_timeout for room, then drops
+
+    Every lost message is counted; on_evict(message) is called for ones
+    evicted after put() had accepted them. With a spool (a SpoolTap, see
+    spool.py) the worker writes messages to disk instead of sending them
+    while .NET is unavailable.
+    """
+
+    def __init__(
+        self,
+        hass,
+        name,
+        send,
+        maxsize=DEFAULT_MAXSIZE,
+        policy=DROP_NEWEST,
+        key=None,
+        on_replace=None,
+        on_evict=None,
+        metrics: Metrics | None = None,
+        label=None,
+    ):
+        self.hass = hass
+        self.name = name
+        self._send = send
+        self._key = key
+        self._on_replace = on_replace
+        self._on_evict = on_evict
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = DEFAULT_BLOCK_TIMEOUT
+
+        # [key, message] entries; coalescing rewrites entry[1] in place.
+        self._queue = deque()
+        self._pending = {}
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._task = None
+        self._busy = False
+
+        # Optional SpoolTap, set by the bridge.
+        self.spool = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.coalesced = 0
+        self.blocked = 0
+        self.errors = 0
+        self.rejected = 0
+        self.spooled = 0
+        self.high_water = 0
+
+        # Bridge-wide counters and a depth gauge, e.g. outbox.event.*
+        self._counters = None
+        if metrics is not None and label is not None:
+            self._counters = metrics.counters
+            self._prefix = f"outbox.{label}"
+            metrics.gauges[f"{self._prefix}.depth"] = lambda: self.depth
+
+    def configure(self, maxsize=None, policy=None, block_timeout=None):
+        """Apply configuration.yaml settings; unknown policies are rejected."""
+        if policy is not None:
+            if policy not in POLICIES:
+                raise ValueError(f"unknown outbox policy {policy!r}")
+            self.policy = policy
+        if maxsize is not None:
+            self.maxsize = max(1, int(maxsize))
+        if block_timeout is not None:
+            self.block_timeout = block_timeout
+
+    def start(self):
+        if self._task is None:
+            # Long-lived worker: must not hold up HA startup.
+            self._task = self.hass.async_create_background_task(
+                self._run(), f"net_core_bridge {self.name} outbox"
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def diagnostics(self) -> dict:
+        return {
+            "policy": self.policy,
+            "maxsize": self.maxsize,
+            "depth": self.depth,
+            "high_water": self.high_water,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+            "coalesced": self.coalesced,
+            "blocked": self.blocked,
+            "rejected": self.rejected,
+            "spooled": self.spooled,
+            "errors": self.errors,
+        }
+
+    # ---------------------------------------------------------
+    # PRODUCERS
+    # ---------------------------------------------------------
+    def put(self, message) -> bool:
+        """Queue a message without blocking. Returns False if it was dropped."""
+        key = None
+        if self.policy == COALESCE and self._key is not None:
+            key = self._key(message)
+            entry = self._pending.get(key) if key is not None else None
+            if entry is not None:
+                if self._on_replace is not None:
+                    message = self._on_replace(message)
+                entry[1] = message
+                self.coalesced += 1
+                self._count("coalesced")
+                return True
+
+        if len(self._queue) >= self.maxsize:
+            if self.policy != DROP_OLDEST:
+                self.dropped += 1
+                self._count("dropped")
+                return False
+            self._evict()
+
+        entry = [key, message]
+        self._queue.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        if len(self._queue) > self.high_water:
+            self.high_water = len(self._queue)
+        self._ready.set()
+        return True
+
+    async def put_wait(self, message) -> bool:
+        """put(), but under the block policy wait for room first."""
+        if self.policy == BLOCK and len(self._queue) >= self.maxsize:
+            self.blocked += 1
+            self._count("blocked")
+            deadline = time.monotonic() + self.block_timeout
+            while len(self._queue) >= self.maxsize:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._space.clear()
+                try:
+                    await asyncio.wait_for(self._space.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        return self.put(message)
+
+    def _evict(self):
+        key, message = self._queue.popleft()
+        if key is not None:
+            self._pending.pop(key, None)
+        self.evicted += 1
+        self.dropped += 1
+        self._count("dropped")
+        if self._on_evict is not None:
+            self._on_evict(message)
+
+    def _count(self, what):
+        if self._counters is not None:
+            self._counters[f"{self._prefix}.{what}"] += 1
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def idle(self) -> bool:
+        """Nothing queued and nothing being sent."""
+        return not self._queue and not self._busy
+
+    # ---------------------------------------------------------
+    # WORKER
+    # ---------------------------------------------------------
+    async def _run(self):
+        while True:
+            self._busy = False
+            while not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+
+            self._busy = True
+            key, message = self._queue.popleft()
+            if key is not None:
+                self._pending.pop(key, None)
+            self._space.set()
+
+            # A spool backlog is replayed first, so later messages follow it.
+            if self.spool is not None and self.spool.active():
+                self._spool(message)
+                continue
+
+            try:
+                await self._send(message)
+                self.sent += 1
+            except asyncio.CancelledError:
+                raise
+            except CircuitOpenError:
+                # .NET is down; the breaker already logged it once.
+                if not self._spool(message):
+                    self.rejected += 1
+            except grpc.aio.AioRpcError as ex:
+                if ex.code() == grpc.StatusCode.UNAVAILABLE and self._spool(message):
+                    continue
+                self.errors += 1
+                self.hass.logger.error(
+                    "net_core_bridge: %s outbox gRPC error: %s", self.name, ex
+                )
+            except Exception as ex:
+                self.errors += 1
+                self.hass.logger.error(
+                    "net_core_bridge: %s outbox gRPC error: %s", self.name, ex
+                )
+
+    def _spool(self, message) -> bool:
+        """Hand a message to the spool; False if there is none."""
+        if self.spool is None:
+            return False
+        if self.spool.put(message):
+            self.spooled += 1
+            self._count("spooled")
+            return True
+        self.dropped += 1
+        self._count("dropped")
+        return True
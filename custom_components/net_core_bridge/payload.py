@@ -0,0 +1,161 @@
+import datetime as dt
+from collections.abc import Mapping
+from enum import Enum
+
+from .clients.payload_pb2 import ValueMap
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+# ---------------------------------------------------------
+# ENCODE
+# ---------------------------------------------------------
+def _enc_none(v, out):
+    out.null_value = True
+
+
+def _enc_bool(v, out):
+    out.bool_value = v
+
+
+def _enc_int(v, out):
+    try:
+        out.int_value = v
+    except ValueError:
+        # Outside int64: degrade to double like JSON consumers would.
+        out.double_value = v
+
+
+def _enc_float(v, out):
+    out.double_value = v
+
+
+def _enc_str(v, out):
+    out.string_value = v
+
+
+def _enc_bytes(v, out):
+    out.bytes_value = v
+
+
+def _enc_datetime(v, out):
+    if v.tzinfo is None:
+        v = v.replace(tzinfo=dt.timezone.utc)
+    delta = v - _EPOCH
+    out.timestamp_us = (
+        delta.days * 86_400_000_000 + delta.seconds * 1_000_000 + delta.microseconds
+    )
+
+
+def _enc_iterable(v, out):
+    values = out.list_value.values
+    for item in v:
+        encode_value(item, values.add())
+    if not v:
+        # Make an empty list distinguishable from an unset value.
+        out.list_value.SetInParent()
+
+
+def _enc_mapping(v, out):
+    encode_map(v, out.map_value)
+    if not v:
+        out.map_value.SetInParent()
+
+
+# Exact-type dispatch: one dict lookup for the common cases.
+_ENCODERS = {
+    type(None): _enc_none,
+    bool: _enc_bool,
+    int: _enc_int,
+    float: _enc_float,
+    str: _enc_str,
+    bytes: _enc_bytes,
+    dt.datetime: _enc_datetime,
+    list: _enc_iterable,
+    tuple: _enc_iterable,
+    set: _enc_iterable,
+    frozenset: _enc_iterable,
+    dict: _enc_mapping,
+}
+
+
+def _enc_enum(v, out):
+    encode_value(v.value, out)
+
+
+def _enc_isoformat(v, out):
+    out.string_value = v.isoformat()
+
+
+def _enc_timedelta(v, out):
+    out.double_value = v.total_seconds()
+
+
+def _enc_fallback(v, out):
+    out.string_value = str(v)
+
+
+def _resolve(tp):
+    """Pick an encoder for a type not in _ENCODERS (subclasses, HA types)."""
+    if issubclass(tp, Enum):
+        return _enc_enum
+    if issubclass(tp, bool):
+        return _enc_bool
+    if issubclass(tp, int):
+        return lambda v, out: _enc_int(int(v), out)
+    if issubclass(tp, float):
+        return lambda v, out: _enc_float(float(v), out)
+    if issubclass(tp, str):
+        return lambda v, out: _enc_str(str(v), out)
+    if issubclass(tp, dt.datetime):
+        return _enc_datetime
+    if issubclass(tp, (dt.date, dt.time)):
+        return _enc_isoformat
+    if issubclass(tp, dt.timedelta):
+        return _enc_timedelta
+    if issubclass(tp, Mapping):
+        return _enc_mapping
+    if issubclass(tp, (list, tuple, set, frozenset)):
+        return _enc_iterable
+    return _enc_fallback
+
+
+def encode_value(v, out):
+    """Write a Python value into the Value message out."""
+    tp = type(v)
+    encoder = _ENCODERS.get(tp)
+    if encoder is None:
+        # Resolved once per type (StrEnum, ReadOnlyDict, ...), then cached.
+        encoder = _ENCODERS[tp] = _resolve(tp)
+    encoder(v, out)
+
+
+def encode_map(data, out: ValueMap):
+    """Write a str-keyed mapping into the ValueMap out.
+
+    Each value is its own protobuf message, so this costs about twice
+    json.dumps for the same attributes; it buys types JSON cannot carry.
+    """
+    fields = out.fields
+    for key, v in data.items():
+        encode_value(v, fields[str(key)])
+
+
+# ---------------------------------------------------------
+# DECODE
+# ---------------------------------------------------------
+def decode_value(value):
+    kind = value.WhichOneof("kind")
+    if kind is None or kind == "null_value":
+        return None
+    if kind == "list_value":
+        return [decode_value(v) for v in value.list_value.values]
+    if kind == "map_value":
+        return decode_map(value.map_value)
+    if kind == "timestamp_us":
+        return _EPOCH + dt.timedelta(microseconds=value.timestamp_us)
+    return getattr(value, kind)
+
+
+def decode_map(value_map: ValueMap) -> dict:
+    return {key: decode_value(v) for key, v in value_map.fields.items()}
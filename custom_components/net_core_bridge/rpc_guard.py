@@ -0,0 +1,270 @@
+import asyncio
+import time
+import grpc
+
+from .metrics import Metrics
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Only transport-level failures say ".NET is down or stalled".
+_BREAKER_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.UNKNOWN,
+        grpc.StatusCode.INTERNAL,
+    }
+)
+
+SAMPLE_WINDOW = 256
+MIN_SAMPLES = 20
+RECOMPUTE_EVERY = 32
+
+
+class CircuitOpenError(Exception):
+    """The breaker is open: skip .NET and take the HA original path."""
+
+
+class MethodStats:
+    """Rolling latency window and derived deadline for one RPC method."""
+
+    def __init__(self, guard):
+        self._guard = guard
+        self._samples = [0.0] * SAMPLE_WINDOW
+        self._count = 0
+
+        self.deadline = guard.initial_timeout
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+
+    def record(self, latency):
+        self._samples[self._count % SAMPLE_WINDOW] = latency
+        self._count += 1
+        if self._count >= MIN_SAMPLES and self._count % RECOMPUTE_EVERY == 0:
+            self._recompute()
+
+    def percentile(self, pct):
+        n = min(self._count, SAMPLE_WINDOW)
+        if not n:
+            return 0.0
+        window = sorted(self._samples[:n])
+        return window[min(n - 1, int(pct / 100 * n))]
+
+    def _recompute(self):
+        g = self._guard
+        target = self.percentile(g.percentile) * g.deadline_factor
+        self.deadline = min(g.max_timeout, max(g.min_timeout, target))
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "deadline_ms": self.deadline * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+        }
+
+
+class RpcGuard:
+    """Deadlines and a circuit breaker shared by every interceptor RPC.
+
+    Each method gets a deadline of percentile latency × deadline_factor,
+    clamped to [min_timeout, max_timeout]. After failure_threshold
+    consecutive transport failures the breaker opens and calls fail fast
+    with CircuitOpenError. After reset_timeout one half-open probe is let
+    through; its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        hass,
+        initial_timeout=1.0,
+        min_timeout=0.25,
+        max_timeout=5.0,
+        percentile=99,
+        deadline_factor=3.0,
+        failure_threshold=5,
+        reset_timeout=10.0,
+        metrics: Metrics | None = None,
+    ):
+        self.hass = hass
+        self.metrics = metrics or Metrics()
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.percentile = percentile
+        self.deadline_factor = deadline_factor
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.methods = {}
+        # token → (method, request, start) for RPCs awaiting .NET
+        self._in_flight = {}
+        self._token = 0
+        self.rejected = 0
+        self.trips = 0
+
+    def _stats(self, method):
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = MethodStats(self)
+        return stats
+
+    # ---------------------------------------------------------
+    # BREAKER
+    # ---------------------------------------------------------
+    def _admit(self):
+        """Raise CircuitOpenError unless a call may go out now."""
+        if self.state == CLOSED:
+            return False
+
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError()
+            self.state = HALF_OPEN
+
+        # HALF_OPEN: a single probe at a time.
+        if self._probe_in_flight:
+            self.rejected += 1
+            raise CircuitOpenError()
+        self._probe_in_flight = True
+        return True
+
+    def _on_success(self, probe):
+        self._consecutive_failures = 0
+        if probe:
+            self._probe_in_flight = False
+            self.state = CLOSED
+            self.hass.logger.info(
+                "net_core_bridge: .NET reachable again; breaker closed."
+            )
+
+    def _on_failure(self, probe):
+        self._consecutive_failures += 1
+        if probe:
+            self._probe_in_flight = False
+            self._trip()
+        elif (
+            self.state == CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._trip()
+
+    def _trip(self):
+        if self.state != OPEN:
+            self.trips += 1
+            self.hass.logger.warning(
+                "net_core_bridge: .NET not responding; breaker open for %gs.",
+                self.reset_timeout,
+            )
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    # ---------------------------------------------------------
+    # CALL
+    # ---------------------------------------------------------
+    async def call(self, method, rpc, request):
+        """Run rpc(request, timeout=...) under the breaker and adaptive deadline.
+
+        rpc is a grpc.aio multi-callable or any coroutine function accepting
+        a timeout keyword.
+        """
+        probe = self._admit()
+        stats = self._stats(method)
+        stats.calls += 1
+
+        counters = self.metrics.counters
+        counters["rpc.calls"] += 1
+        counters["rpc.bytes_sent"] += request.ByteSize()
+
+        self._token += 1
+        token = self._token
+        start = time.perf_counter()
+        self._in_flight[token] = (method, request, start)
+        try:
+            resp = await rpc(request, timeout=stats.deadline)
+
+        except asyncio.CancelledError:
+            if probe:
+                self._probe_in_flight = False
+            raise
+
+        except grpc.aio.AioRpcError as ex:
+            counters["rpc.errors"] += 1
+            if ex.code() in _BREAKER_CODES:
+                stats.failures += 1
+                if ex.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    stats.timeouts += 1
+                self._on_failure(probe)
+            else:
+                # .NET answered, even if with an error: it is alive.
+                self._on_success(probe)
+            raise
+
+        except (asyncio.TimeoutError, ConnectionError) as ex:
+            counters["rpc.errors"] += 1
+            stats.failures += 1
+            if isinstance(ex, asyncio.TimeoutError):
+                stats.timeouts += 1
+            self._on_failure(probe)
+            raise
+
+        except Exception:
+            # Not a transport failure; just release the probe slot.
+            counters["rpc.errors"] += 1
+            if probe:
+                self._probe_in_flight = False
+            raise
+
+        finally:
+            del self._in_flight[token]
+
+        latency = time.perf_counter() - start
+        stats.record(latency)
+        self.metrics.histogram("rpc", method).record(latency)
+        self._on_success(probe)
+        return resp
+
+    # ---------------------------------------------------------
+    # DIAGNOSTICS
+    # ---------------------------------------------------------
+    def in_flight_calls(self) -> list:
+        """RPCs currently awaiting .NET, oldest first, with what they carry."""
+        now = time.perf_counter()
+        calls = []
+        for method, request, start in list(self._in_flight.values()):
+            calls.append(
+                {
+                    "method": method,
+                    "event_type": getattr(request, "event_type", ""),
+                    "entity_id": getattr(request, "entity_id", ""),
+                    "age_ms": (now - start) * 1000,
+                }
+            )
+        return calls
+
+    def diagnostics(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "in_flight": len(self._in_flight),
+            "methods": {name: s.as_dict() for name, s in self.methods.items()},
+        }
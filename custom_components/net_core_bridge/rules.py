@@ -0,0 +1,270 @@
+import fnmatch
+import operator
+import re
+from collections import Counter
+from datetime import datetime
+
+from .clients.event_interceptor_pb2 import EventResponse
+from .clients.rules_pb2 import (
+    ALLOW,
+    ASK,
+    EQ,
+    EVENT,
+    EXISTS,
+    GE,
+    GT,
+    IN,
+    LE,
+    LT,
+    MISSING,
+    NE,
+    OVERRIDE,
+    STATE_WRITE,
+    VETO,
+)
+from .clients.state_interceptor_pb2 import StateWriteResponse
+from .payload import decode_map, decode_value
+from .subscriptions import WILDCARD
+
+_MISSING = object()
+
+_COMPARE = {
+    GT: operator.gt,
+    GE: operator.ge,
+    LT: operator.lt,
+    LE: operator.le,
+}
+
+
+# ---------------------------------------------------------
+# Conditions
+# ---------------------------------------------------------
+def _resolve(obj, path):
+    """Follow a dotted path through dicts and objects (e.g. State)."""
+    for part in path:
+        if isinstance(obj, dict):
+            obj = obj.get(part, _MISSING)
+        else:
+            obj = getattr(obj, part, _MISSING)
+        if obj is _MISSING:
+            break
+    return obj
+
+
+def _coerce(actual, expected):
+    """Compare HA's string states / attributes against numeric rule values."""
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        if isinstance(actual, str):
+            return float(actual)
+    return actual
+
+
+def _compile_condition(cond):
+    path = tuple(cond.field.split("."))
+    op = cond.op
+    expected = decode_value(cond.value)
+
+    if op == EXISTS:
+        return lambda root: _resolve(root, path) is not _MISSING
+    if op == MISSING:
+        return lambda root: _resolve(root, path) is _MISSING
+    if op == IN:
+        choices = tuple(expected or ())
+        return lambda root: _resolve(root, path) in choices
+
+    def check(root):
+        actual = _resolve(root, path)
+        if actual is _MISSING:
+            return False
+        try:
+            actual = _coerce(actual, expected)
+            if op == EQ:
+                return actual == expected
+            if op == NE:
+                return actual != expected
+            return _COMPARE[op](actual, expected)
+        except (TypeError, ValueError, KeyError):
+            # Not comparable (e.g. "unavailable" > 200): the rule does not hold.
+            return False
+
+    return check
+
+
+def _in_window(window, now):
+    start, end = window
+    minute = now.hour * 60 + now.minute
+    if start <= end:
+        return start <= minute < end
+    return minute >= start or minute < end
+
+
+# ---------------------------------------------------------
+# Compiled rule
+# ---------------------------------------------------------
+class CompiledRule:
+    __slots__ = (
+        "order",
+        "id",
+        "regex",
+        "window",
+        "conditions",
+        "decision",
+        "override_state",
+        "set_attributes",
+    )
+
+    def __init__(self, order, rule):
+        self.order = order
+        self.id = rule.id or f"#{order}"
+        self.regex = (
+            re.compile("|".join(fnmatch.translate(g) for g in rule.entity_globs))
+            if rule.entity_globs
+            else None
+        )
+        self.window = (
+            (rule.time_window.start_minute, rule.time_window.end_minute)
+            if rule.HasField("time_window")
+            else None
+        )
+        self.conditions = tuple(_compile_condition(c) for c in rule.conditions)
+        self.decision = rule.action.decision
+        self.override_state = rule.action.override_state
+        self.set_attributes = (
+            decode_map(rule.action.set_attributes)
+            if rule.action.HasField("set_attributes")
+            else None
+        )
+
+    def matches(self, entity_id, root, clock):
+        if self.regex is not None and not (entity_id and self.regex.match(entity_id)):
+            return False
+        if self.window is not None and not _in_window(self.window, clock()):
+            return False
+        for cond in self.conditions:
+            if not cond(root):
+                return False
+        return True
+
+
+def _exact_entities(rule):
+    """entity_ids a rule's globs name literally, or None if any is a pattern."""
+    globs = rule.entity_globs
+    if not globs or any(c in g for g in globs for c in "*?["):
+        return None
+    return globs
+
+
+# ---------------------------------------------------------
+# Engine
+# ---------------------------------------------------------
+class RuleEngine:
+    """Evaluate a RuleSet pushed by .NET without a round trip.
+
+    Rules are indexed by target, then by (key, entity_id) for globs that
+    name an entity literally, else by key (domain / event type) or "*".
+    A lookup gathers the candidate buckets, walks them in rule order and
+    stops at the first rule that holds. The result is a StateWriteResponse
+    or EventResponse the interceptor applies as if .NET had sent it, or
+    None to ask .NET. State writes also get the attributes an OVERRIDE
+    sets, merged over the write's own in Python so untouched values keep
+    their types (a ValueMap round trip turns dates into strings).
+
+    Time windows are read off now(), local time by default; the bridge
+    passes HA's clock so they follow the configured time zone.
+    """
+
+    def __init__(self, ruleset, now=datetime.now):
+        self.now = now
+        self._entities = {STATE_WRITE: {}, EVENT: {}}
+        self._keys = {STATE_WRITE: {}, EVENT: {}}
+
+        for order, rule in enumerate(ruleset.rules):
+            compiled = CompiledRule(order, rule)
+            entities = _exact_entities(rule)
+            key = rule.key or WILDCARD
+            if entities is not None:
+                # The index already pins the entity; skip the regex.
+                compiled.regex = None
+                index = self._entities[rule.target]
+                for entity_id in entities:
+                    index.setdefault((key, entity_id), []).append(compiled)
+            else:
+                self._keys[rule.target].setdefault(key, []).append(compiled)
+
+        # Precomputed responses for the fixed decisions.
+        self._state_allow = StateWriteResponse()
+        self._state_veto = StateWriteResponse(handled=True)
+        self._event_allow = EventResponse()
+        self._event_veto = EventResponse(handled=True)
+
+        self.size = len(ruleset.rules)
+        self.hits = Counter()
+
+    def __len__(self):
+        return self.size
+
+    def _candidates(self, target, key, entity_id):
+        entities = self._entities[target]
+        keys = self._keys[target]
+        buckets = [
+            bucket
+            for bucket in (
+                entities.get((key, entity_id)),
+                entities.get((WILDCARD, entity_id)),
+                keys.get(key),
+                keys.get(WILDCARD),
+            )
+            if bucket
+        ]
+        if not buckets:
+            return ()
+        if len(buckets) == 1:
+            return buckets[0]
+        # A rule can only sit in one bucket, so ordering by order is enough.
+        return sorted((r for b in buckets for r in b), key=lambda r: r.order)
+
+    def _first(self, candidates, entity_id, root):
+        for rule in candidates:
+            if rule.matches(entity_id, root, self.now):
+                self.hits[rule.id] += 1
+                return rule
+        return None
+
+    # ---------------------------------------------------------
+    # STATE WRITES
+    # ---------------------------------------------------------
+    def evaluate_state(self, entity_id, new_state, attrs):
+        """(StateWriteResponse, merged attributes or None), or None."""
+        candidates = self._candidates(
+            STATE_WRITE, entity_id.partition(".")[0], entity_id
+        )
+        if not candidates:
+            return None
+
+        rule = self._first(
+            candidates, entity_id, {"state": str(new_state), "attributes": attrs}
+        )
+        if rule is None or rule.decision == ASK:
+            return None
+        if rule.decision == ALLOW:
+            return self._state_allow, None
+        if rule.decision == VETO:
+            return self._state_veto, None
+
+        resp = StateWriteResponse(override_state=rule.override_state)
+        if rule.set_attributes is None:
+            return resp, None
+        return resp, {**attrs, **rule.set_attributes}
+
+    # ---------------------------------------------------------
+    # EVENTS
+    # ---------------------------------------------------------
+    def evaluate_event(self, event_type, entity_id, event_data):
+        candidates = self._candidates(EVENT, event_type, entity_id)
+        if not candidates:
+            return None
+
+        rule = self._first(candidates, entity_id, {"data": event_data})
+        if rule is None or rule.decision in (ASK, OVERRIDE):
+            return None
+        return self._event_veto if rule.decision == VETO else self._event_allow
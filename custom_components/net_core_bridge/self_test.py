@@ -1,3 +1,4 @@
+import asyncio
 import time
 import grpc
 
@@ -10,9 +11,27 @@ from .clients.state_interceptor_pb2 import StateWriteRequest
 from .clients.entity_platform_pb2_grpc import EntityPlatformInterceptorStub
 from .clients.entity_platform_pb2 import PlatformSetupRequest, PlatformInfo
 
+from .metrics import Histogram
 
-async def run_bridge_self_test(hass, channel):
-    """Verify that all .NET gRPC services are reachable and responding."""
+# Deadline for each self-test call (seconds)
+PROBE_TIMEOUT = 5.0
+
+# Pause after a failed call in the load self-test (seconds)
+ERROR_BACKOFF = 0.05
+
+# Time a service's load run may take beyond duration before it is abandoned
+LOAD_GRACE = PROBE_TIMEOUT + 1.0
+
+
+async def run_bridge_self_test(hass, channels, duration=0.0, concurrency=8):
+    """Verify that all .NET gRPC services are reachable and responding.
+
+    Calls go through channels (the bridge's ChannelManager), each on its
+    service's own channel. With duration > 0 runs the load self-test
+    instead: concurrency callers per service for duration seconds.
+    """
+    if duration > 0:
+        return await run_bridge_load_test(hass, channels, duration, concurrency)
 
     hass.logger.info("net_core_bridge: Running self-test…")
 
@@ -21,8 +40,8 @@ async def run_bridge_self_test(hass, channel):
     # ---------------------------------------------------------
     # Channel health check
     # ---------------------------------------------------------
-    state = await channel.check_connectivity_state(False)
-    results["channel_state"] = str(state)
+    state = channels.channel("control").get_state(try_to_connect=True)
+    results["channel_state"] = state.name
 
     if state.name == "SHUTDOWN":
         hass.logger.error("net_core_bridge SELF-TEST FAILED: gRPC channel SHUTDOWN")
@@ -32,7 +51,7 @@ async def run_bridge_self_test(hass, channel):
     # EVENT INTERCEPTOR TEST
     # ---------------------------------------------------------
     try:
-        event_stub = EventInterceptorStub(channel)
+        event_stub = channels.stub("event", EventInterceptorStub)
         start = time.perf_counter()
 
         resp = await event_stub.InterceptEvent(
@@ -41,7 +60,8 @@ async def run_bridge_self_test(hass, channel):
                 entity_id="",
                 json_data="{}",
                 context_id="",
-            )
+            ),
+            timeout=PROBE_TIMEOUT,
         )
 
         latency = (time.perf_counter() - start) * 1000
@@ -59,7 +79,7 @@ async def run_bridge_self_test(hass, channel):
     # STATE INTERCEPTOR TEST
     # ---------------------------------------------------------
     try:
-        state_stub = StateInterceptorStub(channel)
+        state_stub = channels.stub("state", StateInterceptorStub)
         start = time.perf_counter()
 
         resp = await state_stub.InterceptStateWrite(
@@ -68,7 +88,8 @@ async def run_bridge_self_test(hass, channel):
                 state="online",
                 attributes_json="{}",
                 context_id="",
-            )
+            ),
+            timeout=PROBE_TIMEOUT,
         )
 
         latency = (time.perf_counter() - start) * 1000
@@ -89,7 +110,7 @@ async def run_bridge_self_test(hass, channel):
     # ENTITY PLATFORM INTERCEPTOR TEST
     # ---------------------------------------------------------
     try:
-        ep_stub = EntityPlatformInterceptorStub(channel)
+        ep_stub = channels.stub("entity_platform", EntityPlatformInterceptorStub)
         start = time.perf_counter()
 
         resp = await ep_stub.PlatformSetup(
@@ -99,7 +120,8 @@ async def run_bridge_self_test(hass, channel):
                     platform_name="self_test_platform",
                     config_entry_id="",
                 )
-            )
+            ),
+            timeout=PROBE_TIMEOUT,
         )
 
         latency = (time.perf_counter() - start) * 1000
@@ -123,3 +145,136 @@ async def run_bridge_self_test(hass, channel):
         hass.logger.info(f"  {key}: {r}")
 
     return results
+
+
+# ---------------------------------------------------------
+# LOAD SELF-TEST
+# ---------------------------------------------------------
+def _load_probes(channels):
+    """One zero-argument RPC per service, as sent by the single-shot test."""
+    event_stub = channels.stub("event", EventInterceptorStub)
+    state_stub = channels.stub("state", StateInterceptorStub)
+    ep_stub = channels.stub("entity_platform", EntityPlatformInterceptorStub)
+
+    event_req = EventMessage(
+        event_type="net_core_bridge.self_test",
+        entity_id="",
+        json_data="{}",
+        context_id="",
+    )
+    state_req = StateWriteRequest(
+        entity_id="self_test.entity",
+        state="online",
+        attributes_json="{}",
+        context_id="",
+    )
+    ep_req = PlatformSetupRequest(
+        platform=PlatformInfo(
+            domain="self_test",
+            platform_name="self_test_platform",
+            config_entry_id="",
+        )
+    )
+
+    return {
+        "event_interceptor": lambda: event_stub.InterceptEvent(
+            event_req, timeout=PROBE_TIMEOUT
+        ),
+        "state_interceptor": lambda: state_stub.InterceptStateWrite(
+            state_req, timeout=PROBE_TIMEOUT
+        ),
+        "entity_platform_interceptor": lambda: ep_stub.PlatformSetup(
+            ep_req, timeout=PROBE_TIMEOUT
+        ),
+    }
+
+
+async def _load_service(probe, duration, concurrency):
+    hist = Histogram()
+    errors = {}
+    deadline = time.perf_counter() + duration
+
+    async def caller():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                await probe()
+            except Exception as ex:
+                if isinstance(ex, grpc.aio.AioRpcError):
+                    name = ex.code().name
+                else:
+                    name = type(ex).__name__
+                errors[name] = errors.get(name, 0) + 1
+                # Unreachable peers fail fast; do not spin HA's loop.
+                await asyncio.sleep(ERROR_BACKOFF)
+                continue
+            hist.record(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "rps": hist.count / elapsed if elapsed else 0.0,
+        "errors": sum(errors.values()),
+        "errors_by_code": errors,
+        "latency": hist.as_dict(),
+    }
+
+
+async def run_bridge_load_test(hass, channels, duration, concurrency):
+    """Sustained load per service; returns RPS, percentiles and errors.
+
+    Services are loaded one after another, not together, so each gets the
+    loop to itself: the test takes about three times duration.
+    """
+    hass.logger.info(
+        "net_core_bridge: Running load self-test (%gs, %d callers per service)…",
+        duration,
+        concurrency,
+    )
+
+    transitions = []
+    probes = _load_probes(channels)
+    unsubscribe = channels.on_state_change(
+        lambda name, state: transitions.append(f"{name}: {state.name}")
+    )
+    try:
+        results = {
+            "mode": "load",
+            "duration_s": duration,
+            "concurrency": concurrency,
+            "channel_state": channels.channel("control").get_state().name,
+        }
+        for service, probe in probes.items():
+            try:
+                results[service] = await asyncio.wait_for(
+                    _load_service(probe, duration, concurrency),
+                    duration + LOAD_GRACE,
+                )
+            except asyncio.TimeoutError:
+                hass.logger.error(
+                    "net_core_bridge LOAD SELF-TEST %s: did not finish in %gs",
+                    service,
+                    duration + LOAD_GRACE,
+                )
+                results[service] = {"ok": False, "error": "timeout"}
+    finally:
+        unsubscribe()
+
+    results["channel_state_changes"] = len(transitions)
+    results["channel_states"] = transitions
+
+    for service in probes:
+        r = results[service]
+        if "rps" not in r:
+            continue
+        hass.logger.info(
+            "net_core_bridge LOAD SELF-TEST %s: %.0f rps, p99 %.2fms, %d errors",
+            service,
+            r["rps"],
+            r["latency"]["p99_ms"],
+            r["errors"],
+        )
+
+    return results
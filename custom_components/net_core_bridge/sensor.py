@@ -0,0 +1,102 @@
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+
+from .const import DOMAIN
+
+
+# (unique_id suffix, name, histogram family)
+LATENCY_SENSORS = (
+    ("async_fire_latency", "Bridge async_fire latency", "async_fire"),
+    ("async_set_latency", "Bridge async_set latency", "async_set"),
+)
+
+# (unique_id suffix, name, counter)
+COUNTER_SENSORS = (
+    ("rpc_calls", "Bridge RPC calls", "rpc.calls"),
+    ("rpc_errors", "Bridge RPC errors", "rpc.errors"),
+    ("rpc_bytes_sent", "Bridge RPC bytes sent", "rpc.bytes_sent"),
+    ("event_vetoes", "Bridge event vetoes", "event.vetoed"),
+    ("state_vetoes", "Bridge state vetoes", "state.vetoed"),
+    ("state_overrides", "Bridge state overrides", "state.overridden"),
+    ("event_outbox_dropped", "Bridge event outbox dropped", "outbox.event.dropped"),
+    ("state_outbox_dropped", "Bridge state outbox dropped", "outbox.state.dropped"),
+    ("feedback_loops", "Bridge feedback loops", "origin.loops"),
+)
+
+# (unique_id suffix, name, gauge)
+GAUGE_SENSORS = (
+    ("event_outbox_depth", "Bridge event outbox depth", "outbox.event.depth"),
+    ("state_outbox_depth", "Bridge state outbox depth", "outbox.state.depth"),
+)
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Loaded via discovery from async_setup; one sensor per bridge metric."""
+    metrics = hass.data[DOMAIN].metrics
+
+    entities = [
+        BridgeLatencySensor(metrics, key, name, family)
+        for key, name, family in LATENCY_SENSORS
+    ]
+    entities += [
+        BridgeCounterSensor(metrics, key, name, counter)
+        for key, name, counter in COUNTER_SENSORS
+    ]
+    entities += [
+        BridgeGaugeSensor(metrics, key, name, gauge)
+        for key, name, gauge in GAUGE_SENSORS
+    ]
+    async_add_entities(entities)
+
+
+class BridgeLatencySensor(SensorEntity):
+    """p99 latency the bridge adds to a HA call; other percentiles as attributes."""
+
+    _attr_should_poll = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, metrics, key, name, family):
+        self._metrics = metrics
+        self._family = family
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+
+    async def async_update(self):
+        hist = self._metrics.histogram(self._family).as_dict()
+        self._attr_native_value = hist["p99_ms"]
+        self._attr_extra_state_attributes = hist
+
+
+class BridgeCounterSensor(SensorEntity):
+    """Monotonic bridge counter."""
+
+    _attr_should_poll = True
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, metrics, key, name, counter):
+        self._metrics = metrics
+        self._counter = counter
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+
+    async def async_update(self):
+        self._attr_native_value = self._metrics.counters[self._counter]
+
+
+class BridgeGaugeSensor(SensorEntity):
+    """Point-in-time bridge value, e.g. an outbox's queue depth."""
+
+    _attr_should_poll = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, metrics, key, name, gauge):
+        self._metrics = metrics
+        self._gauge = gauge
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+
+    async def async_update(self):
+        read = self._metrics.gauges.get(self._gauge)
+        self._attr_native_value = None if read is None else read()
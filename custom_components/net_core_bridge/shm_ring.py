@@ -0,0 +1,242 @@
+import mmap
+import os
+import socket
+import struct
+import time
+
+from .clients.event_interceptor_pb2 import EventMessage
+from .clients.state_interceptor_pb2 import StateWriteBatch, StateWriteRequest
+
+# ---------------------------------------------------------
+# Ring layout (little-endian), shared with the .NET reader
+# ---------------------------------------------------------
+#   0   u32 magic  "NCBR"
+#   4   u32 version
+#   8   u64 capacity        bytes in the data area, multiple of 8
+#  64   u64 head            producer position (monotonic), own cache line
+# 128   u64 tail            consumer position (monotonic), own cache line
+# 136   u32 reader_waiting  set by the reader before it blocks on the doorbell
+# 192   data area
+#
+# Before blocking, the reader sets reader_waiting, then re-reads head and
+# only sleeps if it is unchanged. Python cannot issue the store/load fence
+# that closes the race with a writer publishing head at that moment, so a
+# wake-up can still be missed; check() rings again for pending data the
+# reader is not consuming.
+#
+# Records are 8-byte aligned: u32 length, u16 kind, u16 reserved, then the
+# serialized protobuf. A record never straddles the end of the data area;
+# a KIND_WRAP header tells the reader to continue at offset 0.
+MAGIC = 0x5242434E
+VERSION = 1
+
+HEAD_OFFSET = 64
+TAIL_OFFSET = 128
+WAITING_OFFSET = 136
+DATA_OFFSET = 192
+
+RECORD_HEADER = struct.Struct("<IHH")
+
+# How often the bridge calls check(), and how long the reader may leave
+# pending records untouched before the ring is given up.
+CHECK_INTERVAL = 1.0
+DEFAULT_STALL_TIMEOUT = 10.0
+
+KIND_WRAP = 0
+KIND_EVENT = 1
+KIND_STATE_WRITE = 2
+KIND_STATE_WRITE_BATCH = 3
+
+MESSAGE_KINDS = {
+    EventMessage: KIND_EVENT,
+    StateWriteRequest: KIND_STATE_WRITE,
+    StateWriteBatch: KIND_STATE_WRITE_BATCH,
+}
+
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_HEADER = struct.Struct("<IIQ")
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+def create_ring(path, capacity):
+    """Create (or truncate) a ring file; the reader side owns it."""
+    capacity = _align(capacity)
+    with open(path, "w+b") as f:
+        f.truncate(DATA_OFFSET + capacity)
+        mm = mmap.mmap(f.fileno(), DATA_OFFSET + capacity)
+    _HEADER.pack_into(mm, 0, MAGIC, VERSION, capacity)
+    return mm
+
+
+class ShmRingWriter:
+    """Single-producer side of a shared-memory ring offered by .NET.
+
+    write() never blocks: if the reader is behind and the record does not
+    fit, it returns False and the caller sends the message another way. The
+    doorbell (a unix datagram socket the reader listens on) is only rung
+    when the reader has flagged that it is about to sleep.
+
+    check() is the liveness test: a reader that leaves records pending for
+    stall_timeout seconds is taken as hung and the ring is closed.
+    """
+
+    def __init__(self, path, doorbell_path, stall_timeout=DEFAULT_STALL_TIMEOUT):
+        self.path = path
+        self.doorbell_path = doorbell_path
+        self.stall_timeout = stall_timeout
+
+        fd = os.open(path, os.O_RDWR)
+        try:
+            self._mm = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+
+        magic, version, capacity = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a v{VERSION} bridge ring")
+
+        self.capacity = capacity
+        self._head = _U64.unpack_from(self._mm, HEAD_OFFSET)[0]
+
+        self._doorbell = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._doorbell.setblocking(False)
+
+        # Last tail seen by check(), and when it last moved
+        self._tail = _U64.unpack_from(self._mm, TAIL_OFFSET)[0]
+        self._tail_moved = time.monotonic()
+
+        self.closed = False
+        self.stalled = False
+        self.written = 0
+        self.bytes_written = 0
+        self.full = 0
+        self.doorbells = 0
+        self.nudges = 0
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._doorbell.close()
+            self._mm.close()
+
+    # ---------------------------------------------------------
+    # PRODUCER
+    # ---------------------------------------------------------
+    def write(self, kind, payload) -> bool:
+        mm = self._mm
+        size = _align(RECORD_HEADER.size + len(payload))
+        if size > self.capacity:
+            self.full += 1
+            return False
+
+        head = self._head
+        offset = head % self.capacity
+        pad = self.capacity - offset if offset + size > self.capacity else 0
+
+        tail = _U64.unpack_from(mm, TAIL_OFFSET)[0]
+        if head + pad + size - tail > self.capacity:
+            self.full += 1
+            return False
+
+        if pad:
+            RECORD_HEADER.pack_into(mm, DATA_OFFSET + offset, 0, KIND_WRAP, 0)
+            offset = 0
+
+        start = DATA_OFFSET + offset
+        RECORD_HEADER.pack_into(mm, start, len(payload), kind, 0)
+        mm[start + RECORD_HEADER.size : start + RECORD_HEADER.size + len(payload)] = (
+            payload
+        )
+
+        # Publish only after the record is in place.
+        self._head = head + pad + size
+        _U64.pack_into(mm, HEAD_OFFSET, self._head)
+        self.written += 1
+        self.bytes_written += len(payload)
+
+        if _U32.unpack_from(mm, WAITING_OFFSET)[0]:
+            _U32.pack_into(mm, WAITING_OFFSET, 0)
+            self._ring()
+        return True
+
+    def _ring(self):
+        try:
+            self._doorbell.sendto(b"\x01", self.doorbell_path)
+            self.doorbells += 1
+        except BlockingIOError:
+            # Reader already has wake-ups queued.
+            pass
+        except OSError:
+            # Reader is gone; stop using the ring.
+            self.close()
+
+    def check(self, now=None) -> bool:
+        """Liveness test, called periodically; False once the ring is closed."""
+        if self.closed:
+            return False
+
+        now = time.monotonic() if now is None else now
+        tail = _U64.unpack_from(self._mm, TAIL_OFFSET)[0]
+        if tail != self._tail or tail == self._head:
+            self._tail = tail
+            self._tail_moved = now
+            return True
+
+        if now - self._tail_moved >= self.stall_timeout:
+            self.stalled = True
+            self.close()
+            return False
+
+        # Records pending and the reader not moving: it may have missed
+        # its wake-up, so ring regardless of reader_waiting.
+        self.nudges += 1
+        self._ring()
+        return not self.closed
+
+    @property
+    def depth(self) -> int:
+        if self.closed:
+            return 0
+        return self._head - _U64.unpack_from(self._mm, TAIL_OFFSET)[0]
+
+    def diagnostics(self) -> dict:
+        return {
+            "path": self.path,
+            "closed": self.closed,
+            "stalled": self.stalled,
+            "capacity": self.capacity,
+            "depth_bytes": self.depth,
+            "written": self.written,
+            "bytes_written": self.bytes_written,
+            "full": self.full,
+            "doorbells": self.doorbells,
+            "nudges": self.nudges,
+        }
+
+
+class ShmObserveSink:
+    """Outbox stand-in that writes observe-only messages to the ring.
+
+    Messages the ring has no room for, and everything once it is closed, go
+    to the interceptor's gRPC outbox instead.
+    """
+
+    def __init__(self, ring: ShmRingWriter, fallback):
+        self.ring = ring
+        self.fallback = fallback
+
+    def _write(self, message) -> bool:
+        return not self.ring.closed and self.ring.write(
+            MESSAGE_KINDS[type(message)], message.SerializeToString()
+        )
+
+    def put(self, message) -> bool:
+        return self._write(message) or self.fallback.put(message)
+
+    async def put_wait(self, message) -> bool:
+        return self._write(message) or await self.fallback.put_wait(message)
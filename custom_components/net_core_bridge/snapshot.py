@@ -0,0 +1,191 @@
+import asyncio
+import itertools
+import time
+import grpc
+
+from .clients.snapshot_pb2 import SnapshotChunk
+from .clients.snapshot_pb2_grpc import BridgeSnapshotStub
+from .metrics import Metrics
+
+# States per SnapshotChunk; the stream is gzip-compressed on top.
+CHUNK_SIZE = 500
+
+# Channels coming back together (e.g. .NET restarted) → one snapshot.
+DEBOUNCE = 1.0
+
+
+class SnapshotStreamer:
+    """Stream HA's full state to .NET whenever the bridge (re)connects.
+
+    Connectivity comes from ChannelManager: a channel of the watched
+    service turning READY after being anything else schedules a snapshot
+    (debounced). The states are captured in one loop iteration together
+    with the state interceptor's sequence marker, then encoded and sent
+    in chunks, followed by the platforms and entities seen by the
+    EntityPlatformInterceptor.
+    """
+
+    def __init__(
+        self,
+        hass,
+        grpc_client: BridgeSnapshotStub,
+        channels,
+        state_interceptor,
+        entity_platform_interceptor,
+        metrics: Metrics | None = None,
+        service="control",
+    ):
+        self.hass = hass
+        self.grpc = grpc_client
+        self.channels = channels
+        self.states = state_interceptor
+        self.platforms = entity_platform_interceptor
+        self.service = service
+
+        self.metrics = metrics or Metrics()
+        self._duration = self.metrics.histogram("snapshot")
+
+        # Flips to False on UNIMPLEMENTED.
+        self.supported = True
+
+        self._ids = itertools.count(1)
+        self._connected = {}
+        self._timer = None
+        self._task = None
+        self._again = False
+
+        self.sent = 0
+        self.failed = 0
+        self.last = None
+
+    def start(self):
+        self.channels.on_state_change(self._on_channel_state)
+
+    async def stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def diagnostics(self) -> dict:
+        return {
+            "supported": self.supported,
+            "sent": self.sent,
+            "failed": self.failed,
+            "last": self.last,
+            "duration": self._duration.as_dict(),
+        }
+
+    # ---------------------------------------------------------
+    # TRIGGER
+    # ---------------------------------------------------------
+    def _on_channel_state(self, name, state):
+        if name not in self.channels.names.get(self.service, ()):
+            return
+
+        ready = state == grpc.ChannelConnectivity.READY
+        was_ready = self._connected.get(name, False)
+        self._connected[name] = ready
+        if not ready or was_ready or not self.supported:
+            return
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(DEBOUNCE, self.trigger)
+
+    def trigger(self):
+        """Send a snapshot now, or once more after the one in progress."""
+        self._timer = None
+        if self._task is not None:
+            self._again = True
+            return
+        self._task = self.hass.async_create_background_task(
+            self._run(), "net_core_bridge state snapshot"
+        )
+
+    async def _run(self):
+        try:
+            while True:
+                self._again = False
+                await self._send()
+                if not self._again or not self.supported:
+                    return
+        finally:
+            self._task = None
+
+    # ---------------------------------------------------------
+    # SNAPSHOT
+    # ---------------------------------------------------------
+    async def _send(self):
+        start = time.monotonic()
+        snapshot_id = next(self._ids)
+
+        # Captured together, with no await in between: every write with a
+        # higher sequence happened after these states.
+        sequence = self.states.begin_snapshot()
+        states = self.hass.states.async_all()
+
+        counts = {"states": 0, "skipped": 0, "chunks": 0}
+
+        async def chunks():
+            for i in range(0, len(states), CHUNK_SIZE):
+                chunk = SnapshotChunk(snapshot_id=snapshot_id, sequence=sequence)
+                for state in states[i : i + CHUNK_SIZE]:
+                    try:
+                        chunk.states.append(self.states.snapshot_request(state))
+                    except Exception:
+                        # e.g. an attribute JSON cannot encode
+                        counts["skipped"] += 1
+                counts["states"] += len(chunk.states)
+                counts["chunks"] += 1
+                yield chunk
+                # Encoding thousands of states must not stall the loop.
+                await asyncio.sleep(0)
+
+            counts["chunks"] += 1
+            yield SnapshotChunk(
+                snapshot_id=snapshot_id,
+                sequence=sequence,
+                platforms=self.platforms.platforms_seen(),
+                last=True,
+            )
+
+        try:
+            await self.grpc.Snapshot(chunks(), compression=grpc.Compression.Gzip)
+        except asyncio.CancelledError:
+            raise
+        except grpc.aio.AioRpcError as ex:
+            if ex.code() == grpc.StatusCode.UNIMPLEMENTED:
+                self.supported = False
+                self.hass.logger.info(
+                    "net_core_bridge: BridgeSnapshot not implemented by .NET; "
+                    "snapshots disabled."
+                )
+                return
+            self.failed += 1
+            self.hass.logger.warning(
+                "net_core_bridge: state snapshot failed: %s", ex.code()
+            )
+            return
+        except Exception as ex:
+            self.failed += 1
+            self.hass.logger.error("net_core_bridge: state snapshot failed: %s", ex)
+            return
+
+        elapsed = time.monotonic() - start
+        self._duration.record(elapsed)
+        self.sent += 1
+        self.last = dict(
+            counts, snapshot_id=snapshot_id, sequence=sequence, at=time.time()
+        )
+        self.hass.logger.info(
+            "net_core_bridge: sent state snapshot %d (%d states, %d chunks, "
+            "sequence %d) in %.0fms.",
+            snapshot_id,
+            counts["states"],
+            counts["chunks"],
+            sequence,
+            elapsed * 1000,
+        )
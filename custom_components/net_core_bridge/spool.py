@@ -0,0 +1,606 @@
+import asyncio
+import mmap
+import os
+import struct
+import time
+from collections import deque
+
+import grpc
+
+from .clients.state_interceptor_pb2 import StateWriteBatch, StateWriteRequest
+from .metrics import Metrics
+from .rpc_guard import CircuitOpenError
+from .shm_ring import (
+    KIND_STATE_WRITE,
+    KIND_STATE_WRITE_BATCH,
+    MESSAGE_KINDS,
+    RECORD_HEADER,
+)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024
+# Messages per second; 0 replays as fast as .NET takes them.
+DEFAULT_REPLAY_RATE = 500
+
+# Frames handed to the replayer at a time
+REPLAY_BATCH = 64
+
+# How often an idle or offline replayer checks again (seconds)
+REPLAY_POLL = 1.0
+
+# A channel in these states cannot take traffic right now. IDLE is fine:
+# the next RPC connects it.
+_OFFLINE = frozenset(
+    {
+        grpc.ChannelConnectivity.CONNECTING,
+        grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+        grpc.ChannelConnectivity.SHUTDOWN,
+    }
+)
+
+# Replay errors that mean "not now": the frame stays and is retried.
+# Any other error is .NET refusing the message; it is skipped.
+_RETRY = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+    }
+)
+
+MESSAGE_TYPES = {kind: cls for cls, kind in MESSAGE_KINDS.items()}
+
+# ---------------------------------------------------------
+# Segment layout (little-endian)
+# ---------------------------------------------------------
+#   0   u32 magic  "NCBS"
+#   4   u32 version
+#   8   u64 write offset   end of the last complete frame
+#  16   u64 read offset    frames before this were replayed
+#  64   frames: u32 length, u16 kind, u16 reserved, serialized protobuf,
+#       padded to 8 bytes (same framing as the shm ring)
+#
+# Offsets are published only after the frame bytes are written, so a
+# crash mid-append loses at most that frame.
+SEGMENT_MAGIC = 0x53424E43
+SEGMENT_VERSION = 1
+
+_HEADER = struct.Struct("<IIQQ")
+HEADER_SIZE = 64
+
+SEGMENT_SUFFIX = ".seg"
+# A segment that cannot be read is renamed aside, never replayed.
+BAD_SUFFIX = ".bad"
+# Compaction output, renamed over the sealed segments when done.
+COMPACT_PREFIX = "compact-"
+COMPACT_SUFFIX = ".tmp"
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+class Segment:
+    """One fixed-size, memory-mapped, append-only spool file."""
+
+    def __init__(self, path, size=None):
+        self.path = path
+        if size is not None:
+            with open(path, "w+b") as f:
+                f.truncate(size)
+                self._mm = mmap.mmap(f.fileno(), size)
+            _HEADER.pack_into(
+                self._mm, 0, SEGMENT_MAGIC, SEGMENT_VERSION, HEADER_SIZE, HEADER_SIZE
+            )
+        else:
+            with open(path, "r+b") as f:
+                if os.fstat(f.fileno()).st_size < HEADER_SIZE:
+                    raise ValueError(f"{path} is too short for a spool segment")
+                self._mm = mmap.mmap(f.fileno(), 0)
+            magic, version, _, _ = _HEADER.unpack_from(self._mm, 0)
+            if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+                self._mm.close()
+                raise ValueError(f"{path} is not a v{SEGMENT_VERSION} spool segment")
+
+        _, _, self.write_offset, self.read_offset = _HEADER.unpack_from(self._mm, 0)
+        self.size = len(self._mm)
+        if not HEADER_SIZE <= self.read_offset <= self.write_offset <= self.size:
+            self._mm.close()
+            raise ValueError(f"{path} has corrupt offsets")
+
+    def append(self, kind, payload) -> bool:
+        size = _align(RECORD_HEADER.size + len(payload))
+        start = self.write_offset
+        if start + size > self.size:
+            return False
+
+        RECORD_HEADER.pack_into(self._mm, start, len(payload), kind, 0)
+        body = start + RECORD_HEADER.size
+        self._mm[body : body + len(payload)] = payload
+
+        self.write_offset = start + size
+        struct.pack_into("<Q", self._mm, 8, self.write_offset)
+        return True
+
+    def frames(self, start=None, limit=None):
+        """[(end_offset, kind, payload), ...] from start (default: read offset)."""
+        offset = self.read_offset if start is None else start
+        out = []
+        while offset < self.write_offset and (limit is None or len(out) < limit):
+            length, kind, _ = RECORD_HEADER.unpack_from(self._mm, offset)
+            body = offset + RECORD_HEADER.size
+            payload = self._mm[body : body + length]
+            offset += _align(RECORD_HEADER.size + length)
+            out.append((offset, kind, payload))
+        return out
+
+    def commit(self, offset):
+        self.read_offset = offset
+        struct.pack_into("<Q", self._mm, 16, offset)
+
+    @property
+    def drained(self) -> bool:
+        return self.read_offset >= self.write_offset
+
+    def close(self):
+        self._mm.flush()
+        self._mm.close()
+
+    def delete(self):
+        self._mm.close()
+        os.unlink(self.path)
+
+
+class SegmentStore:
+    """Ordered segment files in one directory; the last one takes appends.
+
+    Opening does blocking file I/O; the spool runs it in the executor.
+    Unreadable segments are renamed to .bad and listed in skipped, and
+    compaction output left behind by a crash is deleted.
+    """
+
+    def __init__(self, directory, segment_size, max_bytes):
+        self.directory = directory
+        self.segment_size = _align(segment_size)
+        self.max_bytes = max_bytes
+
+        os.makedirs(directory, exist_ok=True)
+        self.segments = deque()
+        # (file name, reason) per segment set aside
+        self.skipped = []
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if name.startswith(COMPACT_PREFIX) and name.endswith(COMPACT_SUFFIX):
+                os.unlink(path)
+                continue
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            try:
+                segment = Segment(path)
+            except (OSError, ValueError) as ex:
+                os.replace(path, path + BAD_SUFFIX)
+                self.skipped.append((name, str(ex)))
+                continue
+            if segment.drained:
+                segment.delete()
+            else:
+                self.segments.append(segment)
+
+        self._next = 0
+        if self.segments:
+            last = os.path.basename(self.segments[-1].path)
+            self._next = int(last[: -len(SEGMENT_SUFFIX)]) + 1
+        if not self.segments:
+            self._rotate()
+
+        self.pending = sum(len(s.frames()) for s in self.segments)
+
+    def _rotate(self):
+        path = os.path.join(self.directory, f"{self._next:010d}{SEGMENT_SUFFIX}")
+        self._next += 1
+        self.segments.append(Segment(path, self.segment_size))
+
+    @property
+    def bytes(self) -> int:
+        return sum(s.size for s in self.segments)
+
+    def append(self, kind, payload) -> bool:
+        """Append one frame; False if it does not fit under max_bytes."""
+        if self.segments[-1].append(kind, payload):
+            self.pending += 1
+            return True
+
+        if self.bytes + self.segment_size > self.max_bytes:
+            return False
+        if _align(RECORD_HEADER.size + len(payload)) > self.segment_size - HEADER_SIZE:
+            return False
+
+        self._rotate()
+        self.segments[-1].append(kind, payload)
+        self.pending += 1
+        return True
+
+    def read(self, limit):
+        """Next unreplayed frames of the oldest segment."""
+        while len(self.segments) > 1 and self.segments[0].drained:
+            self.segments.popleft().delete()
+        return self.segments[0].frames(limit=limit)
+
+    def commit(self, offset):
+        """Mark the oldest segment replayed up to offset."""
+        self.segments[0].commit(offset)
+        self.pending -= 1
+
+    def sealed(self):
+        """Segments no longer appended to (all but the last)."""
+        return list(self.segments)[:-1]
+
+    def replace_sealed(self, old, new_paths, pending):
+        """Swap compacted files in for the sealed segments old."""
+        keep = [s for s in self.segments if s not in old]
+        for segment in old:
+            segment.delete()
+
+        # Reuse the old names so the files still sort before newer ones.
+        new = []
+        for path, segment in zip(new_paths, old):
+            os.replace(path, segment.path)
+            new.append(Segment(segment.path))
+        self.segments = deque(new + keep)
+        self.pending = pending
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+
+# ---------------------------------------------------------
+# Compaction (runs in the executor on sealed segment files)
+# ---------------------------------------------------------
+def _write_id(req):
+    return req.entity_id, not req.attributes_delta
+
+
+def compact_segments(segments, segment_size, tmp_prefix):
+    """Rewrite sealed segments keeping, per entity, the latest full write.
+
+    segments is [(path, read_offset, write_offset)]. A delta write is only
+    meaningful on top of the writes before it, so an entity's writes are
+    dropped only when a later full (non-delta) write supersedes them.
+    Events are kept. Returns (paths, frames) of the new files.
+    """
+    frames = []
+    for path, start, _ in segments:
+        segment = Segment(path)
+        try:
+            frames.extend(
+                (kind, payload) for _, kind, payload in segment.frames(start)
+            )
+        finally:
+            segment.close()
+
+    # Pass 1: position of each entity's last full write.
+    parsed = []
+    last_full = {}
+    position = 0
+    for kind, payload in frames:
+        if kind == KIND_STATE_WRITE:
+            writes = [StateWriteRequest.FromString(payload)]
+        elif kind == KIND_STATE_WRITE_BATCH:
+            writes = list(StateWriteBatch.FromString(payload).writes)
+        else:
+            parsed.append((kind, payload, None))
+            continue
+
+        positions = []
+        for req in writes:
+            entity_id, full = _write_id(req)
+            if full:
+                last_full[entity_id] = position
+            positions.append((position, req))
+            position += 1
+        parsed.append((kind, payload, positions))
+
+    # Pass 2: keep writes at or after their entity's last full write.
+    out_paths = []
+    out = None
+    kept = 0
+
+    def emit(kind, payload):
+        nonlocal out
+        if out is None or not out.append(kind, payload):
+            if out is not None:
+                out.close()
+            path = f"{tmp_prefix}{len(out_paths)}{COMPACT_SUFFIX}"
+            out_paths.append(path)
+            out = Segment(path, segment_size)
+            out.append(kind, payload)
+
+    for kind, payload, positions in parsed:
+        if positions is not None:
+            live = [
+                req
+                for pos, req in positions
+                if pos >= last_full.get(req.entity_id, -1)
+            ]
+            if not live:
+                continue
+            if kind == KIND_STATE_WRITE_BATCH and len(live) != len(positions):
+                payload = StateWriteBatch(writes=live).SerializeToString()
+        emit(kind, payload)
+        kept += 1
+
+    if out is not None:
+        out.close()
+    return out_paths, kept
+
+
+# ---------------------------------------------------------
+# Spool: routing, replay, size cap
+# ---------------------------------------------------------
+class SpoolTap:
+    """What an Outbox sees of the spool for one service."""
+
+    def __init__(self, spool, service, on_engage=None, on_drop=None):
+        self.spool = spool
+        self.service = service
+        self.on_engage = on_engage
+        self.on_drop = on_drop
+
+    def active(self) -> bool:
+        """Spool instead of sending: .NET is away, or a backlog is pending."""
+        store = self.spool.store
+        if store is None:
+            # Not open yet, or stopped: send as if there were no spool.
+            return False
+        return store.pending > 0 or not self.spool.online(self.service)
+
+    def put(self, message) -> bool:
+        if self.spool.store is not None and self.spool.append(message):
+            return True
+        if self.on_drop is not None:
+            self.on_drop(message)
+        return False
+
+
+class ObserveSpool:
+    """Durable on-disk spool for observe-only traffic .NET cannot take.
+
+    Outboxes with a SpoolTap write messages here instead of sending them
+    while the breaker is open or their channel is not connected, and keep
+    doing so until the backlog is replayed, so .NET still sees every
+    entity's writes in order. A replayer drains the oldest frames at
+    replay_rate messages per second once .NET is back. When the spool
+    reaches max_bytes the sealed segments are compacted to the latest
+    full write per entity; until that frees room new messages are dropped.
+
+    The segment files are opened by async_open(), in the executor; until
+    then, and after stop(), the taps pass everything through.
+    """
+
+    def __init__(
+        self,
+        hass,
+        directory,
+        guard,
+        channels,
+        max_bytes=DEFAULT_MAX_BYTES,
+        segment_size=DEFAULT_SEGMENT_SIZE,
+        replay_rate=DEFAULT_REPLAY_RATE,
+        metrics: Metrics | None = None,
+    ):
+        self.hass = hass
+        self.guard = guard
+        self.channels = channels
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_size = segment_size
+        self.replay_rate = replay_rate
+
+        self.store = None
+        self.metrics = metrics or Metrics()
+        self.metrics.gauges["spool.pending"] = lambda: self.pending
+        self._counters = self.metrics.counters
+
+        self._routes = {}
+        self._taps = []
+        self._task = None
+        self._compacting = None
+        # Sealed segments as last compacted; nothing more to gain there.
+        self._compacted = None
+        # Held by the replayer per batch and by compaction throughout, so
+        # sealed segments never change under a replay in progress.
+        self._lock = asyncio.Lock()
+
+        self.spooled = 0
+        self.replayed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.compactions = 0
+
+    def tap(self, service, send, kinds, on_engage=None, on_drop=None) -> SpoolTap:
+        """SpoolTap for an Outbox; send(message) replays frames of kinds."""
+        for kind in kinds:
+            self._routes[kind] = send
+        tap = SpoolTap(self, service, on_engage, on_drop)
+        self._taps.append(tap)
+        return tap
+
+    async def async_open(self):
+        """Open (or create) the segment files, off the event loop."""
+        store = await self.hass.async_add_executor_job(
+            SegmentStore, self.directory, self.segment_size, self.max_bytes
+        )
+        for name, reason in store.skipped:
+            self.hass.logger.warning(
+                "net_core_bridge: skipping spool segment %s (%s); kept as %s%s.",
+                name,
+                reason,
+                name,
+                BAD_SUFFIX,
+            )
+        self.store = store
+
+    def start(self):
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._replay(), "net_core_bridge spool replay"
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        # Not while a compaction is swapping files.
+        async with self._lock:
+            store, self.store = self.store, None
+            if store is not None:
+                await self.hass.async_add_executor_job(store.close)
+
+    @property
+    def pending(self) -> int:
+        return self.store.pending if self.store is not None else 0
+
+    def diagnostics(self) -> dict:
+        store = self.store
+        return {
+            "open": store is not None,
+            "pending": self.pending,
+            "segments": len(store.segments) if store is not None else 0,
+            "bytes": store.bytes if store is not None else 0,
+            "max_bytes": self.max_bytes,
+            "spooled": self.spooled,
+            "replayed": self.replayed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "compactions": self.compactions,
+        }
+
+    def online(self, service) -> bool:
+        if self.guard.is_open:
+            return False
+        channel = self.channels.channel(service)
+        return channel.get_state() not in _OFFLINE
+
+    # ---------------------------------------------------------
+    # APPEND
+    # ---------------------------------------------------------
+    def append(self, message) -> bool:
+        engaging = self.store.pending == 0
+        payload = message.SerializeToString()
+        if not self.store.append(MESSAGE_KINDS[type(message)], payload):
+            self.dropped += 1
+            self._counters["spool.dropped"] += 1
+            self._compact_soon()
+            return False
+
+        self.spooled += 1
+        self._counters["spool.spooled"] += 1
+        if engaging:
+            self.hass.logger.warning(
+                "net_core_bridge: .NET unavailable; spooling observe traffic to %s.",
+                self.store.directory,
+            )
+            for tap in self._taps:
+                if tap.on_engage is not None:
+                    tap.on_engage()
+        return True
+
+    # ---------------------------------------------------------
+    # COMPACTION
+    # ---------------------------------------------------------
+    def _compact_soon(self):
+        sealed = [(s.path, s.read_offset) for s in self.store.sealed()]
+        if self._compacting is None and sealed and sealed != self._compacted:
+            self._compacting = self.hass.async_create_background_task(
+                self._compact(), "net_core_bridge spool compaction"
+            )
+
+    async def _compact(self):
+        try:
+            async with self._lock:
+                await self._compact_sealed()
+        except Exception as ex:
+            self.hass.logger.error("net_core_bridge: spool compaction failed: %s", ex)
+        finally:
+            self._compacting = None
+
+    async def _compact_sealed(self):
+        sealed = self.store.sealed()
+        before = sum(len(s.frames()) for s in sealed)
+        paths, kept = await self.hass.async_add_executor_job(
+            compact_segments,
+            [(s.path, s.read_offset, s.write_offset) for s in sealed],
+            self.store.segment_size,
+            os.path.join(self.store.directory, COMPACT_PREFIX),
+        )
+        self.store.replace_sealed(sealed, paths, self.store.pending - before + kept)
+        self._compacted = [(s.path, s.read_offset) for s in self.store.sealed()]
+        self.compactions += 1
+        self.hass.logger.info(
+            "net_core_bridge: spool compacted %d → %d frames.", before, kept
+        )
+
+    # ---------------------------------------------------------
+    # REPLAY
+    # ---------------------------------------------------------
+    async def _replay(self):
+        interval = 1 / self.replay_rate if self.replay_rate > 0 else 0
+        while True:
+            # No is_open check: the breaker only half-opens for a caller,
+            # so the replayer is what probes .NET while spooling.
+            if self.store.pending == 0:
+                await asyncio.sleep(REPLAY_POLL)
+                continue
+
+            async with self._lock:
+                done = await self._replay_batch(interval)
+
+            if not done:
+                # .NET went away again mid-replay, or compaction wants in.
+                await asyncio.sleep(REPLAY_POLL)
+            elif self.store.pending == 0:
+                self.hass.logger.info("net_core_bridge: spool replayed.")
+            else:
+                # Unpaced, a batch may never yield; let HA run between them.
+                await asyncio.sleep(0)
+
+    async def _replay_batch(self, interval):
+        """Replay the next frames in order; False if interrupted."""
+        frames = self.store.read(REPLAY_BATCH)
+        if not frames:
+            self.store.pending = 0
+            return True
+
+        next_at = time.monotonic()
+        for offset, kind, payload in frames:
+            if self._compacting is not None:
+                return False
+            try:
+                await self._routes[kind](MESSAGE_TYPES[kind].FromString(payload))
+            except asyncio.CancelledError:
+                raise
+            except CircuitOpenError:
+                return False
+            except grpc.aio.AioRpcError as ex:
+                if ex.code() in _RETRY:
+                    return False
+                self.errors += 1
+                self.hass.logger.error(
+                    "net_core_bridge: spool replay rejected (%s): %s",
+                    ex.code().name,
+                    ex.details(),
+                )
+            except Exception as ex:
+                self.errors += 1
+                self.hass.logger.error("net_core_bridge: spool replay failed: %s", ex)
+
+            self.store.commit(offset)
+            self.replayed += 1
+            self._counters["spool.replayed"] += 1
+
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return True
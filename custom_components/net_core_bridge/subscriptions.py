@@ -0,0 +1,81 @@
+import fnmatch
+import re
+
+WILDCARD = "*"
+
+
+class SubscriptionIndex:
+    """In-process lookup of what .NET asked to see.
+
+    Entries are (key, entity_globs, value) tuples. The key is matched exactly
+    (an event type, a domain, ...) or is "*" for everything; globs are matched
+    against the entity_id. All globs registered under one key are folded into
+    a single compiled regex, so a lookup is one dict hit plus at most one
+    regex match per bucket.
+    """
+
+    def __init__(self, entries=()):
+        buckets = {}
+        for key, globs, value in entries:
+            buckets.setdefault(key or WILDCARD, []).append((tuple(globs), value))
+
+        self._exact = {
+            key: self._compile(rules)
+            for key, rules in buckets.items()
+            if key != WILDCARD
+        }
+        self._wildcard = self._compile(buckets.get(WILDCARD, []))
+        self.size = sum(len(rules) for rules in buckets.values())
+
+    # ---------------------------------------------------------
+    # Helper: Fold the rules of one bucket into a matcher
+    # ---------------------------------------------------------
+    @staticmethod
+    def _compile(rules):
+        """Return (any_entity_value, regex, {group: value}) for one bucket.
+
+        Each rule's globs become one named group of a single alternation;
+        alternatives are tried in order, so the first matching rule wins.
+        """
+        any_entity = None
+        groups = []
+        values = {}
+
+        for globs, value in rules:
+            if not globs:
+                # First unrestricted rule wins, like the first matching glob.
+                if any_entity is None:
+                    any_entity = value
+                continue
+            name = f"r{len(groups)}"
+            alternatives = "|".join(fnmatch.translate(g) for g in globs)
+            groups.append(f"(?P<{name}>{alternatives})")
+            values[name] = value
+
+        regex = re.compile("|".join(groups)) if groups else None
+        return any_entity, regex, values
+
+    @staticmethod
+    def _match(bucket, entity_id):
+        any_entity, regex, values = bucket
+        if entity_id and regex is not None:
+            match = regex.match(entity_id)
+            if match is not None:
+                return values[match.lastgroup]
+        return any_entity
+
+    # ---------------------------------------------------------
+    # Lookup
+    # ---------------------------------------------------------
+    def lookup(self, key, entity_id=""):
+        """Return the value of the first rule matching key/entity_id, or None."""
+        bucket = self._exact.get(key)
+        if bucket is not None:
+            value = self._match(bucket, entity_id)
+            if value is not None:
+                return value
+
+        return self._match(self._wildcard, entity_id)
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,50 @@
+def _fingerprint(state, attrs):
+    """(hash, key) for (state, attributes), or None if an attribute is
+    unhashable."""
+    try:
+        key = (state, frozenset(attrs.items()))
+        return hash(key), key
+    except TypeError:
+        return None
+
+
+class UnchangedFilter:
+    """Remember the last write sent per entity to elide no-op writes.
+
+    Comparison is by hash of (state, attributes), confirmed by equality of
+    the stored key since distinct values can share a hash. Attribute sets
+    holding unhashable values (lists, dicts) fall back to an equality check
+    against a stored copy.
+    """
+
+    def __init__(self):
+        # entity_id -> ((hash, key) or None, state, attributes copy or None)
+        self._last = {}
+
+        self.checked = 0
+        self.elided = 0
+
+    def is_unchanged(self, entity_id, state, attrs) -> bool:
+        self.checked += 1
+
+        last = self._last.get(entity_id)
+        if last is None:
+            return False
+
+        fp = _fingerprint(state, attrs)
+        if fp is not None:
+            prev = last[0]
+            unchanged = prev is not None and fp[0] == prev[0] and fp[1] == prev[1]
+        else:
+            unchanged = last[2] is not None and state == last[1] and attrs == last[2]
+
+        if unchanged:
+            self.elided += 1
+        return unchanged
+
+    def remember(self, entity_id, state, attrs):
+        fp = _fingerprint(state, attrs)
+        self._last[entity_id] = (fp, state, dict(attrs) if fp is None else None)
+
+    def forget(self, entity_id):
+        self._last.pop(entity_id, None)
@@ -0,0 +1 @@
+"""Tests for the net_core_bridge integration."""
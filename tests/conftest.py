@@ -0,0 +1,27 @@
+"""Fixtures for net_core_bridge tests."""
+import asyncio
+import logging
+
+import pytest
+
+
+class FakeHass:
+    """The parts of HomeAssistant the bridge's modules call."""
+
+    def __init__(self):
+        self.logger = logging.getLogger("net_core_bridge.tests")
+        self.data = {}
+
+    def async_create_task(self, coro, name=None):
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+    def async_create_background_task(self, coro, name=None):
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+    def async_add_executor_job(self, target, *args):
+        return asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+@pytest.fixture
+def hass():
+    return FakeHass()
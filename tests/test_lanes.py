@@ -0,0 +1,173 @@
+"""Tests for priority lanes: classification, budgets, queues and deadlines."""
+import asyncio
+
+import pytest
+
+from custom_components.net_core_bridge.lanes import (
+    DEFAULT_LANE,
+    Lane,
+    LaneFull,
+    LaneTimeout,
+    PriorityLanes,
+)
+
+
+def test_from_config_classifies():
+    lanes = PriorityLanes.from_config(
+        {
+            "lanes": {
+                "critical": {
+                    "priority": 0,
+                    "event_types": ["call_service"],
+                    "domains": ["lock"],
+                },
+                "bulk": {"priority": 200, "domains": ["sensor"]},
+            },
+            "max_in_flight": 4,
+        }
+    )
+    assert [lane.name for lane in lanes.by_priority] == [
+        "critical",
+        DEFAULT_LANE,
+        "bulk",
+    ]
+    assert lanes.max_in_flight == 4
+    assert lanes.for_event("call_service", "").name == "critical"
+    assert lanes.for_event("state_changed", "lock.front").name == "critical"
+    assert lanes.for_event("state_changed", "sensor.t").name == "bulk"
+    assert lanes.for_event("state_changed", "").name == DEFAULT_LANE
+    assert lanes.for_entity("sensor.t").name == "bulk"
+    assert lanes.for_entity("light.x").name == DEFAULT_LANE
+
+
+def test_higher_priority_starts_first():
+    async def scenario():
+        critical = Lane("critical", priority=0, concurrency=1)
+        bulk = Lane("bulk", priority=200, concurrency=1)
+        lanes = PriorityLanes([critical, bulk], max_in_flight=1)
+        order = []
+        gate = asyncio.Event()
+
+        async def call(name):
+            order.append(name)
+            await gate.wait()
+
+        first = asyncio.ensure_future(lanes.run(bulk, lambda: call("bulk-1")))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.ensure_future(lanes.run(bulk, lambda: call("bulk-2"))),
+            asyncio.ensure_future(lanes.run(critical, lambda: call("critical"))),
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *queued)
+        return order, lanes
+
+    order, lanes = asyncio.run(scenario())
+    assert order == ["bulk-1", "critical", "bulk-2"]
+    assert lanes.active == 0
+    assert all(lane.active == 0 for lane in lanes.lanes.values())
+
+
+def test_full_queue_is_shed():
+    async def scenario():
+        lane = Lane("bulk", concurrency=1, queue=1)
+        lanes = PriorityLanes([lane])
+        gate = asyncio.Event()
+
+        running = asyncio.ensure_future(lanes.run(lane, gate.wait))
+        await asyncio.sleep(0)
+        waiting = asyncio.ensure_future(lanes.run(lane, gate.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(LaneFull):
+            await lanes.run(lane, gate.wait)
+        gate.set()
+        await asyncio.gather(running, waiting)
+        return lane, lanes
+
+    lane, lanes = asyncio.run(scenario())
+    assert lane.rejected == 1
+    assert lane.completed == 2
+    assert lanes.active == 0
+
+
+def test_deadline_while_queued():
+    async def scenario():
+        lane = Lane("bulk", deadline=0.02)
+        holder = Lane("holder", deadline=5.0)
+        # The only slot goes to holder's call, which outlives bulk's deadline.
+        lanes = PriorityLanes([lane, holder], max_in_flight=1)
+        gate = asyncio.Event()
+
+        running = asyncio.ensure_future(lanes.run(holder, gate.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(LaneTimeout):
+            await lanes.run(lane, gate.wait)
+        assert not lane.waiting
+        # The timed-out call neither ran nor holds a slot.
+        assert lane.active == 0
+        assert lanes.active == 1
+        running.cancel()
+        await asyncio.gather(running, return_exceptions=True)
+        return lane, lanes
+
+    lane, lanes = asyncio.run(scenario())
+    assert lane.timeouts == 1
+    assert lanes.active == 0
+
+
+def test_deadline_covers_the_call():
+    async def scenario():
+        lane = Lane("slow", deadline=0.02)
+        lanes = PriorityLanes([lane])
+        with pytest.raises(LaneTimeout):
+            await lanes.run(lane, lambda: asyncio.sleep(1))
+        return lane, lanes
+
+    lane, lanes = asyncio.run(scenario())
+    assert lane.timeouts == 1
+    assert lane.active == lanes.active == 0
+
+
+def test_timeout_from_the_call_is_not_a_lane_timeout():
+    async def scenario():
+        lane = Lane("rpc", deadline=5.0)
+        lanes = PriorityLanes([lane])
+
+        async def call():
+            raise asyncio.TimeoutError("rpc deadline")
+
+        with pytest.raises(asyncio.TimeoutError) as info:
+            await lanes.run(lane, call)
+        assert not isinstance(info.value, LaneTimeout)
+        return lane, lanes
+
+    lane, lanes = asyncio.run(scenario())
+    assert lane.timeouts == 0
+    assert lane.active == lanes.active == 0
+
+
+def test_max_in_flight_spans_lanes():
+    async def scenario():
+        a = Lane("a", concurrency=5)
+        b = Lane("b", concurrency=5)
+        lanes = PriorityLanes([a, b], max_in_flight=2)
+        peak = 0
+        gate = asyncio.Event()
+
+        async def call():
+            nonlocal peak
+            peak = max(peak, lanes.active)
+            await gate.wait()
+
+        tasks = [
+            asyncio.ensure_future(lanes.run(lane, call)) for lane in (a, b, a, b)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+        return peak, lanes
+
+    peak, lanes = asyncio.run(scenario())
+    assert peak == 2
+    assert lanes.active == 0
@@ -0,0 +1,206 @@
+"""Tests for the observe outbox and its overflow policies."""
+import asyncio
+
+import pytest
+
+from custom_components.net_core_bridge.metrics import Metrics
+from custom_components.net_core_bridge.outbox import (
+    BLOCK,
+    COALESCE,
+    DROP_NEWEST,
+    DROP_OLDEST,
+    Outbox,
+)
+from custom_components.net_core_bridge.rpc_guard import CircuitOpenError
+
+
+def _key(message):
+    return message[0]
+
+
+def _queued(outbox):
+    return [message for _, message in outbox._queue]
+
+
+def test_drop_newest(hass):
+    outbox = Outbox(hass, "test", None, maxsize=2, policy=DROP_NEWEST)
+    assert outbox.put(1)
+    assert outbox.put(2)
+    assert not outbox.put(3)
+    assert _queued(outbox) == [1, 2]
+    assert outbox.dropped == 1
+    assert outbox.high_water == 2
+
+
+def test_drop_oldest_evicts(hass):
+    evicted = []
+    outbox = Outbox(
+        hass, "test", None, maxsize=2, policy=DROP_OLDEST, on_evict=evicted.append
+    )
+    for message in (1, 2, 3):
+        assert outbox.put(message)
+    assert _queued(outbox) == [2, 3]
+    assert evicted == [1]
+    assert outbox.evicted == outbox.dropped == 1
+
+
+def test_coalesce_replaces_in_place(hass):
+    outbox = Outbox(
+        hass,
+        "test",
+        None,
+        maxsize=2,
+        policy=COALESCE,
+        key=_key,
+        on_replace=lambda m: (m[0], m[1], "replaced"),
+    )
+    outbox.put(("a", 1))
+    outbox.put(("b", 1))
+    outbox.put(("a", 2))
+    assert _queued(outbox) == [("a", 2, "replaced"), ("b", 1)]
+    assert outbox.coalesced == 1
+
+    # A new key under a full queue falls back to drop_newest.
+    assert not outbox.put(("c", 1))
+    assert outbox.dropped == 1
+
+
+def test_block_waits_for_room(hass):
+    async def scenario():
+        sent = []
+        release = asyncio.Event()
+
+        async def send(message):
+            await release.wait()
+            sent.append(message)
+
+        outbox = Outbox(hass, "test", send, maxsize=1, policy=BLOCK)
+        outbox.configure(block_timeout=1.0)
+        outbox.start()
+        outbox.put(1)
+        await asyncio.sleep(0)  # worker takes 1 and waits on send
+        outbox.put(2)
+
+        waiter = asyncio.ensure_future(outbox.put_wait(3))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        release.set()
+        assert await waiter
+        await asyncio.sleep(0.05)
+        await outbox.stop()
+        return sent, outbox
+
+    sent, outbox = asyncio.run(scenario())
+    assert sent == [1, 2, 3]
+    assert outbox.blocked == 1
+    assert outbox.dropped == 0
+
+
+def test_block_times_out(hass):
+    async def scenario():
+        outbox = Outbox(hass, "test", None, maxsize=1, policy=BLOCK)
+        outbox.configure(block_timeout=0.01)
+        outbox.put(1)
+        return await outbox.put_wait(2), outbox
+
+    accepted, outbox = asyncio.run(scenario())
+    assert not accepted
+    assert outbox.blocked == outbox.dropped == 1
+
+
+def test_configure_rejects_unknown_policy(hass):
+    outbox = Outbox(hass, "test", None)
+    with pytest.raises(ValueError):
+        outbox.configure(policy="drop_everything")
+    outbox.configure(maxsize=0, policy=DROP_OLDEST)
+    assert outbox.maxsize == 1
+    assert outbox.policy == DROP_OLDEST
+
+
+def test_worker_sends_in_order_and_counts_errors(hass):
+    async def scenario():
+        sent = []
+
+        async def send(message):
+            if message == "open":
+                raise CircuitOpenError()
+            if message == "boom":
+                raise RuntimeError(message)
+            sent.append(message)
+
+        metrics = Metrics()
+        outbox = Outbox(hass, "test", send, metrics=metrics, label="test")
+        outbox.start()
+        for message in (1, "open", 2, "boom", 3):
+            outbox.put(message)
+        await asyncio.sleep(0.05)
+        await outbox.stop()
+        return sent, outbox, metrics
+
+    sent, outbox, metrics = asyncio.run(scenario())
+    assert sent == [1, 2, 3]
+    assert (outbox.sent, outbox.rejected, outbox.errors) == (3, 1, 1)
+    assert metrics.gauges["outbox.test.depth"]() == 0
+
+
+def test_idle_only_once_the_last_message_is_sent(hass):
+    async def scenario():
+        release = asyncio.Event()
+        outbox = Outbox(hass, "test", lambda message: release.wait())
+        assert outbox.idle
+        outbox.start()
+        outbox.put(1)
+        assert not outbox.idle
+        await asyncio.sleep(0.01)
+        busy = (outbox.depth, outbox.idle)  # dequeued, still sending
+        release.set()
+        await asyncio.sleep(0.01)
+        idle = outbox.idle
+        await outbox.stop()
+        return busy, idle
+
+    busy, idle = asyncio.run(scenario())
+    assert busy == (0, False)
+    assert idle
+
+
+class _Tap:
+    def __init__(self, active):
+        self.is_active = active
+        self.spooled = []
+
+    def active(self):
+        return self.is_active
+
+    def put(self, message):
+        self.spooled.append(message)
+        return True
+
+
+def test_spool_takes_messages_while_active(hass):
+    async def scenario():
+        sent = []
+
+        async def send(message):
+            if message == "down":
+                raise CircuitOpenError()
+            sent.append(message)
+
+        outbox = Outbox(hass, "test", send)
+        outbox.spool = tap = _Tap(active=True)
+        outbox.start()
+        outbox.put(1)
+        await asyncio.sleep(0.01)
+        tap.is_active = False
+        outbox.put("down")
+        outbox.put(2)
+        await asyncio.sleep(0.01)
+        await outbox.stop()
+        return sent, tap, outbox
+
+    sent, tap, outbox = asyncio.run(scenario())
+    assert tap.spooled == [1, "down"]
+    assert sent == [2]
+    assert outbox.spooled == 2
+    assert outbox.rejected == 0
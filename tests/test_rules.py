@@ -0,0 +1,173 @@
+"""Tests for the in-process rule engine."""
+import datetime as dt
+
+from custom_components.net_core_bridge.clients.payload_pb2 import (
+    Value,
+    ValueList,
+    ValueMap,
+)
+from custom_components.net_core_bridge.clients.rules_pb2 import (
+    ALLOW,
+    ASK,
+    EQ,
+    EVENT,
+    GT,
+    IN,
+    MISSING,
+    OVERRIDE,
+    STATE_WRITE,
+    VETO,
+    Condition,
+    Rule,
+    RuleAction,
+    RuleSet,
+    TimeWindow,
+)
+from custom_components.net_core_bridge.rules import RuleEngine
+
+
+def _engine(*rules, now=dt.datetime.now):
+    return RuleEngine(RuleSet(rules=rules), now)
+
+
+def test_veto_on_condition():
+    engine = _engine(
+        Rule(
+            id="bright",
+            target=STATE_WRITE,
+            entity_globs=["light.kids_room"],
+            conditions=[
+                Condition(
+                    field="attributes.brightness", op=GT, value=Value(int_value=200)
+                )
+            ],
+            action=RuleAction(decision=VETO),
+        )
+    )
+    resp, attributes = engine.evaluate_state(
+        "light.kids_room", "on", {"brightness": 250}
+    )
+    assert resp.handled
+    assert attributes is None
+    # HA's string values are coerced for numeric comparisons.
+    assert engine.evaluate_state("light.kids_room", "on", {"brightness": "100"}) is None
+    # Not comparable: the rule does not hold.
+    assert engine.evaluate_state("light.kids_room", "on", {"brightness": "x"}) is None
+    assert engine.evaluate_state("light.hall", "on", {"brightness": 250}) is None
+    assert engine.hits["bright"] == 1
+
+
+def test_override_keeps_untouched_attributes():
+    engine = _engine(
+        Rule(
+            id="unit",
+            target=STATE_WRITE,
+            key="sensor",
+            entity_globs=["sensor.t*"],
+            conditions=[Condition(field="attributes.unit", op=MISSING)],
+            action=RuleAction(
+                decision=OVERRIDE,
+                override_state="unknown",
+                set_attributes=ValueMap(fields={"unit": Value(string_value="C")}),
+            ),
+        )
+    )
+    day = dt.date(2024, 1, 1)
+    members = ("a", "b")
+    attrs = {"day": day, "members": members}
+
+    resp, attributes = engine.evaluate_state("sensor.temp", "5", attrs)
+    assert resp.override_state == "unknown"
+    assert not resp.HasField("override_attributes")
+    assert attributes == {"day": day, "members": members, "unit": "C"}
+    assert attributes["day"] is day
+    assert attributes["members"] is members
+    assert attrs == {"day": day, "members": members}
+
+    assert engine.evaluate_state("sensor.temp", "5", {"unit": "F"}) is None
+    assert engine.evaluate_state("switch.temp", "5", {}) is None
+
+
+def test_first_matching_rule_wins():
+    engine = _engine(
+        Rule(
+            id="ask",
+            target=STATE_WRITE,
+            conditions=[
+                Condition(
+                    field="state",
+                    op=IN,
+                    value=Value(
+                        list_value=ValueList(values=[Value(string_value="unavailable")])
+                    ),
+                )
+            ],
+            action=RuleAction(decision=ASK),
+        ),
+        Rule(id="switch", target=STATE_WRITE, key="switch", action=RuleAction()),
+    )
+    assert engine.evaluate_state("switch.a", "unavailable", {}) is None
+    resp, _ = engine.evaluate_state("switch.a", "on", {})
+    assert not resp.handled
+    assert dict(engine.hits) == {"ask": 1, "switch": 1}
+    assert len(engine) == 2
+
+
+def test_time_window():
+    clock = dt.datetime(2024, 1, 1, 23)
+    engine = _engine(
+        Rule(
+            id="night",
+            target=STATE_WRITE,
+            key="light",
+            # 22:00 - 06:00, across midnight
+            time_window=TimeWindow(start_minute=22 * 60, end_minute=6 * 60),
+            action=RuleAction(decision=VETO),
+        ),
+        now=lambda: clock,
+    )
+
+    def at(hour):
+        nonlocal clock
+        clock = dt.datetime(2024, 1, 1, hour)
+        return engine.evaluate_state("light.hall", "on", {})
+
+    assert at(23)[0].handled
+    assert at(3)[0].handled
+    assert at(12) is None
+
+
+def test_events():
+    engine = _engine(
+        Rule(
+            id="locks",
+            target=EVENT,
+            key="call_service",
+            conditions=[
+                Condition(
+                    field="data.domain", op=EQ, value=Value(string_value="lock")
+                )
+            ],
+            action=RuleAction(decision=VETO),
+        ),
+        Rule(
+            id="kids",
+            target=EVENT,
+            entity_globs=["light.kids_*"],
+            action=RuleAction(decision=ALLOW),
+        ),
+        Rule(
+            id="override",
+            target=EVENT,
+            key="other",
+            action=RuleAction(decision=OVERRIDE),
+        ),
+    )
+    assert engine.evaluate_event("call_service", "", {"domain": "lock"}).handled
+    assert engine.evaluate_event("call_service", "", {"domain": "light"}) is None
+    assert not engine.evaluate_event("state_changed", "light.kids_room", {}).handled
+    assert engine.evaluate_event("state_changed", "light.hall", {}) is None
+    # OVERRIDE has no meaning for events: ask .NET.
+    assert engine.evaluate_event("other", "", {}) is None
+    # Event rules never apply to state writes.
+    assert engine.evaluate_state("light.kids_room", "on", {}) is None
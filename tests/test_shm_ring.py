@@ -0,0 +1,188 @@
+"""Tests for the shared-memory ring writer."""
+import socket
+import struct
+
+import pytest
+
+from custom_components.net_core_bridge.clients.event_interceptor_pb2 import (
+    EventMessage,
+)
+from custom_components.net_core_bridge.shm_ring import (
+    DATA_OFFSET,
+    HEAD_OFFSET,
+    KIND_EVENT,
+    KIND_WRAP,
+    RECORD_HEADER,
+    TAIL_OFFSET,
+    WAITING_OFFSET,
+    ShmObserveSink,
+    ShmRingWriter,
+    create_ring,
+)
+
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+class Reader:
+    """The .NET side, as far as these tests need it."""
+
+    def __init__(self, path, capacity):
+        self.mm = create_ring(path, capacity)
+        self.capacity = _U64.unpack_from(self.mm, 8)[0]
+        self.tail = 0
+        self.wraps = 0
+
+    def drain(self):
+        out = []
+        head = _U64.unpack_from(self.mm, HEAD_OFFSET)[0]
+        while self.tail < head:
+            offset = self.tail % self.capacity
+            length, kind, _ = RECORD_HEADER.unpack_from(self.mm, DATA_OFFSET + offset)
+            if kind == KIND_WRAP:
+                self.wraps += 1
+                self.tail += self.capacity - offset
+                continue
+            body = DATA_OFFSET + offset + RECORD_HEADER.size
+            out.append((kind, self.mm[body : body + length]))
+            self.tail += (RECORD_HEADER.size + length + 7) & ~7
+        _U64.pack_into(self.mm, TAIL_OFFSET, self.tail)
+        return out
+
+
+@pytest.fixture
+def ring(tmp_path):
+    reader = Reader(str(tmp_path / "ring"), 256)
+    writer = ShmRingWriter(str(tmp_path / "ring"), str(tmp_path / "bell"))
+    yield reader, writer
+    writer.close()
+    reader.mm.close()
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "ring"
+    path.write_bytes(b"\0" * 512)
+    with pytest.raises(ValueError):
+        ShmRingWriter(str(path), str(tmp_path / "bell"))
+
+
+def test_round_trip_across_wraparound(ring):
+    reader, writer = ring
+    received = []
+    for i in range(200):
+        payload = f"record-{i}".encode() * (1 + i % 3)
+        assert writer.write(KIND_EVENT, payload)
+        if i % 5 == 4:
+            received.extend(reader.drain())
+    received.extend(reader.drain())
+
+    assert [payload for _, payload in received] == [
+        f"record-{i}".encode() * (1 + i % 3) for i in range(200)
+    ]
+    assert {kind for kind, _ in received} == {KIND_EVENT}
+    assert reader.wraps > 0
+    assert writer.depth == 0
+    assert writer.written == 200
+
+
+def test_full_ring_refuses_without_overwriting(ring):
+    reader, writer = ring
+    payload = b"x" * 56  # 64-byte records: four fill the ring
+    for _ in range(4):
+        assert writer.write(KIND_EVENT, payload)
+    assert not writer.write(KIND_EVENT, payload)
+    assert not writer.write(KIND_EVENT, b"y" * 1024)
+    assert writer.full == 2
+
+    assert len(reader.drain()) == 4
+    assert writer.write(KIND_EVENT, payload)
+
+
+def test_doorbell_only_when_reader_waits(ring, tmp_path):
+    reader, writer = ring
+    bell = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    bell.bind(str(tmp_path / "bell"))
+    bell.setblocking(False)
+    try:
+        writer.write(KIND_EVENT, b"a")
+        assert writer.doorbells == 0
+
+        _U32.pack_into(reader.mm, WAITING_OFFSET, 1)
+        writer.write(KIND_EVENT, b"b")
+        assert writer.doorbells == 1
+        assert bell.recv(8) == b"\x01"
+        # The writer clears the flag; the next write does not ring again.
+        assert _U32.unpack_from(reader.mm, WAITING_OFFSET)[0] == 0
+        writer.write(KIND_EVENT, b"c")
+        assert writer.doorbells == 1
+    finally:
+        bell.close()
+
+
+def test_gone_reader_closes_ring(ring):
+    reader, writer = ring
+    _U32.pack_into(reader.mm, WAITING_OFFSET, 1)
+    writer.write(KIND_EVENT, b"a")  # nobody bound to the doorbell
+    assert writer.closed
+    assert writer.depth == 0
+
+
+class Fallback:
+    def __init__(self):
+        self.messages = []
+
+    def put(self, message):
+        self.messages.append(message)
+        return True
+
+
+def test_sink_falls_back_once_closed(ring):
+    reader, writer = ring
+    fallback = Fallback()
+    sink = ShmObserveSink(writer, fallback)
+    evt = EventMessage(event_type="ping")
+    assert sink.put(evt)
+    [(kind, payload)] = reader.drain()
+    assert kind == KIND_EVENT
+    assert EventMessage.FromString(payload) == evt
+
+    writer.close()
+    assert sink.put(evt)
+    assert fallback.messages == [evt]
+
+
+def test_sink_sends_what_does_not_fit_to_fallback(ring):
+    reader, writer = ring
+    fallback = Fallback()
+    sink = ShmObserveSink(writer, fallback)
+    evt = EventMessage(event_type="x" * 40)
+    for _ in range(6):
+        assert sink.put(evt)
+
+    assert len(reader.drain()) == 4
+    assert fallback.messages == [evt, evt]
+    assert not writer.closed
+
+
+def test_check_closes_a_stalled_ring(ring, tmp_path):
+    reader, writer = ring
+    bell = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    bell.bind(str(tmp_path / "bell"))
+    bell.setblocking(False)
+    try:
+        assert writer.check(now=0.0)  # empty ring: nothing to wait for
+        writer.write(KIND_EVENT, b"a")
+        assert writer.check(now=1.0)
+        assert writer.check(now=5.0)
+        assert writer.nudges == 2
+        assert bell.recv(8) == b"\x01"  # re-rung for a missed wake-up
+
+        reader.drain()  # progress resets the clock
+        writer.write(KIND_EVENT, b"b")
+        assert writer.check(now=12.0)
+        assert writer.check(now=21.0)
+        assert not writer.check(now=22.0)
+        assert writer.stalled
+        assert writer.closed
+    finally:
+        bell.close()
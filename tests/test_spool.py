@@ -0,0 +1,287 @@
+"""Tests for the on-disk observe spool."""
+import asyncio
+
+import grpc
+import pytest
+
+from custom_components.net_core_bridge import spool as spool_module
+from custom_components.net_core_bridge.clients.event_interceptor_pb2 import (
+    EventMessage,
+)
+from custom_components.net_core_bridge.clients.state_interceptor_pb2 import (
+    StateWriteBatch,
+    StateWriteRequest,
+)
+from custom_components.net_core_bridge.rpc_guard import CircuitOpenError
+from custom_components.net_core_bridge.shm_ring import (
+    KIND_EVENT,
+    KIND_STATE_WRITE,
+    KIND_STATE_WRITE_BATCH,
+)
+from custom_components.net_core_bridge.spool import (
+    HEADER_SIZE,
+    ObserveSpool,
+    Segment,
+    SegmentStore,
+    compact_segments,
+)
+
+SEGMENT = 4096
+
+
+def _write(entity_id, state, delta=False):
+    return StateWriteRequest(entity_id=entity_id, state=state, attributes_delta=delta)
+
+
+def _frames(store):
+    return [frame for segment in store.segments for frame in segment.frames()]
+
+
+def test_segment_rejects_foreign_file(tmp_path):
+    path = tmp_path / "0000000000.seg"
+    path.write_bytes(b"\0" * SEGMENT)
+    with pytest.raises(ValueError):
+        Segment(str(path))
+
+
+def test_store_sets_aside_unreadable_segments(tmp_path):
+    store = SegmentStore(str(tmp_path), SEGMENT, 8 * SEGMENT)
+    store.append(KIND_STATE_WRITE, b"kept")
+    store.close()
+    (tmp_path / "0000000007.seg").write_bytes(b"\0" * 10)
+    (tmp_path / "0000000008.seg").write_bytes(b"\0" * SEGMENT)
+    (tmp_path / "compact-0.tmp").write_bytes(b"\0" * SEGMENT)
+
+    store = SegmentStore(str(tmp_path), SEGMENT, 8 * SEGMENT)
+    assert [name for name, _ in store.skipped] == ["0000000007.seg", "0000000008.seg"]
+    assert [payload for _, _, payload in _frames(store)] == [b"kept"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "0000000000.seg",
+        "0000000007.seg.bad",
+        "0000000008.seg.bad",
+    ]
+    store.close()
+
+
+def test_store_rotates_and_reopens(tmp_path):
+    store = SegmentStore(str(tmp_path), SEGMENT, 8 * SEGMENT)
+    payloads = [f"payload-{i}".encode() * 20 for i in range(40)]
+    for payload in payloads:
+        assert store.append(KIND_STATE_WRITE, payload)
+    assert len(store.segments) > 1
+    assert store.pending == 40
+
+    # Replay the first three frames, then "restart".
+    for offset, _, _ in store.read(3):
+        store.commit(offset)
+    store.close()
+
+    store = SegmentStore(str(tmp_path), SEGMENT, 8 * SEGMENT)
+    assert store.pending == 37
+    assert [payload for _, _, payload in _frames(store)] == payloads[3:]
+    store.close()
+
+
+def test_store_drops_drained_segments(tmp_path):
+    store = SegmentStore(str(tmp_path), SEGMENT, 8 * SEGMENT)
+    while len(store.segments) < 3:
+        store.append(KIND_STATE_WRITE, b"x" * 500)
+    while store.pending:
+        for offset, _, _ in store.read(10):
+            store.commit(offset)
+    # Drained segments go on the next read; the last one stays for appends.
+    assert store.read(10) == []
+    assert len(store.segments) == 1
+    assert len(list(tmp_path.glob("*.seg"))) == 1
+    store.close()
+
+
+def test_store_respects_max_bytes(tmp_path):
+    store = SegmentStore(str(tmp_path), SEGMENT, 2 * SEGMENT)
+    accepted = sum(store.append(KIND_STATE_WRITE, b"x" * 500) for _ in range(50))
+    assert accepted < 50
+    assert store.pending == accepted
+    assert store.bytes <= 2 * SEGMENT
+    # Larger than a segment can ever hold.
+    assert not store.append(KIND_STATE_WRITE, b"x" * (SEGMENT - HEADER_SIZE))
+    store.close()
+
+
+def test_compaction_keeps_latest_full_write(tmp_path):
+    store = SegmentStore(str(tmp_path), SEGMENT, 8 * SEGMENT)
+    messages = [
+        _write("light.a", "1"),
+        _write("light.a", "2", delta=True),
+        EventMessage(event_type="ping"),
+        _write("light.b", "1"),
+        _write("light.a", "3"),
+        _write("light.a", "4", delta=True),
+        StateWriteBatch(writes=[_write("light.b", "2"), _write("light.c", "1")]),
+    ]
+    for message in messages:
+        kind = {
+            StateWriteRequest: KIND_STATE_WRITE,
+            StateWriteBatch: KIND_STATE_WRITE_BATCH,
+            EventMessage: KIND_EVENT,
+        }[type(message)]
+        store.append(kind, message.SerializeToString())
+    segment = store.segments[0]
+
+    paths, kept = compact_segments(
+        [(segment.path, segment.read_offset, segment.write_offset)],
+        SEGMENT,
+        str(tmp_path / "compact-"),
+    )
+    store.close()
+
+    compacted = Segment(paths[0])
+    frames = compacted.frames()
+    compacted.close()
+    assert kept == len(frames) == 4
+
+    assert [kind for _, kind, _ in frames] == [
+        KIND_EVENT,
+        KIND_STATE_WRITE,
+        KIND_STATE_WRITE,
+        KIND_STATE_WRITE_BATCH,
+    ]
+    writes = [StateWriteRequest.FromString(payload) for _, _, payload in frames[1:3]]
+    # light.a from its last full write on; light.b's first write is superseded.
+    assert [(w.entity_id, w.state) for w in writes] == [
+        ("light.a", "3"),
+        ("light.a", "4"),
+    ]
+    batch = StateWriteBatch.FromString(frames[3][2])
+    assert [(w.entity_id, w.state) for w in batch.writes] == [
+        ("light.b", "2"),
+        ("light.c", "1"),
+    ]
+
+
+class Guard:
+    is_open = False
+
+
+class Channels:
+    state = grpc.ChannelConnectivity.READY
+
+    def channel(self, service):
+        return self
+
+    def get_state(self):
+        return self.state
+
+
+def test_spools_while_down_and_replays_in_order(hass, tmp_path, monkeypatch):
+    monkeypatch.setattr(spool_module, "REPLAY_POLL", 0.01)
+
+    async def scenario():
+        sent = []
+        down = True
+        engaged = []
+
+        async def send(message):
+            if down:
+                raise CircuitOpenError()
+            sent.append(message.state)
+
+        guard, channels = Guard(), Channels()
+        spool = ObserveSpool(
+            hass, str(tmp_path), guard, channels, replay_rate=0, segment_size=SEGMENT
+        )
+        tap = spool.tap(
+            "state",
+            send,
+            (KIND_STATE_WRITE,),
+            on_engage=lambda: engaged.append(True),
+        )
+
+        # Not open yet: everything passes through.
+        channels.state = grpc.ChannelConnectivity.TRANSIENT_FAILURE
+        assert not tap.active()
+        await spool.async_open()
+
+        channels.state = grpc.ChannelConnectivity.READY
+        assert not tap.active()
+        channels.state = grpc.ChannelConnectivity.TRANSIENT_FAILURE
+        assert tap.active()
+        for i in range(100):
+            assert tap.put(_write("sensor.s", str(i)))
+        assert engaged == [True]
+
+        # Back online, but the backlog keeps new messages on disk.
+        channels.state = grpc.ChannelConnectivity.READY
+        assert tap.active()
+        tap.put(_write("sensor.s", "100"))
+
+        down = False
+        spool.start()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if not spool.pending:
+                break
+        await spool.stop()
+        return sent, spool, tap
+
+    sent, spool, tap = asyncio.run(scenario())
+    assert sent == [str(i) for i in range(101)]
+    assert spool.replayed == 101
+    assert not tap.active()
+
+
+def test_replay_backs_off_while_breaker_open(hass, tmp_path, monkeypatch):
+    monkeypatch.setattr(spool_module, "REPLAY_POLL", 0.01)
+
+    async def scenario():
+        attempts = 0
+
+        async def send(message):
+            nonlocal attempts
+            attempts += 1
+            raise CircuitOpenError()
+
+        spool = ObserveSpool(hass, str(tmp_path), Guard(), Channels())
+        await spool.async_open()
+        spool.tap("state", send, (KIND_STATE_WRITE,))
+        spool.append(_write("sensor.s", "1"))
+        spool.start()
+        await asyncio.sleep(0.05)
+        pending = spool.pending
+        await spool.stop()
+        return attempts, pending, spool
+
+    attempts, pending, spool = asyncio.run(scenario())
+    assert attempts >= 1
+    assert pending == 1
+    assert spool.replayed == 0
+
+
+@pytest.mark.parametrize(
+    "code, kept",
+    [
+        (grpc.StatusCode.UNAVAILABLE, True),
+        (grpc.StatusCode.DEADLINE_EXCEEDED, True),
+        (grpc.StatusCode.RESOURCE_EXHAUSTED, True),
+        (grpc.StatusCode.INVALID_ARGUMENT, False),
+    ],
+)
+def test_replay_keeps_frames_on_transient_errors(hass, tmp_path, code, kept):
+    async def scenario():
+        async def send(message):
+            raise grpc.aio.AioRpcError(
+                code, grpc.aio.Metadata(), grpc.aio.Metadata(), "test"
+            )
+
+        spool = ObserveSpool(hass, str(tmp_path), Guard(), Channels())
+        await spool.async_open()
+        spool.tap("state", send, (KIND_STATE_WRITE,))
+        spool.append(_write("sensor.s", "1"))
+        done = await spool._replay_batch(0)
+        pending = spool.pending
+        await spool.stop()
+        return done, pending, spool
+
+    done, pending, spool = asyncio.run(scenario())
+    assert done is not kept
+    assert pending == (1 if kept else 0)
+    assert spool.errors == (0 if kept else 1)
@@ -0,0 +1,29 @@
+from custom_components.net_core_bridge.subscriptions import SubscriptionIndex
+
+
+def test_first_matching_rule_wins():
+    index = SubscriptionIndex(
+        [
+            ("light", ["light.kitchen*"], "kitchen"),
+            ("light", ["light.*", "switch.x"], "lights"),
+            ("light", [], "any"),
+        ]
+    )
+    assert index.lookup("light", "light.kitchen_1") == "kitchen"
+    assert index.lookup("light", "light.hall") == "lights"
+    assert index.lookup("light", "switch.x") == "lights"
+    assert index.lookup("light", "switch.y") == "any"
+    assert index.lookup("light") == "any"
+
+
+def test_wildcard_key_is_the_fallback():
+    index = SubscriptionIndex(
+        [
+            ("state_changed", ["sensor.a"], "exact"),
+            ("*", ["sensor.?emp"], "wild"),
+        ]
+    )
+    assert index.lookup("state_changed", "sensor.a") == "exact"
+    assert index.lookup("state_changed", "sensor.temp") == "wild"
+    assert index.lookup("other", "sensor.temps") is None
+    assert len(index) == 2
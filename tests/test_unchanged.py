@@ -0,0 +1,37 @@
+from custom_components.net_core_bridge.unchanged import UnchangedFilter
+
+
+def test_repeat_write_is_elided():
+    f = UnchangedFilter()
+    assert not f.is_unchanged("sensor.a", "1", {"unit": "C"})
+    f.remember("sensor.a", "1", {"unit": "C"})
+
+    assert f.is_unchanged("sensor.a", "1", {"unit": "C"})
+    assert not f.is_unchanged("sensor.a", "2", {"unit": "C"})
+    assert not f.is_unchanged("sensor.a", "1", {"unit": "F"})
+    assert f.elided == 1
+
+
+def test_hash_collision_is_not_elided():
+    # hash(-1) == hash(-2) in CPython.
+    assert hash(-1) == hash(-2)
+    f = UnchangedFilter()
+    f.remember("sensor.a", -1, {})
+    assert not f.is_unchanged("sensor.a", -2, {})
+
+    f.remember("sensor.b", "on", {"level": -1})
+    assert not f.is_unchanged("sensor.b", "on", {"level": -2})
+
+
+def test_unhashable_attributes_compare_by_value():
+    f = UnchangedFilter()
+    f.remember("sensor.a", "1", {"items": [1, 2]})
+    assert f.is_unchanged("sensor.a", "1", {"items": [1, 2]})
+    assert not f.is_unchanged("sensor.a", "1", {"items": [1, 3]})
+
+
+def test_forget():
+    f = UnchangedFilter()
+    f.remember("sensor.a", "1", {})
+    f.forget("sensor.a")
+    assert not f.is_unchanged("sensor.a", "1", {})